@@ -1,16 +1,27 @@
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
+import copy
+from dataclasses import dataclass, field
 import os
 from pathlib import Path
 import platform
 import shutil
 import subprocess
-from typing import Optional
+import tempfile
+import threading
+import time
+from typing import Any, Iterable, Iterator, Mapping, Optional
 import warnings
 
 from addict import Dict
+import numpy
 
 from cadet.h5 import H5
-from cadet.runner import CadetRunnerBase, CadetCLIRunner, ReturnInformation
-from cadet.cadet_dll import CadetDLLRunner
+from cadet.runner import (
+    CadetRunnerBase, CadetCLIRunner, ReturnInformation, time_phase, track_memory
+)
+from cadet.cadet_dll import CadetDLLRunner, ResultHandle, SimulationStep
+from cadet.cadet_worker import CadetWorkerRunner
 
 
 def is_dll(path: os.PathLike) -> bool:
@@ -138,6 +149,107 @@ def resolve_cadet_paths(
     return root_path, cadet_cli_path, cadet_dll_path, cadet_create_lwe_path
 
 
+# Keys of the model input that define the layout of the state vector
+_STRUCTURE_KEYS = frozenset({
+    'nunits', 'unit_type', 'ncomp', 'nbound', 'npartype', 'par_type_volfrac',
+    'ncol', 'nrad', 'npar', 'nelem', 'polydeg', 'par_nelem', 'par_polydeg',
+    'spatial_method', 'par_spatial_method', 'par_disc_type', 'par_geom',
+    'adsorption_model', 'reaction_model', 'nports', 'nparticletypes',
+})
+
+# Marker for input values that did not exist before a sweep
+_MISSING = object()
+
+
+def _model_structure(model: dict, prefix: str = '') -> tuple:
+    """
+    Get the structural parameters of a model input.
+
+    Two models with equal structure have state vectors of the same layout, so the
+    state of one can be used to initialize the other.
+    """
+    items = []
+    for key, value in sorted(model.items()):
+        path = f'{prefix}{key}'
+        if isinstance(value, dict):
+            items.extend(_model_structure(value, path + '/'))
+        elif key.lower() in _STRUCTURE_KEYS or isinstance(value, (str, bytes)):
+            value = numpy.asarray(value)
+            items.append((path, value.shape, tuple(value.ravel().tolist())))
+    return tuple(items)
+
+
+def _order_points(points: list[dict[str, Any]]) -> list[int]:
+    """
+    Order sweep points along a path of nearby points.
+
+    Starting from the smallest point, the nearest point that has not been visited is
+    chosen next. Each parameter is scaled by its range.
+    """
+    if len(points) < 2:
+        return list(range(len(points)))
+
+    paths = sorted(points[0])
+    columns = []
+    for path in paths:
+        column = numpy.array(
+            [numpy.ravel(numpy.asarray(point[path], dtype=float)) for point in points]
+        )
+        scale = column.max(axis=0) - column.min(axis=0)
+        scale[scale == 0] = 1
+        columns.append((column - column.min(axis=0)) / scale)
+    coordinates = numpy.hstack(columns)
+
+    remaining = list(range(len(points)))
+    current = min(remaining, key=lambda i: tuple(coordinates[i]))
+    order = [current]
+    remaining.remove(current)
+    while remaining:
+        distances = numpy.linalg.norm(
+            coordinates[remaining] - coordinates[current], axis=1
+        )
+        current = remaining.pop(int(numpy.argmin(distances)))
+        order.append(current)
+    return order
+
+
+def _get_path(node: dict, path: str) -> Any:
+    """Get the value at `path` in the nested dictionary `node`, or `_MISSING`."""
+    for key in path.strip('/').split('/'):
+        if not isinstance(node, dict) or key not in node:
+            return _MISSING
+        node = node[key]
+    return node
+
+
+@dataclass
+class EnsembleResult:
+    """
+    Stacked results of an ensemble run.
+
+    Parameters
+    ----------
+    outputs : dict[str, numpy.ndarray]
+        The requested outputs of all members, stacked along a new first axis, e.g.
+        of shape (nMembers, nTime, nComp) for `solution_outlet`. Rows of failed
+        members are NaN.
+    return_information : list[ReturnInformation]
+        Information about the run of each member.
+    solution_times : Optional[numpy.ndarray]
+        The solution times, if written by the simulation.
+    """
+    outputs: dict[str, numpy.ndarray] = field(default_factory=dict)
+    return_information: list[ReturnInformation] = field(default_factory=list)
+    solution_times: Optional[numpy.ndarray] = None
+
+    @property
+    def success(self) -> numpy.ndarray:
+        """numpy.ndarray: Boolean mask of the members that ran successfully."""
+        return numpy.array(
+            [info.return_code == 0 for info in self.return_information], dtype=bool
+        )
+
+
 class CadetMeta(type):
     """
     Meta class for the CADET interface.
@@ -227,10 +339,24 @@ class Cadet(H5, metaclass=CadetMeta):
         Path to the 'cadet.dll' or equivalent shared library.
     cadet_create_lwe_path : Optional[Path]
         Path to the 'createLWE' executable.
+    use_worker : bool
+        If True, run simulations through the CADET DLL in a persistent worker process
+        shared by all instances using the same DLL.
     return_information : Optional[dict]
         Stores the information returned after a simulation run.
+    result_handle : Optional[ResultHandle]
+        Handle on the driver memory backing results loaded with `own_data=False`.
+    pickle_groups : Optional[tuple[str, ...]]
+        Groups of `root` included when pickling the simulation. Defaults to
+        `('input',)`, so that only the input is sent to worker processes. Set it to
+        None, e.g. on an instance whose results are cached with joblib, to pickle all
+        groups including loaded results. Copies made with the `copy` module always
+        include all groups. Arrays are pickled as out-of-band buffers with pickle
+        protocol 5 and a `buffer_callback`.
     """
 
+    pickle_groups: Optional[tuple[str, ...]] = ('input',)
+
     def __init__(
             self,
             install_path: Optional[Path] = None,
@@ -254,6 +380,9 @@ class Cadet(H5, metaclass=CadetMeta):
 
         self.cadet_create_lwe_path: Optional[Path] = None
         self.return_information: Optional[dict] = None
+        self.use_worker: bool = False
+        self.result_handle: Optional[ResultHandle] = None
+        self._save_ns: Optional[int] = None
 
         self._cadet_cli_runner: Optional[CadetCLIRunner] = None
         self._cadet_dll_runner: Optional[CadetDLLRunner] = None
@@ -428,8 +557,13 @@ class Cadet(H5, metaclass=CadetMeta):
         Returns
         -------
         Optional[CadetRunnerBase]
-            The current runner instance, either a DLL or file-based runner.
+            The current runner instance, either a worker, DLL or file-based runner.
         """
+        if self.use_worker:
+            if not self.found_dll:
+                raise ValueError("Set Cadet to use_worker but no dll interface found.")
+            return CadetWorkerRunner.shared(self.cadet_dll_path)
+
         if self.use_dll and self.found_dll:
             return self._cadet_dll_runner
 
@@ -559,7 +693,10 @@ class Cadet(H5, metaclass=CadetMeta):
     def run_simulation(
             self,
             timeout: Optional[float] = None,
-            clear: bool = True
+            clear: bool = True,
+            load: Optional[list[str]] = None,
+            own_data: bool = True,
+            lazy: bool = False,
     ) -> ReturnInformation:
         """
         Run the CADET simulation and load the results.
@@ -570,25 +707,480 @@ class Cadet(H5, metaclass=CadetMeta):
             Maximum time allowed for the simulation to run, in seconds.
         clear : bool
             If True, clear the simulation results from the current runner instance.
+        load : Optional[list[str]]
+            Paths or glob patterns of the results to load, relative to `root`, e.g.
+            ['output/solution/unit_003/solution_outlet*', 'meta/time_sim'].
+            Only the selected results are fetched. If None, all results are loaded.
+        own_data : bool
+            If False and the DLL interface is used, the arrays in `root.output` are
+            read-only views into the memory of the CADET driver instead of copies.
+            The driver is kept alive by `result_handle`; call `release_results` to
+            replace the views by copies.
+        lazy : bool
+            If True and the DLL interface is used, the datasets of the unit operations
+            in `root.output` are only fetched from the CADET driver when they are first
+            accessed. Until then, the driver is kept alive by `result_handle`.
 
         Returns
         -------
         ReturnInformation
             Information about the simulation run.
         """
-        return_information = self.cadet_runner.run(
-            simulation=self,
-            timeout=timeout
-        )
+        start = time.perf_counter_ns()
+
+        # Views of previous results keep their driver alive on their own
+        self.result_handle = None
 
-        if return_information.return_code == 0:
-            self.cadet_runner.load_results(self)
+        runner = self.cadet_runner
+        memory = {} if runner.collect_memory else None
+        # Only a time_sim reloaded by this run may be used to split the timings
+        stale_time_sim = self.root.get('meta', {}).get('time_sim')
+
+        with track_memory(memory):
+            return_information = runner.run(
+                simulation=self,
+                timeout=timeout
+            )
+            timings = return_information.timings
+
+            if return_information.return_code == 0:
+                with time_phase(timings, 'load'):
+                    self.result_handle = runner.load_results(
+                        self, paths=load, own_data=own_data, lazy=lazy
+                    )
+
+        if memory is not None:
+            return_information.memory = {**(return_information.memory or {}), **memory}
 
         if clear:
             self.clear()
 
+        save_ns = getattr(self, '_save_ns', None)
+        self._save_ns = None
+        if timings is not None:
+            if save_ns is not None:
+                timings['save'] = save_ns
+            time_sim = self.root.get('meta', {}).get('time_sim')
+            if (
+                    return_information.return_code == 0
+                    and time_sim is not None
+                    and time_sim is not stale_time_sim
+                    and 'run' in timings
+            ):
+                timings['solver'] = int(float(time_sim) * 1e9)
+                if isinstance(runner, CadetCLIRunner):
+                    timings['spawn'] = max(timings['run'] - timings['solver'], 0)
+            timings['total'] = time.perf_counter_ns() - start
+
         return return_information
 
+    @staticmethod
+    def run_parallel(
+            simulations: list["Cadet"],
+            max_workers: Optional[int] = None,
+            **kwargs: Any,
+    ) -> list[ReturnInformation]:
+        """
+        Run several simulations concurrently in a thread pool and load their results.
+
+        With the DLL interface, every thread uses its own CADET driver and the GIL is
+        released while CADET integrates, so small models run in parallel without the
+        overhead of process pools or pickling. Simulations using the CLI interface
+        run as concurrent subprocesses.
+
+        Parameters
+        ----------
+        simulations : list[Cadet]
+            The simulations to run. Each simulation must be a separate instance.
+        max_workers : Optional[int]
+            Maximum number of threads. Defaults to the number of CPUs.
+        **kwargs : Any
+            Additional arguments passed to `run_simulation`.
+
+        Returns
+        -------
+        list[ReturnInformation]
+            Information about each simulation run, in the order of `simulations`.
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(simulation.run_simulation, **kwargs)
+                for simulation in simulations
+            ]
+            return [future.result() for future in futures]
+
+    def warm_start_from(self, previous: "Cadet") -> bool:
+        """
+        Initialize the simulation with the last state of a previous simulation.
+
+        The last state is only used if the model structure (unit types, components,
+        bound states, discretization, ...) of both simulations is equal, i.e. if the
+        state vectors have the same layout.
+
+        Parameters
+        ----------
+        previous : Cadet
+            The previous simulation. Its results must contain `last_state_y`, i.e.
+            it must have been run with `input.return.write_solution_last` set.
+
+        Raises
+        ------
+        ValueError
+            If the results of the previous simulation contain no last state.
+
+        Returns
+        -------
+        bool
+            True if the initial state was set, False if the model structure differs.
+        """
+        output = previous.root.output
+        if 'last_state_y' not in output:
+            raise ValueError(
+                "Previous simulation has no last state. "
+                "Set input.return.write_solution_last before running it."
+            )
+
+        if _model_structure(self.root.input.model) != _model_structure(previous.root.input.model):
+            return False
+
+        self._set_initial_state(output)
+        return True
+
+    def _set_initial_state(self, output: dict) -> None:
+        """Set the initial state of the model to the last state of `output`."""
+        model = self.root.input.model
+        model.init_state_y = numpy.array(output['last_state_y'])
+        if 'last_state_ydot' in output:
+            model.init_state_ydot = numpy.array(output['last_state_ydot'])
+        else:
+            model.pop('init_state_ydot', None)
+
+    def run_sweep(
+            self,
+            points: list[dict[str, Any]],
+            continuation: bool = False,
+            **kwargs: Any,
+    ) -> list[tuple[ReturnInformation, Dict]]:
+        """
+        Run the simulation for several sets of parameter values.
+
+        In continuation mode, the points are run in an order in which neighboring
+        points are close to each other, and each simulation is initialized with the
+        last state of the previous, successful simulation if the model structure is
+        unchanged. For equilibrium and long-settling runs, this saves most of the
+        integration.
+
+        The input is restored after the sweep.
+
+        Parameters
+        ----------
+        points : list[dict[str, Any]]
+            The parameter values of each point, keyed by their path relative to
+            `root.input`, e.g. `{'model/unit_001/col_porosity': 0.37}`. All points
+            must set the same parameters.
+        continuation : bool, default=False
+            If True, order the points and warm-start each run from the previous one.
+        **kwargs : Any
+            Additional arguments passed to `run_simulation`.
+
+        Returns
+        -------
+        list[tuple[ReturnInformation, Dict]]
+            The return information and the output of each run, in the order of
+            `points`.
+        """
+        order = _order_points(points) if continuation else list(range(len(points)))
+
+        paths = set(path for point in points for path in point)
+        if continuation:
+            paths |= {'return/write_solution_last', 'model/init_state_y', 'model/init_state_ydot'}
+        original = {path: self._get_input(path) for path in paths}
+
+        results = [None] * len(points)
+        previous = None
+        try:
+            if continuation:
+                self.root.input['return'].write_solution_last = 1
+
+            for index in order:
+                for path, value in points[index].items():
+                    self._set_input(path, value)
+
+                if previous is not None and _model_structure(self.root.input.model) == previous[0]:
+                    self._set_initial_state(previous[1])
+                elif continuation:
+                    self._set_input('model/init_state_y', original['model/init_state_y'])
+                    self._set_input('model/init_state_ydot', original['model/init_state_ydot'])
+
+                if isinstance(self.cadet_runner, CadetCLIRunner):
+                    self.save()
+
+                self.root.pop('output', None)
+                return_information = self.run_simulation(**kwargs)
+                output = self.root.pop('output', Dict())
+                results[index] = (return_information, output)
+
+                if (
+                        continuation and return_information.return_code == 0
+                        and 'last_state_y' in output
+                ):
+                    previous = (_model_structure(self.root.input.model), output)
+                else:
+                    previous = None
+        finally:
+            for path, value in original.items():
+                self._set_input(path, value)
+
+        return results
+
+    @staticmethod
+    def run_ensemble(
+            base: "Cadet",
+            variations: Mapping[str, Any],
+            outputs: list[str],
+            max_workers: Optional[int] = None,
+            timeout: Optional[float] = None,
+    ) -> EnsembleResult:
+        """
+        Run variants of a simulation concurrently and stack the requested outputs.
+
+        Each thread of the pool runs its share of the members on a copy of the input
+        of `base`. With the DLL interface, drivers are reused through the driver pool
+        and, if no structural parameter is varied, each thread compiles the parameter
+        provider once and only patches the varied parameters for every member (see
+        `CadetDLLRunner.bind_parameters`). With the CLI interface, every member is
+        saved to a temporary file and run as a subprocess.
+
+        The input of `base` is not modified.
+
+        Parameters
+        ----------
+        base : Cadet
+            The simulation to vary.
+        variations : Mapping[str, Any]
+            The values of each varied parameter, keyed by their path relative to
+            `root.input`, e.g. `{'model/unit_001/col_porosity': [0.3, 0.35, 0.4]}`.
+            The first axis of the values indexes the members; all values must have
+            the same length.
+        outputs : list[str]
+            Paths of the outputs to stack, relative to `root.output`, e.g.
+            `'solution/unit_001/solution_outlet'`.
+        max_workers : Optional[int]
+            Maximum number of threads. Defaults to the number of CPUs.
+        timeout : Optional[float]
+            Maximum time allowed for the simulation of each member, in seconds.
+
+        A member that fails does not abort the ensemble. Its row of the outputs is
+        NaN and its return information has a non-zero return code. Errors raised
+        while running the member or storing its outputs, e.g. a timeout, a missing
+        output or an output whose shape differs from that of the other members, are
+        reported with return code -1 and the error in `error_message`.
+
+        Raises
+        ------
+        ValueError
+            If the variations are empty, scalar or of different length.
+
+        Returns
+        -------
+        EnsembleResult
+            The stacked outputs and the return information of each member.
+        """
+        variations = {
+            path.strip('/'): numpy.asarray(values) for path, values in variations.items()
+        }
+        for path, values in variations.items():
+            if values.ndim == 0:
+                raise ValueError(
+                    f"Variation of {path} must be a sequence of values, one per member."
+                )
+        lengths = {len(values) for values in variations.values()}
+        if len(lengths) != 1:
+            raise ValueError(
+                "Variations must contain at least one parameter and all parameters "
+                "must have the same number of values."
+            )
+        n_members = lengths.pop()
+        if n_members == 0:
+            raise ValueError("Variations must contain at least one member.")
+
+        runner = base.cadet_runner
+        reuse_provider = isinstance(runner, CadetDLLRunner) and not any(
+            path.rpartition('/')[2].lower() in _STRUCTURE_KEYS
+            or values.dtype.kind in 'SUO'
+            for path, values in variations.items()
+        )
+        needs_file = (
+            isinstance(runner, CadetCLIRunner)
+            or getattr(runner, 'parameter_provider', None) == 'hdf5'
+        )
+        load = ['output/solution/solution_times'] + [f'output/{path}' for path in outputs]
+
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = min(max_workers, n_members)
+
+        result = EnsembleResult(return_information=[None] * n_members)
+        lock = threading.Lock()
+
+        def member_values(index: int) -> dict[str, Any]:
+            values = {}
+            for path, column in variations.items():
+                value = column[index]
+                values[path] = value.item() if value.ndim == 0 else value
+            return values
+
+        def store(index: int, output: Dict) -> None:
+            for path in outputs:
+                value = _get_path(output, path)
+                if value is _MISSING:
+                    raise KeyError(f"Output {path} was not written by the simulation.")
+                value = numpy.asarray(value)
+                with lock:
+                    stacked = result.outputs.get(path)
+                    if stacked is None:
+                        stacked = numpy.full(
+                            (n_members, *value.shape), numpy.nan,
+                            dtype=numpy.result_type(value.dtype, float),
+                        )
+                        result.outputs[path] = stacked
+                if stacked.shape[1:] != value.shape:
+                    raise ValueError(
+                        f"Output {path} of member {index} has shape {value.shape}, "
+                        f"expected {stacked.shape[1:]}."
+                    )
+                stacked[index] = value
+
+            times = _get_path(output, 'solution/solution_times')
+            if result.solution_times is None and times is not _MISSING:
+                result.solution_times = numpy.asarray(times)
+
+        def discard(index: int) -> None:
+            with lock:
+                for stacked in result.outputs.values():
+                    stacked[index] = numpy.nan
+
+        def run_member(
+                member: "Cadet", index: int, directory: Optional[str]
+        ) -> ReturnInformation:
+            if reuse_provider:
+                return_information = runner.run_with(member_values(index), timeout)
+            else:
+                for path, value in member_values(index).items():
+                    member._set_input(path, value)
+                if needs_file:
+                    member.filename = os.path.join(directory, f'member_{index}.h5')
+                    member.save()
+                return_information = runner.run(simulation=member, timeout=timeout)
+
+            if return_information.return_code == 0:
+                runner.load_results(member, paths=load)
+                store(index, member.root.pop('output', Dict()))
+            return return_information
+
+        def run_members(indices: range, directory: Optional[str]) -> None:
+            # The variant shares the input and the runners of base
+            member = base.derive()
+            try:
+                if reuse_provider:
+                    runner.bind_parameters(member, list(variations))
+
+                for index in indices:
+                    try:
+                        return_information = run_member(member, index, directory)
+                    except Exception as error:
+                        # A failed member must not abort the rest of the ensemble
+                        member.root.pop('output', None)
+                        discard(index)
+                        return_information = ReturnInformation(
+                            return_code=-1,
+                            error_message=f"{type(error).__name__}: {error}",
+                            log='',
+                        )
+                    result.return_information[index] = return_information
+            finally:
+                if isinstance(runner, CadetDLLRunner):
+                    # Return the driver of this thread to the pool and unbind
+                    runner.close()
+                else:
+                    runner.clear()
+
+        with tempfile.TemporaryDirectory() if needs_file else contextlib.nullcontext() as directory:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(
+                        run_members, range(worker, n_members, max_workers), directory
+                    )
+                    for worker in range(max_workers)
+                ]
+                for future in futures:
+                    future.result()
+
+        return result
+
+    def clone(self) -> "Cadet":
+        """
+        Create a copy that shares the data and runners of this simulation.
+
+        See `H5.clone`. Results backed by driver memory (loaded with
+        `own_data=False` or `lazy=True`) are not shared.
+
+        Returns
+        -------
+        Cadet
+            The clone.
+        """
+        clone = super().clone()
+        if self.result_handle is not None:
+            clone.root.pop('output', None)
+        clone.result_handle = None
+        clone._save_ns = None
+        clone._shares_runners = True
+        return clone
+
+    def derive(self, changes: Optional[Mapping[str, Any]] = None) -> "Cadet":
+        """
+        Create a variant of this simulation without copying its input.
+
+        The variant is a clone without results, see `clone`. Only the changed
+        parameters and the groups containing them are copied; all other arrays and
+        groups are shared read-only with this simulation.
+
+        Parameters
+        ----------
+        changes : Optional[Mapping[str, Any]]
+            The new parameter values, keyed by their path relative to `root.input`,
+            e.g. `{'model/unit_001/col_porosity': 0.37}`.
+
+        Returns
+        -------
+        Cadet
+            The variant.
+        """
+        variant = self.clone()
+        variant.root.pop('output', None)
+        for path, value in (changes or {}).items():
+            variant._set_input(path, value)
+        return variant
+
+    def _get_input(self, path: str) -> Any:
+        """Get the value of the input at `path`, or `_MISSING` if it does not exist."""
+        return _get_path(self.root.input, path)
+
+    def _set_input(self, path: str, value: Any) -> None:
+        """Set the value of the input at `path`, removing it if `value` is `_MISSING`."""
+        *keys, key = path.strip('/').split('/')
+        node = self.root.input
+        for group in keys:
+            node = node[group]
+        if value is _MISSING:
+            node.pop(key, None)
+        else:
+            node[key] = value
+
     def run(
             self,
             timeout: Optional[float] = None,
@@ -640,25 +1232,107 @@ class Cadet(H5, metaclass=CadetMeta):
         )
         self.load_from_file()
 
+    def save(self, lock: bool = False) -> None:
+        """
+        Save the current state to the HDF5 file.
+
+        The wall time is reported as the 'save' phase of the next run if its runner
+        collects timings.
+
+        Parameters
+        ----------
+        lock : bool, optional
+            If True, uses a file lock while saving.
+        """
+        start = time.perf_counter_ns()
+        super().save(lock=lock)
+        self._save_ns = time.perf_counter_ns() - start
+
     def clear(self) -> None:
         """Clear the simulation results from the current runner instance."""
         runner = self.cadet_runner
         if runner is not None:
             runner.clear()
 
+    def release_results(self) -> None:
+        """
+        Replace results loaded with `own_data=False` by copies and release the driver.
+
+        Results loaded with `lazy=True` that have not been accessed yet are loaded.
+        """
+        handle = getattr(self, "result_handle", None)
+        self.result_handle = None
+        if handle is not None:
+            handle.release()
+
+    def close(self) -> None:
+        """
+        Clear the simulation results and return the DLL driver to the driver pool.
+
+        Results loaded with `own_data=False` are detached from driver memory.
+        Unlike `clear`, this does not instantiate a runner that has not been used yet.
+        Clones only release their results, the runners belong to the original.
+        """
+        self.release_results()
+        if getattr(self, '_shares_runners', False):
+            return
+
+        dll_runner = getattr(self, "_cadet_dll_runner", None)
+        if dll_runner is not None:
+            dll_runner.close()
+
+        cli_runner = getattr(self, "_cadet_cli_runner", None)
+        if cli_runner is not None:
+            cli_runner.clear()
+
+    def __enter__(self) -> "Cadet":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def __del__(self):
-        self.clear()
+        # Views into driver memory keep the driver alive, no need to detach them
+        self.result_handle = None
+        self.close()
         del self._cadet_dll_runner
         del self._cadet_cli_runner
 
-    def __getstate__(self):
+    def _get_state(self, groups: Optional[tuple[str, ...]]) -> dict:
+        """Get the attributes to copy or pickle, with only `groups` of `root`."""
         state = self.__dict__.copy()
+        # Views are pickled as copies, the handle on driver memory is dropped
+        state.pop("result_handle", None)
+        if groups is not None:
+            # Arrays are kept as they are, so that numpy can pass their buffers
+            # out-of-band
+            state["root"] = Dict({
+                group: self.root[group] for group in groups if group in self.root
+            })
         return state
 
+    def __getstate__(self):
+        state = self._get_state(self.pickle_groups)
+        # Unpickled copies own their runners
+        state.pop("_shares_runners", None)
+        return state
+
+    def __copy__(self) -> "Cadet":
+        clone = self.__class__.__new__(self.__class__)
+        clone.__setstate__(self._get_state(None))
+        return clone
+
+    def __deepcopy__(self, memo: dict) -> "Cadet":
+        clone = self.__class__.__new__(self.__class__)
+        memo[id(self)] = clone
+        clone.__setstate__(copy.deepcopy(self._get_state(None), memo))
+        return clone
+
     def __setstate__(self, state):
         # Restore the state and cast to addict.Dict() to add __frozen attributes
         state = Dict(state)
         self.__dict__.update(state)
+        self.result_handle = None
 
     def initialize_simulation(self) -> ReturnInformation:
         """
@@ -699,6 +1373,53 @@ class Cadet(H5, metaclass=CadetMeta):
 
         return self.cadet_runner.perform_simulation_step(t_end)
 
+    def iterate_steps(
+            self,
+            times: Iterable[float],
+            outputs: Optional[list[str]] = None,
+            ) -> Iterator[SimulationStep]:
+        """
+        Simulate stepwise and yield the newly recorded data after each step.
+
+        The simulation is initialized before the first step and ended when the
+        generator is exhausted or closed. Each step only copies the time points it
+        appended, so the cost per step is proportional to the new data.
+
+        Parameters
+        ----------
+        times : Iterable[float]
+            End times of the steps.
+        outputs : Optional[list[str]]
+            Outputs to yield, as `'unit_XXX/<solution>'`, e.g.
+            `'unit_001/solution_outlet'`.
+
+        Raises
+        ------
+        RuntimeError
+            If the simulation does not use the DLL interface, or, on the first step,
+            if the simulation cannot be initialized.
+        ValueError
+            If the simulation has more than one section or an output is not of the
+            form `'unit_XXX/<solution>'`.
+
+        Returns
+        -------
+        Iterator[SimulationStep]
+            Generator yielding the results of each step.
+        """
+        # Validate eagerly, before the first step is requested from the generator
+        if not isinstance(self.cadet_runner, CadetDLLRunner):
+            raise RuntimeError("iterate_steps requires the DLL interface (use_dll=True).")
+
+        nsec = len(self.root.input.solver.sections.section_times)
+        if nsec > 2:
+            raise ValueError(
+                "iterate_steps() only supports single-section integration. "
+                f"Found {nsec - 1} sections."
+            )
+
+        return self.cadet_runner.iterate_steps(self, times, outputs)
+
     def end_simulation(self) -> ReturnInformation:
 
         return self.cadet_runner.end_simulation()
@@ -1,17 +1,28 @@
+import collections
+import copy
 import ctypes
-import io
+from dataclasses import dataclass, field
+import functools
+import logging
 import os
 from pathlib import Path
-from typing import Any, Optional, Union
+import threading
+import weakref
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
 
 from packaging.version import Version
 import addict
 import numpy
 
-from cadet.runner import CadetRunnerBase, ReturnInformation
+from cadet.h5 import PathFilter
+from cadet.labeled_array import LabeledArray
+from cadet.runner import CadetRunnerBase, ReturnInformation, time_phase
 import cadet.cadet_dll_parameterprovider as cadet_dll_parameterprovider
 
 
+logger = logging.getLogger(__name__)
+
+
 # Common types for ctypes function signatures
 CadetDriver = ctypes.c_void_p
 array_double = ctypes.POINTER(ctypes.POINTER(ctypes.c_double))
@@ -220,7 +231,338 @@ class CADETAPI_V1_1_0a2(ctypes.Structure):
     _version = Version("1.1.0a2")
     _fields_ = _setup_api(_version)
 
+
+# Ordering of multi-dimensional arrays, all possible dimensions:
+# bulk: 'nTime', ('nAxialCells',) ('nRadialCells' / 'nPorts',) 'nComp'
+# particle_liquid: 'nTime', ('nParTypes',) ('nAxialCells',) ('nRadialCells' / 'nPorts',) ('nParShells',) 'nComp'
+# particle_solid: 'nTime', ('nParTypes',) ('nAxialCells',) ('nRadialCells' / 'nPorts',) ('nParShells',) 'nComp', 'nBound'
+# flux: 'nTime', ('nParTypes',) ('nAxialCells',) ('nRadialCells' / 'nPorts',) 'nComp'
+_DIMENSIONS = (
+    'nTime',
+    'nParTypes',
+    'nAxialCells',
+    'nPort',
+    'nRadialCells',
+    'nParShells',
+    'nComp',
+    'nBound',
+)
+
+# Input arguments of the getters that are passed by value
+_INPUT_ARGUMENTS = ('drv', 'unitOpId', 'sensIdx', 'parType')
+
+
+class _CallPlan:
+    """
+    Precompiled call of a CADET C-API getter.
+
+    The argument layout, the output argument types and the dimension and squeeze
+    rules are derived from the signature once and shared by all calls.
+
+    Parameters
+    ----------
+    name : str
+        Name of the API function.
+    signature : tuple[str, ...]
+        Signature of the API function as in `CADET_API_V1_SIGNATURES`.
+    """
+
+    def __init__(self, name: str, signature: tuple[str, ...]) -> None:
+        self.name = name
+
+        arguments = [key for key in signature if key != 'return']
+        self.n_args = len(arguments)
+        self.inputs = tuple(
+            (position, key) for position, key in enumerate(arguments)
+            if key in _INPUT_ARGUMENTS
+        )
+        self.outputs = tuple(
+            (position, key, CADET_API_V1_SIGNATURES.lookup_output_argument_type[key])
+            for position, key in enumerate(arguments)
+            if key not in _INPUT_ARGUMENTS
+        )
+
+        output_keys = {key for _, key, _ in self.outputs}
+        self.dims = tuple(dim for dim in _DIMENSIONS if dim in output_keys)
+        self.has_data = 'data' in output_keys
+        self.has_time = 'time' in output_keys
+        self.squeeze_axial = self.has_data and 'nAxialCells' in output_keys
+        self.squeeze_particle = self.has_data and 'nParShells' in output_keys
+
+
+_call_plans: dict[tuple[type, str], _CallPlan] = {}
+
+
+def _get_call_plan(api: Any, name: str) -> _CallPlan:
+    """Get the call plan of the API function `name`, compiling it on first use."""
+    key = (type(api), name)
+    plan = _call_plans.get(key)
+    if plan is None:
+        plan = _CallPlan(name, _get_api_signatures(api)[name])
+        _call_plans[key] = plan
+    return plan
+
+
+class _CallSlots(dict):
+    """
+    Reusable output arguments of a `_CallPlan`, mapped by argument name.
+
+    The ctypes objects and their references in the argument list are allocated once;
+    only the input arguments are filled in and the scalar outputs are reset per call.
+
+    Parameters
+    ----------
+    plan : _CallPlan
+        The call plan.
+    function : Callable
+        The API function bound to a `CADETAPI_*` instance.
+    """
+
+    def __init__(self, plan: _CallPlan, function: Callable) -> None:
+        super().__init__()
+        self.plan = plan
+        self.function = function
+        self.args = [None] * plan.n_args
+        self.scalars = []
+        for position, key, ctype in plan.outputs:
+            obj = ctype()
+            self[key] = obj
+            self.args[position] = ctypes.byref(obj)
+            if not issubclass(ctype, ctypes._Pointer):
+                self.scalars.append(obj)
+
     
+class _DriverMemory:
+    """
+    Ownership of a CADET driver whose result buffers are referenced by NumPy views.
+
+    The driver is returned to its pool once this object is garbage collected, i.e.
+    once the last view into the driver memory is gone.
+
+    Parameters
+    ----------
+    pool : DriverPool
+        The pool the driver is returned to.
+    driver : CadetDriver
+        The driver handle.
+    reusable : bool, default=True
+        If False, the driver is deleted instead of being returned to the pool.
+    """
+
+    def __init__(
+            self,
+            pool: "DriverPool",
+            driver: CadetDriver,
+            reusable: bool = True,
+            ) -> None:
+        self.driver = driver
+        release = pool.release if reusable else pool.discard
+        self._finalizer = weakref.finalize(self, release, driver)
+
+
+class _DriverView:
+    """
+    Read-only array interface into driver memory that keeps the driver alive.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        Array wrapping the driver memory.
+    memory : _DriverMemory
+        Owner of the driver.
+    """
+
+    def __init__(self, data: numpy.ndarray, memory: _DriverMemory) -> None:
+        interface = dict(data.__array_interface__)
+        interface['data'] = (interface['data'][0], True)
+        self.__array_interface__ = interface
+        self.memory = memory
+
+
+def _is_driver_view(array: numpy.ndarray, memory: _DriverMemory) -> bool:
+    """Check if `array` is a view into the driver memory owned by `memory`."""
+    base = array.base
+    while isinstance(base, numpy.ndarray):
+        base = base.base
+    return isinstance(base, _DriverView) and base.memory is memory
+
+
+class ResultHandle:
+    """
+    Handle on simulation results that are held in the memory of a CADET driver.
+
+    Results loaded with `own_data=False` are read-only NumPy views into the buffers
+    of the driver that ran the simulation. The driver is kept alive and is not reused
+    for other simulations as long as any of these views exists.
+
+    Releasing the handle replaces the views in the result tree by copies, after which
+    the driver is returned to the driver pool as soon as no other views remain.
+
+    Parameters
+    ----------
+    memory : _DriverMemory
+        Owner of the driver.
+    tree : addict.Dict
+        The result tree containing the views, usually `sim.root`.
+    """
+
+    def __init__(self, memory: _DriverMemory, tree: addict.Dict) -> None:
+        self._memory = memory
+        self._tree = tree
+
+    @property
+    def released(self) -> bool:
+        """bool: True if the handle has been released."""
+        return self._memory is None
+
+    def release(self) -> None:
+        """
+        Detach the result tree from driver memory by copying all views.
+        """
+        if self._memory is None:
+            return
+
+        self._detach(self._tree, self._memory)
+        self._memory = None
+        self._tree = None
+
+    @staticmethod
+    def _detach(tree: dict, memory: _DriverMemory) -> None:
+        for key, value in tree.items():
+            if isinstance(value, dict):
+                ResultHandle._detach(value, memory)
+            elif isinstance(value, numpy.ndarray) and _is_driver_view(value, memory):
+                tree[key] = value.copy()
+
+    def __enter__(self) -> "ResultHandle":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.release()
+
+
+class LazyResultGroup(addict.Dict):
+    """
+    Group of the result tree whose datasets are loaded on first access.
+
+    Each loader is registered for one or more result names (stems). Accessing a key
+    that equals a stem or starts with `<stem>_` (e.g. `solution_outlet_comp_000` for
+    `solution_outlet`) runs the loader once and caches everything it returns.
+    Iterating, comparing or converting the group loads all pending datasets.
+    """
+
+    # Fallback for instances created without __init__, e.g. by copy or pickle
+    _loaders: list = []
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        object.__setattr__(self, '_loaders', [])
+
+    def add_loader(self, stems: Union[str, tuple[str, ...]], loader: Callable) -> None:
+        """
+        Register a loader for the datasets named by `stems`.
+
+        Parameters
+        ----------
+        stems : str or tuple[str, ...]
+            Name(s) of the datasets provided by the loader.
+        loader : Callable
+            Function without arguments returning a dict of the loaded datasets.
+        """
+        if isinstance(stems, str):
+            stems = (stems, )
+        object.__setattr__(self, '_loaders', [*self._loaders, (stems, loader)])
+
+    @property
+    def pending(self) -> bool:
+        """bool: True if some datasets have not been loaded yet."""
+        return len(self._loaders) > 0
+
+    def _load(self, key: Optional[str] = None) -> None:
+        """Run the loaders providing `key`, or all pending loaders if `key` is None."""
+        remaining = []
+        for stems, loader in self._loaders:
+            if key is None or any(
+                    key == stem or key.startswith(f'{stem}_') for stem in stems
+            ):
+                for name, value in loader().items():
+                    if not dict.__contains__(self, name):
+                        dict.__setitem__(self, name, value)
+            else:
+                remaining.append((stems, loader))
+        object.__setattr__(self, '_loaders', remaining)
+
+    def load_all(self) -> "LazyResultGroup":
+        """Load all pending datasets and return the group."""
+        if self._loaders:
+            self._load()
+        return self
+
+    def __missing__(self, key):
+        if self._loaders and isinstance(key, str):
+            self._load(key)
+            if dict.__contains__(self, key):
+                return dict.__getitem__(self, key)
+        return super().__missing__(key)
+
+    def __contains__(self, key) -> bool:
+        if not dict.__contains__(self, key) and self._loaders and isinstance(key, str):
+            self._load(key)
+        return dict.__contains__(self, key)
+
+    def get(self, key, default=None):
+        if key in self:
+            return dict.__getitem__(self, key)
+        return default
+
+    def __iter__(self):
+        return dict.__iter__(self.load_all())
+
+    def __len__(self) -> int:
+        return dict.__len__(self.load_all())
+
+    def keys(self):
+        return dict.keys(self.load_all())
+
+    def values(self):
+        return dict.values(self.load_all())
+
+    def items(self):
+        return dict.items(self.load_all())
+
+    def __eq__(self, other) -> bool:
+        return dict.__eq__(self.load_all(), other)
+
+    def __ne__(self, other) -> bool:
+        return not self == other
+
+    def __repr__(self) -> str:
+        return dict.__repr__(self.load_all())
+
+
+@dataclass
+class SimulationStep:
+    """
+    Results of a single step of a stepwise simulation.
+
+    Parameters
+    ----------
+    return_information : ReturnInformation
+        Information about the step result.
+    t_reached : float
+        Actually reached time (may differ from the requested end time).
+    time : numpy.ndarray
+        The solution times recorded during this step.
+    outputs : dict[str, Optional[numpy.ndarray]]
+        The solution of each requested output at the recorded times, with time as
+        first axis. None if the output is not recorded.
+    """
+    return_information: ReturnInformation
+    t_reached: float
+    time: numpy.ndarray
+    outputs: dict[str, Optional[numpy.ndarray]] = field(default_factory=dict)
+
+
 class SimulationResult:
     """
     Handles reading results from a CADET simulation.
@@ -231,15 +573,58 @@ class SimulationResult:
         The CADET API instance.
     driver : CadetDriver
         The driver handle used for the simulation.
-
+    own_data : bool, default=True
+        Default for the `own_data` argument of the getters, i.e. whether returned
+        arrays are copies or views into driver memory.
+    memory : Optional[_DriverMemory]
+        Owner of the driver. If given, views returned with `own_data=False` are
+        read-only and keep the driver alive.
     """
 
     def __init__(
             self,
-            api: Union[CADETAPI_V1_0_0, CADETAPI_V1_1_0a1], driver: CadetDriver
+            api: Union[CADETAPI_V1_0_0, CADETAPI_V1_1_0a1], driver: CadetDriver,
+            own_data: bool = True,
+            memory: Optional[_DriverMemory] = None,
             ) -> None:
         self._api = api
         self._driver = driver
+        self.own_data = own_data
+        self._memory = memory
+        self._slots: dict[str, _CallSlots] = {}
+
+    def _as_array(
+            self,
+            pointer: Any,
+            shape: Any,
+            own_data: Optional[bool] = None,
+            ) -> numpy.ndarray:
+        """
+        Wrap an array of the driver, copying it if `own_data` is True.
+
+        Parameters
+        ----------
+        pointer : ctypes.POINTER
+            Pointer to the first element.
+        shape : Any
+            Shape of the array.
+        own_data : Optional[bool], default=None
+            Whether to create a copy of the data. Defaults to `self.own_data`.
+
+        Returns
+        -------
+        numpy.ndarray
+            The copied array or a view into driver memory.
+        """
+        if own_data is None:
+            own_data = self.own_data
+
+        data = numpy.ctypeslib.as_array(pointer, shape=shape)
+        if own_data:
+            return data.copy()
+        if self._memory is not None:
+            return numpy.asarray(_DriverView(data, self._memory))
+        return data
 
     def _load_data(
             self,
@@ -267,38 +652,31 @@ class SimulationResult:
         Optional[dict[str, Any]]
             The output arguments mapped to their values, or None if data is not available.
         """
-        get_solution = getattr(self._api, get_solution_str)
+        slots = self._slots.get(get_solution_str)
+        if slots is None:
+            plan = _get_call_plan(self._api, get_solution_str)
+            slots = _CallSlots(plan, getattr(self._api, get_solution_str))
+            self._slots[get_solution_str] = slots
 
-        # Collect actual values
-        call_args = []
-        call_outputs = {}
-
-        signatures = _get_api_signatures(self._api)
+        inputs = {
+            'drv': self._driver,
+            'unitOpId': unitOpId,
+            'sensIdx': sensIdx,
+            'parType': parType,
+        }
 
         # Construct API call function arguments
-        for key in signatures[get_solution_str]:
-            if key == 'return':
-                # Skip, this is the actual return value of the API function
-                continue
-            elif key == 'drv':
-                call_args.append(self._driver)
-            elif key == 'unitOpId':
-                if unitOpId is None:
-                    raise ValueError(f"{get_solution_str} requires unitOpId")
-                call_args.append(unitOpId)
-            elif key == 'sensIdx':
-                if sensIdx is None:
-                    raise ValueError(f"{get_solution_str} requires sensIdx")
-                call_args.append(sensIdx)
-            elif key == 'parType':
-                if parType is None:
-                    raise ValueError(f"{get_solution_str} requires parType")
-                call_args.append(parType)
-            else:
-                _obj = CADET_API_V1_SIGNATURES.lookup_output_argument_type[key]()
-                call_outputs[key] = _obj
-                call_args.append(ctypes.byref(_obj))
+        call_args = slots.args
+        for position, key in slots.plan.inputs:
+            value = inputs[key]
+            if value is None and key != 'drv':
+                raise ValueError(f"{get_solution_str} requires {key}")
+            call_args[position] = value
 
+        for obj in slots.scalars:
+            obj.value = 0
+
+        get_solution = slots.function
         result = get_solution(*call_args)
 
         if result == _CDT_DATA_NOT_STORED:
@@ -310,14 +688,14 @@ class SimulationResult:
             # Something else failed
             raise Exception("Error reading data.")
 
-        return call_outputs
+        return slots
 
     def _process_array(
             self,
             call_outputs: dict[str, Any],
             data_key: str,
             len_key: str,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> Optional[numpy.ndarray]:
         """
         Process array data from the API.
@@ -330,8 +708,8 @@ class SimulationResult:
             The key for the data array in the output arguments.
         len_key : str
             The key for the length of the data array.
-        own_data : bool, default=True
-            Whether to create a copy of the data.
+        own_data : Optional[bool], default=None
+            Whether to create a copy of the data. Defaults to `self.own_data`.
 
         Returns
         -------
@@ -342,15 +720,12 @@ class SimulationResult:
         if array_length == 0:
             return
 
-        data = numpy.ctypeslib.as_array(call_outputs[data_key], shape=(array_length, ))
-        if own_data:
-            return data.copy()
-        return data
+        return self._as_array(call_outputs[data_key], (array_length, ), own_data)
 
     def _process_data(
             self,
             call_outputs: dict[str, Any],
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> Optional[tuple[numpy.ndarray, numpy.ndarray, list[str]]]:
         """
         Process multi-dimensional data from the API.
@@ -359,72 +734,57 @@ class SimulationResult:
         ----------
         call_outputs : dict
             The output arguments returned from the API call.
-        own_data : bool, default=True
-            Whether to create a copy of the data.
+        own_data : Optional[bool], default=None
+            Whether to create a copy of the data. Defaults to `self.own_data`.
 
         Returns
         -------
         Optional[tuple[numpy.ndarray, numpy.ndarray, list[str]]]
             A tuple of time, data, and dimensions, or None if no data is available.
         """
+        plan = call_outputs.plan
+
         shape = []
         dims = []
-        drop_indices = []
-
-        # Ordering of multi-dimensional arrays, all possible dimensions:
-        # bulk: 'nTime', ('nAxialCells',) ('nRadialCells' / 'nPorts',) 'nComp'
-        # particle_liquid: 'nTime', ('nParTypes',) ('nAxialCells',) ('nRadialCells' / 'nPorts',) ('nParShells',) 'nComp'
-        # particle_solid: 'nTime', ('nParTypes',) ('nAxialCells',) ('nRadialCells' / 'nPorts',) ('nParShells',) 'nComp', 'nBound'
-        # flux: 'nTime', ('nParTypes',) ('nAxialCells',) ('nRadialCells' / 'nPorts',) 'nComp'
-        dimensions = [
-            'nTime',
-            'nParTypes',
-            'nAxialCells',
-            'nPort',
-            'nRadialCells',
-            'nParShells',
-            'nComp',
-            'nBound',
-        ]
-        for dim in dimensions:
-            if dim in call_outputs and call_outputs[dim].value:
-                shape.append(call_outputs[dim].value)
+        for dim in plan.dims:
+            value = call_outputs[dim].value
+            if value:
+                shape.append(value)
                 dims.append(dim)
 
         if len(shape) == 0:
             return
 
-        if 'data' in call_outputs:
-            if 'nAxialCells' in dims:
+        if plan.has_data:
+            drop_indices = []
+            if plan.squeeze_axial and 'nAxialCells' in dims:
                 nAxialCells = call_outputs['nAxialCells'].value
                 keep_axial_singleton_dim = call_outputs['keepAxialSingletonDimension'].value
                 if nAxialCells == 1 and not keep_axial_singleton_dim:
                     drop_indices.append(dims.index('nAxialCells'))
 
-            if 'nParShells' in dims:
+            if plan.squeeze_particle and 'nParShells' in dims:
                 nParShells = call_outputs['nParShells'].value
                 keep_particle_singleton_dim = call_outputs['keepParticleSingletonDimension'].value
                 if nParShells == 1 and not keep_particle_singleton_dim:
                     drop_indices.append(dims.index('nParShells'))
 
-            shape = numpy.delete(shape, drop_indices)
+            if drop_indices:
+                shape = [n for i, n in enumerate(shape) if i not in drop_indices]
+                dims = [dim for i, dim in enumerate(dims) if i not in drop_indices]
 
-            data = numpy.ctypeslib.as_array(call_outputs['data'], shape=shape)
-            if own_data:
-                data = data.copy()
+            data = self._as_array(call_outputs['data'], tuple(shape), own_data)
 
-        if 'time' in call_outputs:
+        if plan.has_time:
             n_time = call_outputs['nTime'].value
-            time = numpy.ctypeslib.as_array(call_outputs['time'], shape=(n_time, ))
-            if own_data:
-                time = time.copy()
+            time = self._as_array(call_outputs['time'], (n_time, ), own_data)
 
         return time, data, dims
 
     def _load_and_process(
             self,
             *args: Any,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             **kwargs: Any
             ) -> Optional[tuple[numpy.ndarray, numpy.ndarray, list[str]]]:
         """
@@ -432,8 +792,8 @@ class SimulationResult:
 
         Parameters
         ----------
-        own_data : bool, default=True
-            Whether to create a copy of the data.
+        own_data : Optional[bool], default=None
+            Whether to create a copy of the data. Defaults to `self.own_data`.
 
         Returns
         -------
@@ -453,7 +813,7 @@ class SimulationResult:
             data_key: str,
             len_key: str,
             *args: Any,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             **kwargs: Any
             ) -> Optional[numpy.ndarray]:
         """
@@ -465,8 +825,8 @@ class SimulationResult:
             The key for the data array in the output arguments.
         len_key : str
             The key for the length of the data array.
-        own_data : bool, default=True
-            Whether to create a copy of the data.
+        own_data : Optional[bool], default=None
+            Whether to create a copy of the data. Defaults to `self.own_data`.
 
         Returns
         -------
@@ -482,15 +842,15 @@ class SimulationResult:
 
     def file_format(
             self,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> float:
         """
         Load the file format used for the simulation config.
 
         Parameters
         ----------
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -541,10 +901,59 @@ class SimulationResult:
         call_outputs = self._load_data('getNumSensitivities')
         return int(call_outputs['nSens'].value)
 
+    def stacked_sensitivity(
+            self,
+            sens_str: str,
+            unitOpId: int,
+            parType: Optional[int] = None,
+            ) -> Optional[tuple[numpy.ndarray, numpy.ndarray, list[str]]]:
+        """
+        Load the sensitivities of all parameters as a single tensor.
+
+        The sensitivities are copied from the driver directly into one preallocated
+        array with the sensitivity index as first axis.
+
+        Parameters
+        ----------
+        sens_str : str
+            The sensitivity getter, e.g. `'sens_outlet'` or `'sensdot_bulk'`.
+        unitOpId : int
+            The unit operation ID.
+        parType : Optional[int]
+            The particle type, required for particle and solid sensitivities.
+
+        Returns
+        -------
+        Optional[tuple[numpy.ndarray, numpy.ndarray, list[str]]]
+            The time, the tensor of shape `(nSens, nTime, ...)` and its dimensions,
+            or None if no data is available.
+        """
+        sens_fun = getattr(self, sens_str)
+        args = (unitOpId, ) if parType is None else (unitOpId, parType)
+
+        nsens = self.nsensitivities()
+        time = tensor = dims = None
+        for sensIdx in range(nsens):
+            data = sens_fun(args[0], sensIdx, *args[1:], own_data=False)
+            if data is None:
+                return
+
+            out = data[1]
+            if tensor is None:
+                time = numpy.array(data[0])
+                tensor = numpy.empty((nsens, ) + out.shape, dtype=out.dtype)
+                dims = ['nSens'] + list(data[2])
+            tensor[sensIdx] = out
+
+        if tensor is None:
+            return
+
+        return time, tensor, dims
+
     def solution_inlet(
             self,
             unitOpId: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load the inlet solution for a given unit operation.
@@ -553,8 +962,8 @@ class SimulationResult:
         ----------
         unitOpId : int
             The unit operation ID.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -568,7 +977,7 @@ class SimulationResult:
     def solution_outlet(
             self,
             unitOpId: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load the outlet solution for a given unit operation.
@@ -577,8 +986,8 @@ class SimulationResult:
         ----------
         unitOpId : int
             The unit operation ID.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -592,7 +1001,7 @@ class SimulationResult:
     def solution_bulk(
             self,
             unitOpId: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load the bulk solution for a given unit operation.
@@ -601,8 +1010,8 @@ class SimulationResult:
         ----------
         unitOpId : int
             The unit operation ID.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -617,7 +1026,7 @@ class SimulationResult:
             self,
             unitOpId: int,
             parType: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load the particle-phase solution for a given unit operation and particle type.
@@ -628,8 +1037,8 @@ class SimulationResult:
             The unit operation ID.
         parType : int
             The particle type index.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -644,7 +1053,7 @@ class SimulationResult:
             self,
             unitOpId: int,
             parType: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load the solid-phase solution for a given unit operation and particle type.
@@ -655,8 +1064,8 @@ class SimulationResult:
             The unit operation ID.
         parType : int
             The particle type index.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -670,7 +1079,7 @@ class SimulationResult:
     def solution_flux(
             self,
             unitOpId: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load the flux solution for a given unit operation.
@@ -679,8 +1088,8 @@ class SimulationResult:
         ----------
         unitOpId : int
             The unit operation ID.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -694,7 +1103,7 @@ class SimulationResult:
     def solution_volume(
             self,
             unitOpId: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load the volume solution for a given unit operation.
@@ -703,8 +1112,8 @@ class SimulationResult:
         ----------
         unitOpId : int
             The unit operation ID.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -718,7 +1127,7 @@ class SimulationResult:
     def soldot_inlet(
             self,
             unitOpId: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load the time derivative of the inlet solution for a given unit operation.
@@ -727,8 +1136,8 @@ class SimulationResult:
         ----------
         unitOpId : int
             The unit operation ID.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -742,7 +1151,7 @@ class SimulationResult:
     def soldot_outlet(
             self,
             unitOpId: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load the time derivative of the outlet solution for a given unit operation.
@@ -751,8 +1160,8 @@ class SimulationResult:
         ----------
         unitOpId : int
             The unit operation ID.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -766,7 +1175,7 @@ class SimulationResult:
     def soldot_bulk(
             self,
             unitOpId: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load the time derivative of the bulk solution for a given unit operation.
@@ -775,8 +1184,8 @@ class SimulationResult:
         ----------
         unitOpId : int
             The unit operation ID.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -791,7 +1200,7 @@ class SimulationResult:
             self,
             unitOpId: int,
             parType: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load the time derivative of the particle-phase solution for a given unit operation and particle type.
@@ -802,8 +1211,8 @@ class SimulationResult:
             The unit operation ID.
         parType : int
             The particle type index.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -821,7 +1230,7 @@ class SimulationResult:
             self,
             unitOpId: int,
             parType: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load the time derivative of the solid-phase solution for a given unit operation and particle type.
@@ -832,8 +1241,8 @@ class SimulationResult:
             The unit operation ID.
         parType : int
             The particle type index.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -850,7 +1259,7 @@ class SimulationResult:
     def soldot_flux(
             self,
             unitOpId: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load the time derivative of the flux solution for a given unit operation.
@@ -859,8 +1268,8 @@ class SimulationResult:
         ----------
         unitOpId : int
             The unit operation ID.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -874,7 +1283,7 @@ class SimulationResult:
     def soldot_volume(
             self,
             unitOpId: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load the time derivative of the volume solution for a given unit operation.
@@ -883,8 +1292,8 @@ class SimulationResult:
         ----------
         unitOpId : int
             The unit operation ID.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -899,7 +1308,7 @@ class SimulationResult:
             self,
             unitOpId: int,
             sensIdx: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load the sensitivity data for the inlet of a given unit operation and sensitivity index.
@@ -910,8 +1319,8 @@ class SimulationResult:
             The unit operation ID.
         sensIdx : int
             The sensitivity index.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -926,7 +1335,7 @@ class SimulationResult:
             self,
             unitOpId: int,
             sensIdx: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load sensitivity data for the outlet of a given unit operation and sensitivity index.
@@ -937,8 +1346,8 @@ class SimulationResult:
             The unit operation ID.
         sensIdx : int
             The sensitivity index.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -956,7 +1365,7 @@ class SimulationResult:
             self,
             unitOpId: int,
             sensIdx: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load sensitivity data for the bulk of a given unit operation and sensitivity index.
@@ -967,8 +1376,8 @@ class SimulationResult:
             The unit operation ID.
         sensIdx : int
             The sensitivity index.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -984,7 +1393,7 @@ class SimulationResult:
             unitOpId: int,
             sensIdx: int,
             parType: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load sensitivity data for the particle phase of a given unit operation, sensitivity index, and particle type.
@@ -997,8 +1406,8 @@ class SimulationResult:
             The sensitivity index.
         parType : int
             The particle type index.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -1018,7 +1427,7 @@ class SimulationResult:
             unitOpId: int,
             sensIdx: int,
             parType: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load sensitivity data for the solid phase of a given unit operation, sensitivity index, and particle type.
@@ -1031,8 +1440,8 @@ class SimulationResult:
             The sensitivity index.
         parType : int
             The particle type index.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -1051,7 +1460,7 @@ class SimulationResult:
             self,
             unitOpId: int,
             sensIdx: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load sensitivity data for the flux of a given unit operation and sensitivity index.
@@ -1062,8 +1471,8 @@ class SimulationResult:
             The unit operation ID.
         sensIdx : int
             The sensitivity index.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -1078,7 +1487,7 @@ class SimulationResult:
             self,
             unitOpId: int,
             sensIdx: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load sensitivity data for the volume of a given unit operation and sensitivity index.
@@ -1089,8 +1498,8 @@ class SimulationResult:
             The unit operation ID.
         sensIdx : int
             The sensitivity index.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -1108,7 +1517,7 @@ class SimulationResult:
             self,
             unitOpId: int,
             sensIdx: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load sensitivity derivative data for the inlet of a given unit operation and sensitivity index.
@@ -1119,8 +1528,8 @@ class SimulationResult:
             The unit operation ID.
         sensIdx : int
             The sensitivity index.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -1138,7 +1547,7 @@ class SimulationResult:
             self,
             unitOpId: int,
             sensIdx: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load sensitivity derivative data for the outlet of a given unit operation and sensitivity index.
@@ -1149,8 +1558,8 @@ class SimulationResult:
             The unit operation ID.
         sensIdx : int
             The sensitivity index.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -1168,7 +1577,7 @@ class SimulationResult:
             self,
             unitOpId: int,
             sensIdx: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load sensitivity derivative data for the bulk of a given unit operation and sensitivity index.
@@ -1179,8 +1588,8 @@ class SimulationResult:
             The unit operation ID.
         sensIdx : int
             The sensitivity index.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -1199,7 +1608,7 @@ class SimulationResult:
             unitOpId: int,
             sensIdx: int,
             parType: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load sensitivity derivative data for the particle phase of a given unit operation, sensitivity index, and particle type.
@@ -1212,8 +1621,8 @@ class SimulationResult:
             The sensitivity index.
         parType : int
             The particle type index.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -1233,7 +1642,7 @@ class SimulationResult:
             unitOpId: int,
             sensIdx: int,
             parType: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load sensitivity derivative data for the solid phase of a given unit operation, sensitivity index, and particle type.
@@ -1246,8 +1655,8 @@ class SimulationResult:
             The sensitivity index.
         parType : int
             The particle type index.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -1266,7 +1675,7 @@ class SimulationResult:
             self,
             unitOpId: int,
             sensIdx: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load sensitivity derivative data for the flux of a given unit operation and sensitivity index.
@@ -1277,8 +1686,8 @@ class SimulationResult:
             The unit operation ID.
         sensIdx : int
             The sensitivity index.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -1296,7 +1705,7 @@ class SimulationResult:
             self,
             unitOpId: int,
             sensIdx: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load sensitivity derivative data for the volume of a given unit operation and sensitivity index.
@@ -1307,8 +1716,8 @@ class SimulationResult:
             The unit operation ID.
         sensIdx : int
             The sensitivity index.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -1324,15 +1733,15 @@ class SimulationResult:
 
     def last_state_y(
             self,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load the last state of the system.
 
         Parameters
         ----------
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -1345,15 +1754,15 @@ class SimulationResult:
 
     def last_state_ydot(
             self,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load the time derivative of the last state of the system.
 
         Parameters
         ----------
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -1367,7 +1776,7 @@ class SimulationResult:
     def last_state_y_unit(
             self,
             unitOpId: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load the last state of a given unit operation.
@@ -1376,8 +1785,8 @@ class SimulationResult:
         ----------
         unitOpId : int
             The unit operation ID.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -1391,7 +1800,7 @@ class SimulationResult:
     def last_state_ydot_unit(
             self,
             unitOpId: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load the time derivative of the last state of a given unit operation.
@@ -1400,8 +1809,8 @@ class SimulationResult:
         ----------
         unitOpId : int
             The unit operation ID.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -1419,7 +1828,7 @@ class SimulationResult:
     def last_state_sens(
             self,
             sensIdx: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load the last sensitivity state for a given sensitivity index.
@@ -1428,8 +1837,8 @@ class SimulationResult:
         ----------
         sensIdx : int
             The sensitivity index.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -1447,7 +1856,7 @@ class SimulationResult:
     def last_state_sensdot(
             self,
             sensIdx: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load the time derivative of the last sensitivity state for a given sensitivity index.
@@ -1456,8 +1865,8 @@ class SimulationResult:
         ----------
         sensIdx : int
             The sensitivity index.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -1476,7 +1885,7 @@ class SimulationResult:
             self,
             unitOpId: int,
             sensIdx: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load the last sensitivity state for a given unit operation and sensitivity index.
@@ -1487,8 +1896,8 @@ class SimulationResult:
             The unit operation ID.
         sensIdx : int
             The sensitivity index.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -1506,7 +1915,7 @@ class SimulationResult:
             self,
             unitOpId: int,
             sensIdx: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> tuple[numpy.ndarray, numpy.ndarray, list[str]]:
         """
         Load the time derivative of the last sensitivity state for a given unit operation and sensitivity index.
@@ -1517,8 +1926,8 @@ class SimulationResult:
             The unit operation ID.
         sensIdx : int
             The sensitivity index.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -1535,7 +1944,7 @@ class SimulationResult:
     def primary_coordinates(
             self,
             unitOpId: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> numpy.ndarray:
         """
         Load the primary coordinates for a given unit operation.
@@ -1544,8 +1953,8 @@ class SimulationResult:
         ----------
         unitOpId : int
             The unit operation ID.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -1563,7 +1972,7 @@ class SimulationResult:
     def secondary_coordinates(
             self,
             unitOpId: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> numpy.ndarray:
         """
         Load the secondary coordinates for a given unit operation.
@@ -1572,8 +1981,8 @@ class SimulationResult:
         ----------
         unitOpId : int
             The unit operation ID.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -1592,7 +2001,7 @@ class SimulationResult:
             self,
             unitOpId: int,
             parType: int,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> numpy.ndarray:
         """
         Load the particle coordinates for a given unit operation and particle type.
@@ -1603,8 +2012,8 @@ class SimulationResult:
             The unit operation ID.
         parType : int
             The particle type index.
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -1621,15 +2030,15 @@ class SimulationResult:
 
     def solution_times(
             self,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> numpy.ndarray:
         """
         Load the solution times from the simulation.
 
         Parameters
         ----------
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -1642,15 +2051,15 @@ class SimulationResult:
 
     def time_sim(
             self,
-            own_data: bool = True,
+            own_data: Optional[bool] = None,
             ) -> float:
         """
         Load the simulation run time.
 
         Parameters
         ----------
-        own_data : bool, optional
-            Whether to copy the data (default is True).
+        own_data : Optional[bool]
+            Whether to copy the data. Defaults to the `own_data` setting of the result.
 
         Returns
         -------
@@ -1661,44 +2070,399 @@ class SimulationResult:
         return float(call_outputs['timeSim'].value)
 
 
-class CadetDLLRunner(CadetRunnerBase):
+class DriverPool:
     """
-    Runner for CADET simulations using a DLL-based interface.
+    Pool of idle CADET drivers created through the API of one CADET library.
 
-    This class loads and interacts with the CADET DLL, providing methods for running
-    simulations and loading results.
+    Creating a driver allocates the complete simulator infrastructure of CADET-Core.
+    Runners therefore acquire drivers from the pool and return them when they are
+    done, so that drivers are reused across runs and across runner instances sharing
+    the same library.
+
+    Parameters
+    ----------
+    lib : ctypes.CDLL
+        The loaded CADET library. A reference is kept so that pooled drivers can be
+        deleted as long as the pool is alive.
+    api : CADETAPI_V1_0_0 | CADETAPI_V1_1_0a1 | CADETAPI_V1_1_0a2
+        The CADET API used to create and delete drivers.
+    max_idle : int, optional
+        Maximum number of idle drivers kept in the pool. Drivers released to a full
+        pool are deleted. Defaults to the number of CPUs.
     """
 
-    def __init__(self, dll_path: os.PathLike | str) -> None:
+    def __init__(
+            self,
+            lib: ctypes.CDLL,
+            api: Union[CADETAPI_V1_0_0, CADETAPI_V1_1_0a1, CADETAPI_V1_1_0a2],
+            max_idle: Optional[int] = None,
+            ) -> None:
+        self._lib = lib
+        self._api = api
+        self.max_idle = max_idle if max_idle is not None else (os.cpu_count() or 1)
+        self._idle: list[CadetDriver] = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> CadetDriver:
         """
-        Initialize the CadetDLLRunner.
+        Get an idle driver from the pool or create a new one.
+
+        Returns
+        -------
+        CadetDriver
+            The driver handle.
+        """
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self._api.createDriver()
+
+    def release(self, driver: CadetDriver) -> None:
+        """
+        Return a driver to the pool, deleting it if the pool is full.
 
         Parameters
         ----------
-        dll_path : os.PathLike or str
-            Path to the CADET DLL.
+        driver : CadetDriver
+            The driver handle.
         """
-        self._cadet_path = Path(dll_path)
-        self._initialize_dll()
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(driver)
+                return
+        self._api.deleteDriver(driver)
 
-    def _initialize_dll(self):
-        self._lib = ctypes.cdll.LoadLibrary(self._cadet_path.as_posix())
+    def discard(self, driver: CadetDriver) -> None:
+        """
+        Delete a driver instead of returning it to the pool.
 
-        # Query meta information
-        cdtGetLibraryVersion = self._lib.cdtGetLibraryVersion
-        cdtGetLibraryVersion.restype = ctypes.c_char_p
-        self._cadet_version = cdtGetLibraryVersion().decode('utf-8')
+        Parameters
+        ----------
+        driver : CadetDriver
+            The driver handle.
+        """
+        self._api.deleteDriver(driver)
 
-        cdtGetLibraryCommitHash = self._lib.cdtGetLibraryCommitHash
-        cdtGetLibraryCommitHash.restype = ctypes.c_char_p
-        self._cadet_commit_hash = cdtGetLibraryCommitHash().decode('utf-8')
+    def clear(self) -> None:
+        """Delete all idle drivers."""
+        with self._lock:
+            idle = self._idle
+            self._idle = []
+        for driver in idle:
+            self._api.deleteDriver(driver)
+
+    def __len__(self) -> int:
+        """Number of idle drivers in the pool."""
+        return len(self._idle)
+
+
+_driver_pools: dict[str, DriverPool] = {}
+_driver_pools_lock = threading.Lock()
+
+
+def _get_driver_pool(
+        dll_path: Path,
+        lib: ctypes.CDLL,
+        api: Union[CADETAPI_V1_0_0, CADETAPI_V1_1_0a1, CADETAPI_V1_1_0a2],
+        ) -> DriverPool:
+    """Get the driver pool of the CADET library at `dll_path`, creating it if needed."""
+    key = os.path.realpath(dll_path)
+    with _driver_pools_lock:
+        pool = _driver_pools.get(key)
+        if pool is None:
+            pool = DriverPool(lib, api)
+            _driver_pools[key] = pool
+    return pool
+
+
+def clear_driver_pools() -> None:
+    """Delete the idle drivers of all CADET libraries."""
+    with _driver_pools_lock:
+        pools = list(_driver_pools.values())
+    for pool in pools:
+        pool.clear()
+
+
+# CADET log level that disables logging
+LOG_LEVEL_OFF = 0
+
+# Mapping of CADET log levels to the levels of the logging module
+_LOGGING_LEVELS = {
+    1: logging.CRITICAL,
+    2: logging.ERROR,
+    3: logging.WARNING,
+    4: logging.INFO,
+    5: logging.DEBUG,
+    6: logging.DEBUG,
+    7: logging.DEBUG,
+}
+
+
+class LogSink:
+    """
+    Bounded receiver of the CADET log messages of one thread.
 
-        cdtGetLibraryBranchRefspec = self._lib.cdtGetLibraryBranchRefspec
-        cdtGetLibraryBranchRefspec.restype = ctypes.c_char_p
-        self._cadet_branch = cdtGetLibraryBranchRefspec().decode('utf-8')
+    Records are kept unformatted in a ring buffer, only the most recent `capacity`
+    records are retained. They are formatted when the log is read with `getvalue`.
+    Optionally, records are forwarded to the `cadet.cadet_dll` logger with the
+    structured fields `cadet_file`, `cadet_func`, `cadet_line` and `cadet_level`.
 
-        cdtGetLibraryBuildType = self._lib.cdtGetLibraryBuildType
-        cdtGetLibraryBuildType.restype = ctypes.c_char_p
+    Parameters
+    ----------
+    capacity : Optional[int], default=1000
+        Maximum number of retained records. If None, all records are retained.
+    forward : bool, default=False
+        If True, forward records to the `logging` module.
+    """
+
+    def __init__(self, capacity: Optional[int] = 1000, forward: bool = False) -> None:
+        self.records: collections.deque = collections.deque(maxlen=capacity)
+        self.forward = forward
+
+    @property
+    def capacity(self) -> Optional[int]:
+        """Optional[int]: Maximum number of retained records."""
+        return self.records.maxlen
+
+    def emit(
+            self,
+            file: bytes,
+            func: bytes,
+            line: int,
+            level: int,
+            level_name: bytes,
+            message: bytes,
+            ) -> None:
+        """Store a log record and forward it if enabled."""
+        self.records.append((file, func, line, level, level_name, message))
+        if not self.forward:
+            return
+
+        logging_level = _LOGGING_LEVELS.get(level, logging.DEBUG)
+        if logger.isEnabledFor(logging_level):
+            logger.log(
+                logging_level,
+                message.decode('utf-8'),
+                extra={
+                    'cadet_file': file.decode('utf-8'),
+                    'cadet_func': func.decode('utf-8'),
+                    'cadet_line': line,
+                    'cadet_level': level,
+                },
+            )
+
+    def clear(self) -> None:
+        """Remove all records."""
+        self.records.clear()
+
+    def getvalue(self) -> str:
+        """
+        Format the retained records.
+
+        Returns
+        -------
+        str
+            The log, one line per record.
+        """
+        return "".join(
+            f"{level_name.decode('utf-8')} ({func.decode('utf-8')}:{line}) "
+            f"{message.decode('utf-8')}\n"
+            for _, func, line, _, level_name, message in self.records
+        )
+
+
+class _LogRouter:
+    """
+    Persistent log receiver of a CADET library that routes messages per thread.
+
+    CADET has a single, global log receiver per library. The router is installed once
+    and passes each message to the `LogSink` registered by the calling thread, so
+    that simulations running concurrently in different threads keep separate logs.
+    The log level is applied by CADET, so filtered messages never reach Python.
+
+    Parameters
+    ----------
+    callback_type : type
+        The ctypes function type of the log receiver.
+    set_log_handler : Callable
+        The `cdtSetLogReceiver` function of the library.
+    set_log_level : Callable
+        The `cdtSetLogLevel` function of the library.
+    """
+
+    def __init__(
+            self,
+            callback_type: type,
+            set_log_handler: Callable,
+            set_log_level: Callable,
+            ) -> None:
+        self._local = threading.local()
+        self._callback = callback_type(self._handle)
+        set_log_handler(self._callback)
+        self._set_log_level = set_log_level
+        self._level: Optional[int] = None
+
+    def _handle(self, file, func, line, level, level_name, message) -> None:
+        """Logging callback function."""
+        sink = getattr(self._local, 'sink', None)
+        if sink is not None:
+            sink.emit(file, func, line, level, level_name, message)
+
+    def set_sink(self, sink: Optional[LogSink]) -> None:
+        """Set the sink receiving the log messages of the calling thread."""
+        self._local.sink = sink
+
+    def set_level(self, level: int) -> None:
+        """
+        Set the log level of the library.
+
+        The level applies to all threads. The library is only called if it changes.
+        """
+        if level != self._level:
+            self._set_log_level(level)
+            self._level = level
+
+
+_log_routers: dict[str, _LogRouter] = {}
+_log_routers_lock = threading.Lock()
+
+
+def _get_log_router(
+        dll_path: Path,
+        callback_type: type,
+        set_log_handler: Callable,
+        set_log_level: Callable,
+        ) -> _LogRouter:
+    """Get the log router of the CADET library at `dll_path`, installing it if needed."""
+    key = os.path.realpath(dll_path)
+    with _log_routers_lock:
+        router = _log_routers.get(key)
+        if router is None:
+            router = _LogRouter(callback_type, set_log_handler, set_log_level)
+            _log_routers[key] = router
+    return router
+
+
+class _ThreadState:
+    """
+    Driver and results of a `CadetDLLRunner` in one thread.
+
+    The driver is returned to the pool when the state is garbage collected, e.g.
+    when its thread ends or the runner is deleted.
+
+    Parameters
+    ----------
+    pool : DriverPool
+        The pool drivers are acquired from.
+    """
+
+    def __init__(self, pool: DriverPool) -> None:
+        self.pool = pool
+        self.driver: Optional[CadetDriver] = None
+        self.driver_reusable = True
+        self.res: Optional[SimulationResult] = None
+        self.bound: Optional[cadet_dll_parameterprovider.BoundParameters] = None
+        self.log_sink: Optional[LogSink] = None
+
+    def __del__(self) -> None:
+        if self.driver is None:
+            return
+        if self.driver_reusable:
+            self.pool.release(self.driver)
+        else:
+            self.pool.discard(self.driver)
+
+
+class CadetDLLRunner(CadetRunnerBase):
+    """
+    Runner for CADET simulations using a DLL-based interface.
+
+    This class loads and interacts with the CADET DLL, providing methods for running
+    simulations and loading results.
+
+    Drivers are created lazily and shared through a `DriverPool` with all runners
+    using the same library. The driver of a runner is returned to the pool by
+    `clear` and `close`; the runner can also be used as a context manager.
+
+    The runner is thread-safe: each thread uses its own driver and results, and log
+    messages are routed to the buffer of the thread running the simulation. Since
+    ctypes releases the GIL during `runSimulation`, simulations in different threads
+    run concurrently.
+
+    Pickled runners only keep the path of the library, which is loaded again on
+    first use after unpickling.
+
+    Attributes
+    ----------
+    parameter_provider : str
+        The parameter provider passing the simulation input to CADET. `'compiled'`
+        (default) flattens the input once into a pre-typed table, `'dict'` reads the
+        nested input dictionary on every request and `'hdf5'` reads the `/input`
+        group of the simulation file on demand, ignoring the input in memory.
+    log_level : int
+        CADET log level, e.g. 2 (errors, default) or 4 (info). Messages above the
+        level are dropped by CADET before reaching Python. `LOG_LEVEL_OFF` disables
+        logging. The level applies to all runners of the library.
+    log_capacity : Optional[int]
+        Maximum number of log records retained per run. If None, all records are
+        retained.
+    forward_log : bool
+        If True, log records are also forwarded to the `cadet.cadet_dll` logger.
+    output_layout : str
+        Layout of the loaded solutions and sensitivities. `'split'` (default) splits
+        them into ports, components and particle types as configured in
+        `input.return`. `'labeled'` stores each quantity as a single `LabeledArray`
+        with named dimensions, particle types of equal shape are stacked along a
+        `nParType` axis; components, ports and particle types are selected as views.
+    sensitivity_layout : str
+        Layout of the loaded sensitivities. `'split'` (default) stores each parameter
+        separately in `output/sensitivity/param_XXX/unit_XXX`, `'stacked'` stores
+        one tensor of all parameters per result in `output/sensitivity/unit_XXX`,
+        with the sensitivity index as first axis.
+    parameter_trace : Optional[ParameterTrace]
+        If set, the parameter provider records every parameter CADET reads in the
+        trace, e.g. to find unused inputs with `ParameterTrace.prune`. Tracing slows
+        down the callbacks, it is disabled by default.
+    """
+
+    parameter_provider = 'compiled'
+    parameter_trace: Optional[cadet_dll_parameterprovider.ParameterTrace] = None
+    log_level = 2
+    log_capacity: Optional[int] = 1000
+    forward_log = False
+    output_layout = 'split'
+    sensitivity_layout = 'split'
+
+    def __init__(self, dll_path: os.PathLike | str) -> None:
+        """
+        Initialize the CadetDLLRunner.
+
+        Parameters
+        ----------
+        dll_path : os.PathLike or str
+            Path to the CADET DLL.
+        """
+        self._cadet_path = Path(dll_path)
+        self._initialize_dll()
+
+    def _initialize_dll(self):
+        self._lib = ctypes.cdll.LoadLibrary(self._cadet_path.as_posix())
+
+        # Query meta information
+        cdtGetLibraryVersion = self._lib.cdtGetLibraryVersion
+        cdtGetLibraryVersion.restype = ctypes.c_char_p
+        self._cadet_version = cdtGetLibraryVersion().decode('utf-8')
+
+        cdtGetLibraryCommitHash = self._lib.cdtGetLibraryCommitHash
+        cdtGetLibraryCommitHash.restype = ctypes.c_char_p
+        self._cadet_commit_hash = cdtGetLibraryCommitHash().decode('utf-8')
+
+        cdtGetLibraryBranchRefspec = self._lib.cdtGetLibraryBranchRefspec
+        cdtGetLibraryBranchRefspec.restype = ctypes.c_char_p
+        self._cadet_branch = cdtGetLibraryBranchRefspec().decode('utf-8')
+
+        cdtGetLibraryBuildType = self._lib.cdtGetLibraryBuildType
+        cdtGetLibraryBuildType.restype = ctypes.c_char_p
         self._cadet_build_type = cdtGetLibraryBuildType().decode('utf-8')
 
         # Define the log handler callback type
@@ -1721,7 +2485,12 @@ class CadetDLLRunner(CadetRunnerBase):
         self._set_log_level.argtypes = [ctypes.c_int]
         self._set_log_level.restype = None
 
-        self._default_log_level = 2
+        self._log_router = _get_log_router(
+            self._cadet_path,
+            self.LOG_HANDLER_CLBK,
+            self._set_log_handler,
+            self._set_log_level,
+        )
 
         # Query API
         try:
@@ -1776,8 +2545,41 @@ class CadetDLLRunner(CadetRunnerBase):
                 f"({self._cadet_capi_version}). Check CADET-Python implementation of CAPI support logic."
             )
 
-        self._driver = self._api.createDriver()
-        self.res: Optional[SimulationResult] = None
+        self._driver_pool = _get_driver_pool(self._cadet_path, self._lib, self._api)
+        self._thread_local = threading.local()
+
+    def _thread_state(self) -> _ThreadState:
+        """Get the driver and results of the calling thread."""
+        state = getattr(self._thread_local, 'state', None)
+        if state is None:
+            state = _ThreadState(self._driver_pool)
+            self._thread_local.state = state
+        return state
+
+    @property
+    def _driver(self) -> Optional[CadetDriver]:
+        return self._thread_state().driver
+
+    @_driver.setter
+    def _driver(self, driver: Optional[CadetDriver]) -> None:
+        self._thread_state().driver = driver
+
+    @property
+    def _driver_reusable(self) -> bool:
+        return self._thread_state().driver_reusable
+
+    @_driver_reusable.setter
+    def _driver_reusable(self, reusable: bool) -> None:
+        self._thread_state().driver_reusable = reusable
+
+    @property
+    def res(self) -> Optional[SimulationResult]:
+        """Optional[SimulationResult]: Results of the last run in the calling thread."""
+        return self._thread_state().res
+
+    @res.setter
+    def res(self, res: Optional[SimulationResult]) -> None:
+        self._thread_state().res = res
 
     def __getstate__(self):
         # Exclude all non-pickleable attributes and only keep _cadet_path
@@ -1787,64 +2589,160 @@ class CadetDLLRunner(CadetRunnerBase):
         return state
 
     def __setstate__(self, state):
-        # Restore the state and reinitialize the DLL
+        # Restore the state, the DLL is reinitialized on first use
         self.__dict__.update(state)
+
+    def __getattr__(self, name: str):
+        # Only called for missing attributes, i.e. those of an unpickled runner
+        # whose DLL has not been loaded yet
+        if name.startswith('__') or '_cadet_path' not in self.__dict__ or self._dll_loaded:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
         self._initialize_dll()
+        return getattr(self, name)
+
+    @property
+    def _dll_loaded(self) -> bool:
+        """bool: True if the DLL has been loaded, False for an unpickled runner."""
+        return '_thread_local' in self.__dict__
+
+    def _acquire_driver(self) -> CadetDriver:
+        """Get the driver of this runner, acquiring one from the pool if necessary."""
+        if self._driver is None:
+            self._driver = self._driver_pool.acquire()
+            self._driver_reusable = True
+        return self._driver
+
+    def _release_driver(self) -> None:
+        """
+        Return the driver to the pool.
+
+        Drivers with an unfinished stepwise simulation or a failed run are deleted
+        instead, so that pooled drivers are always in a clean state.
+        """
+        driver = self._driver
+        self._driver = None
+        if driver is None:
+            return
+
+        if self._driver_reusable:
+            self._driver_pool.release(driver)
+        else:
+            self._driver_pool.discard(driver)
 
     def clear(self) -> None:
         """
         Clear the simulation results from the current instance.
 
-        Note, this method deletes also resets the driver.
+        Note, this method also returns the driver to the driver pool. A driver is
+        acquired again on the next run.
+        """
+        if not self._dll_loaded:
+            return
+        self.res = None
+        self._release_driver()
+
+    def close(self) -> None:
         """
-        if hasattr(self, "res"):
-            del self.res
+        Clear the simulation results, release the driver and unbind the parameters.
 
-        if hasattr(self, "_api") and hasattr(self, "_driver"):
-            self._api.deleteDriver(self._driver)
-        self._driver = self._api.createDriver()
+        The runner remains usable; the next run acquires a new driver from the pool.
+        """
+        if not self._dll_loaded:
+            return
+        self.clear()
+        self._thread_state().bound = None
+
+    def __enter__(self) -> "CadetDLLRunner":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     def __del__(self) -> None:
         """
-        Clean up the CADET driver on object deletion.
+        Return the CADET driver to the pool on object deletion.
         """
-        if hasattr(self, "_api") and hasattr(self, "_driver"):
-            self._api.deleteDriver(self._driver)
+        if self._dll_loaded and self._driver is not None:
+            self.res = None
+            self._release_driver()
 
-    def setup_log_buffer(self, log_level: int = None) -> io.StringIO:
+    def setup_log_buffer(self, log_level: Optional[int] = None) -> LogSink:
         """
-        Set up a new log buffer for capturing log output with the specified log level.
+        Set up the log sink capturing the log output of the calling thread.
+
+        The sink of each thread is persistent and cleared for every call.
 
         Parameters
         ----------
-        log_level : int, optional
-            The desired log level. Defaults to the instance's default log level.
+        log_level : Optional[int]
+            The desired log level. Defaults to `log_level` of the runner.
 
         Returns
         -------
-        log_buffer : io.StringIO
-            A new log buffer for capturing log output.
+        LogSink
+            The log sink of the calling thread. It stays empty if logging is off.
         """
         if log_level is None:
-            log_level = self._default_log_level
+            log_level = self.log_level
 
-        # Create a new log buffer
-        log_buffer = io.StringIO()
+        state = self._thread_state()
+        sink = state.log_sink
+        if sink is None or sink.capacity != self.log_capacity:
+            sink = LogSink(self.log_capacity)
+            state.log_sink = sink
+        sink.forward = self.forward_log
+        sink.clear()
 
-        def log_handler(file, func, line, level, level_name, message):
-            """Logging callback function."""
-            msg = f"{level_name.decode('utf-8')} ({func.decode('utf-8')}:{line}) {message.decode('utf-8')}"
-            log_buffer.write(msg + "\n")  # Write to the instance's buffer
+        self._log_router.set_level(log_level)
+        self._log_router.set_sink(sink if log_level != LOG_LEVEL_OFF else None)
 
-        # Set up the logging callback
-        self._log_handler = self.LOG_HANDLER_CLBK(log_handler)
-        self._set_log_handler(self._log_handler)
+        return sink
 
-        # Set the log level
-        self._set_log_level(log_level)
+    def _create_parameter_provider(
+            self,
+            simulation: "Cadet",
+            ) -> cadet_dll_parameterprovider.PARAMETERPROVIDER:
+        """
+        Create the parameter provider for the input of a simulation.
 
-        # Return the log buffer so it can be accessed after the run
-        return log_buffer
+        Parameters
+        ----------
+        simulation : Cadet
+            Simulation object containing input data.
+
+        Raises
+        ------
+        ValueError
+            If `parameter_provider` is not a known provider.
+
+        Returns
+        -------
+        PARAMETERPROVIDER
+            The parameter provider selected by `parameter_provider`.
+        """
+        trace = self.parameter_trace
+        if self.parameter_provider == 'compiled':
+            return cadet_dll_parameterprovider.CompiledParameterProvider(simulation, trace)
+        if self.parameter_provider == 'dict':
+            return cadet_dll_parameterprovider.PARAMETERPROVIDER(simulation, trace)
+        if self.parameter_provider == 'hdf5':
+            pp = cadet_dll_parameterprovider.H5ParameterProvider(simulation, trace)
+            # Loading the results only requires the return and sensitivity groups
+            try:
+                simulation.load_from_file(
+                    paths=['/input/return', '/input/sensitivity'], update=True
+                )
+            except BaseException:
+                pp.close()
+                raise
+            return pp
+
+        raise ValueError(
+            f"Unknown parameter provider: {self.parameter_provider!r}. "
+            "Use 'compiled', 'dict' or 'hdf5'."
+        )
 
     def run(
             self,
@@ -1866,17 +2764,109 @@ class CadetDLLRunner(CadetRunnerBase):
         RuntimeError
             If the simulation process returns a non-zero exit code.
         """
+        timings = {} if self.collect_timings else None
+        with time_phase(timings, 'provider'):
+            pp = self._create_parameter_provider(simulation)
+        try:
+            return self._run_provider(pp, timeout, timings)
+        finally:
+            pp.close()
+
+    def bind_parameters(
+            self,
+            simulation: "Cadet",
+            paths: list[str],
+            ) -> cadet_dll_parameterprovider.BoundParameters:
+        """
+        Bind the varied parameters of a simulation for repeated runs with `run_with`.
+
+        The parameter provider is compiled once from the current input of the
+        simulation and kept for subsequent calls to `run_with` in the calling thread.
+        Only the bound parameters may change between these runs.
+
+        Parameters
+        ----------
+        simulation : Cadet
+            Simulation object containing input data.
+        paths : list[str]
+            Paths of the varied parameters relative to the input, e.g.
+            `'model/unit_001/col_porosity'`.
+
+        Returns
+        -------
+        BoundParameters
+            The bound parameters.
+        """
+        bound = cadet_dll_parameterprovider.BoundParameters(simulation, paths)
+        self._thread_state().bound = bound
+        return bound
+
+    def run_with(
+            self,
+            values: Union[dict[str, Any], list[Any]],
+            timeout: Optional[float] = None,
+            ) -> ReturnInformation:
+        """
+        Rerun the simulation bound by `bind_parameters` with new parameter values.
+
+        Only the bound parameters are patched in the persistent parameter provider
+        and in the simulation input, nothing else is rebuilt. Results are available
+        through `load_results` as after `run`.
+
+        Parameters
+        ----------
+        values : Union[dict[str, Any], list[Any]]
+            The new values, either in the order of the bound paths or as a dictionary
+            mapping (a subset of) the bound paths to values.
+        timeout : Optional[float]
+            Maximum time allowed for the simulation to run, in seconds.
+
+        Raises
+        ------
+        RuntimeError
+            If no parameters were bound in the calling thread.
+
+        Returns
+        -------
+        ReturnInformation
+            Information about the simulation run.
+        """
+        bound = self._thread_state().bound
+        if bound is None:
+            raise RuntimeError("No parameters bound. Call bind_parameters first.")
+
+        bound.set_values(values)
+
+        return self._run_provider(bound.get_provider(), timeout)
+
+    def _run_provider(
+            self,
+            pp: cadet_dll_parameterprovider.PARAMETERPROVIDER,
+            timeout: Optional[float] = None,
+            timings: Optional[dict[str, int]] = None,
+            ) -> ReturnInformation:
+        """
+        Run the simulation configured by the parameter provider `pp`.
+
+        The wall time of the run is added to `timings`, which are created if timings
+        are collected and none are passed.
+        """
         if timeout is not None:
             if(self._cadet_capi_version < Version("1.1.0a1")):
                 raise TypeError(
                     "timeout is not support CADET-CAPI version: "
                     f"({self._cadet_capi_version})."
                 )
-        pp = cadet_dll_parameterprovider.PARAMETERPROVIDER(simulation)
+
+        if timings is None and self.collect_timings:
+            timings = {}
 
         log_buffer = self.setup_log_buffer()
 
-        returncode = self._api.runSimulation(self._driver, ctypes.byref(pp))
+        driver = self._acquire_driver()
+        with time_phase(timings, 'run'):
+            returncode = self._api.runSimulation(driver, ctypes.byref(pp))
+        self._driver_reusable = returncode == 0
 
         if returncode != 0:
             log = ""
@@ -1885,17 +2875,24 @@ class CadetDLLRunner(CadetRunnerBase):
             log = log_buffer.getvalue()
             error_message = ""
 
-        self.res = SimulationResult(self._api, self._driver)
+        self.res = SimulationResult(self._api, driver)
 
         return_info = ReturnInformation(
             return_code=returncode,
             error_message=error_message,
-            log=log
+            log=log,
+            timings=timings,
         )
 
         return return_info
 
-    def load_results(self, sim: "Cadet") -> None:
+    def load_results(
+            self,
+            sim: "Cadet",
+            paths: Optional[list[str]] = None,
+            own_data: bool = True,
+            lazy: bool = False,
+    ) -> Optional[ResultHandle]:
         """
         Load the simulation results into the provided simulation object.
 
@@ -1903,71 +2900,242 @@ class CadetDLLRunner(CadetRunnerBase):
         ----------
         sim : Cadet
             The simulation object where results will be loaded.
+        paths : Optional[list[str]]
+            Paths or glob patterns of the results to load, relative to the root.
+            Results that are not selected are not fetched from the driver.
+            If None, all results enabled by the `write_*` flags are loaded.
+        own_data : bool, default=True
+            If False, arrays are loaded as read-only views into driver memory instead
+            of copies. The driver is handed over to the returned `ResultHandle` and
+            the runner acquires a new driver for its next run.
+        lazy : bool, default=False
+            If True, the datasets of the unit operations (coordinates, solution and
+            sensitivity) are only fetched from the driver when they are first
+            accessed. As for `own_data=False`, the driver is handed over to the
+            returned `ResultHandle`.
+
+        Returns
+        -------
+        Optional[ResultHandle]
+            Handle on the driver memory if `own_data` is False or `lazy` is True,
+            otherwise None.
         """
         if self.res is None:
             return
 
-        self.load_solution_times(sim)
-        self.load_coordinates(sim)
-        self.load_solution(sim)
-        self.load_sensitivity(sim)
-        self.load_state(sim)
+        handle = None
+        if (not own_data or lazy) and self._driver is not None:
+            memory = _DriverMemory(
+                self._driver_pool, self._driver, self._driver_reusable
+            )
+            self._driver = None
+            self.res = SimulationResult(
+                self._api, memory.driver, own_data=own_data, memory=memory
+            )
+            handle = ResultHandle(memory, sim.root)
+
+        path_filter = PathFilter(paths) if paths is not None else None
+
+        self.load_solution_times(sim, path_filter)
+        if lazy:
+            self.load_lazy(sim, path_filter)
+        else:
+            self.load_coordinates(sim, path_filter)
+            self.load_solution(sim, path_filter)
+            self.load_sensitivity(sim, path_filter)
+        self.load_state(sim, path_filter, units=not lazy)
+
+        self.load_meta(sim, path_filter)
+
+        return handle
+
+    def load_lazy(
+            self,
+            sim: "Cadet",
+            path_filter: Optional[PathFilter] = None,
+            ) -> None:
+        """
+        Populate coordinates, solution and sensitivity groups with lazy loaders.
+
+        Each unit operation group is a `LazyResultGroup` that fetches a dataset from
+        the current `SimulationResult` when it is first accessed. The loaders keep the
+        result (and thus its driver) alive until they have run. The `return` group of
+        the input is captured, so later changes to it do not affect the loaded data.
+        """
+        res = self.res
+        snapshot = addict.Dict()
+        snapshot.root.input['return'] = copy.deepcopy(sim.root.input['return'])
+        write_flags = snapshot.root.input['return']
+
+        def is_written(unit_index, solution_str, group):
+            if not write_flags[unit_index].get(f'write_{solution_str}', 0):
+                return False
+            return path_filter is None or path_filter.may_match_stem(f'{group}/{solution_str}')
+
+        nsens = sim.root.input.sensitivity.get('nsens', 0)
+        for unit in range(res.nunits()):
+            unit_index = self._get_index_string('unit', unit)
+
+            group = f'output/coordinates/{unit_index}'
+            if (
+                    self._may_be_selected(path_filter, group)
+                    and write_flags[unit_index].get('write_coordinates', 0)
+            ):
+                coordinates = LazyResultGroup()
+                coordinates.add_loader(
+                    ('axial_coordinates', 'radial_coordinates', 'particle_coordinates'),
+                    functools.partial(
+                        self._load_unit_coordinates, snapshot, unit, path_filter, res
+                    ),
+                )
+                sim.root.output.coordinates[unit_index] = coordinates
+
+            group = f'output/solution/{unit_index}'
+            if self._may_be_selected(path_filter, group):
+                solution = LazyResultGroup()
+                for solution_str, loader in self._unit_loaders(self._SOLUTION_PREFIXES):
+                    if is_written(unit_index, solution_str, group):
+                        solution.add_loader(solution_str, functools.partial(
+                            loader, snapshot, unit, solution_str,
+                            path_filter=path_filter, res=res,
+                        ))
+                if write_flags[unit_index].get('write_solution_last_unit', 0):
+                    solution.add_loader(
+                        ('last_state_y', 'last_state_ydot'),
+                        functools.partial(
+                            self._load_unit_state, snapshot, unit, path_filter, res
+                        ),
+                    )
+                if solution.pending:
+                    sim.root.output.solution[unit_index] = solution
+
+            if self.sensitivity_layout == 'stacked' and nsens > 0:
+                group = f'output/sensitivity/{unit_index}'
+                sensitivity = LazyResultGroup()
+                if self._may_be_selected(path_filter, group):
+                    for sens_str in self._result_names(self._SENSITIVITY_PREFIXES):
+                        if is_written(unit_index, sens_str, group):
+                            sensitivity.add_loader(sens_str, functools.partial(
+                                self._load_stacked_sensitivity, snapshot, unit, sens_str,
+                                path_filter=path_filter, res=res,
+                            ))
+                if sensitivity.pending:
+                    sim.root.output.sensitivity[unit_index] = sensitivity
+                continue
+
+            for sens in range(nsens):
+                sens_index = self._get_index_string('param', sens)
+                group = f'output/sensitivity/{sens_index}/{unit_index}'
+                if not self._may_be_selected(path_filter, group):
+                    continue
+
+                sensitivity = LazyResultGroup()
+                for solution_str, loader in self._unit_loaders(self._SENSITIVITY_PREFIXES):
+                    if is_written(unit_index, solution_str, group):
+                        sensitivity.add_loader(solution_str, functools.partial(
+                            loader, snapshot, unit, solution_str, sens,
+                            path_filter=path_filter, res=res,
+                        ))
+                if sensitivity.pending:
+                    sim.root.output.sensitivity[sens_index][unit_index] = sensitivity
 
-        self.load_meta(sim)
+    @staticmethod
+    def _is_selected(path_filter: Optional[PathFilter], path: str) -> bool:
+        """Check if the result at `path` is selected by the (optional) filter."""
+        return path_filter is None or path_filter.matches(path)
+
+    @staticmethod
+    def _may_be_selected(path_filter: Optional[PathFilter], path: str) -> bool:
+        """Check if the group at `path` may contain results selected by the filter."""
+        return path_filter is None or path_filter.may_contain(path)
 
-    def load_solution_times(self, sim: "Cadet") -> None:
+    def load_solution_times(
+            self,
+            sim: "Cadet",
+            path_filter: Optional[PathFilter] = None,
+            ) -> None:
         """Load solution times from simulation results."""
+        if not self._is_selected(path_filter, 'output/solution/solution_times'):
+            return
+
         write_solution_times = sim.root.input['return'].get('write_solution_times', 0)
         if write_solution_times:
             sim.root.output.solution.solution_times = self.res.solution_times()
 
-    def load_coordinates(self, sim: "Cadet") -> None:
+    def load_coordinates(
+            self,
+            sim: "Cadet",
+            path_filter: Optional[PathFilter] = None,
+            ) -> None:
         """Load coordinates data from simulation results."""
         coordinates = addict.Dict()
         for unit in range(self.res.nunits()):
             unit_index = self._get_index_string('unit', unit)
-            write_coordinates = sim.root.input['return'][unit_index].get('write_coordinates', 0)
-            if write_coordinates:
-                pc = self.res.primary_coordinates(unit)
-                if pc is not None:
-                    coordinates[unit_index]['axial_coordinates'] = pc
-
-                sc = self.res.secondary_coordinates(unit)
-                if sc is not None:
-                    coordinates[unit_index]['radial_coordinates'] = sc
-
-                num_par_types = self.res.npartypes(unit)
-                for pt in range(num_par_types):
-                    par_coords = self.res.particle_coordinates(unit, pt)
-                    if par_coords is not None:
-                        par_idx = self._get_index_string('particle_coordinates', pt)
-                        coordinates[unit_index][par_idx] = par_coords
+            unit_coordinates = self._load_unit_coordinates(sim, unit, path_filter)
+            if len(unit_coordinates) > 0:
+                coordinates[unit_index] = unit_coordinates
 
         if len(coordinates) > 0:
             sim.root.output.coordinates = coordinates
 
-    def load_solution(self, sim: "Cadet") -> addict.Dict:
+    def _load_unit_coordinates(
+            self,
+            sim: "Cadet",
+            unit: int,
+            path_filter: Optional[PathFilter] = None,
+            res: Optional[SimulationResult] = None,
+            ) -> addict.Dict:
+        """Load the coordinates of a unit operation from simulation results."""
+        res = res if res is not None else self.res
+        coordinates = addict.Dict()
+
+        unit_index = self._get_index_string('unit', unit)
+        group = f'output/coordinates/{unit_index}'
+        if not self._may_be_selected(path_filter, group):
+            return coordinates
+
+        write_coordinates = sim.root.input['return'][unit_index].get('write_coordinates', 0)
+        if not write_coordinates:
+            return coordinates
+
+        if self._is_selected(path_filter, f'{group}/axial_coordinates'):
+            pc = res.primary_coordinates(unit)
+            if pc is not None:
+                coordinates['axial_coordinates'] = pc
+
+        if self._is_selected(path_filter, f'{group}/radial_coordinates'):
+            sc = res.secondary_coordinates(unit)
+            if sc is not None:
+                coordinates['radial_coordinates'] = sc
+
+        num_par_types = res.npartypes(unit)
+        for pt in range(num_par_types):
+            par_idx = self._get_index_string('particle_coordinates', pt)
+            if not self._is_selected(path_filter, f'{group}/{par_idx}'):
+                continue
+            par_coords = res.particle_coordinates(unit, pt)
+            if par_coords is not None:
+                coordinates[par_idx] = par_coords
+
+        return coordinates
+
+    def load_solution(
+            self,
+            sim: "Cadet",
+            path_filter: Optional[PathFilter] = None,
+            ) -> addict.Dict:
         """Load solution data from simulation results."""
         solution = addict.Dict()
         for unit in range(self.res.nunits()):
             unit_index = self._get_index_string('unit', unit)
+            if not self._may_be_selected(path_filter, f'output/solution/{unit_index}'):
+                continue
+
             unit_solution = addict.Dict()
+            kwargs = {'path_filter': path_filter}
 
-            unit_solution.update(self._load_solution_io(sim, unit, 'solution_inlet'))
-            unit_solution.update(self._load_solution_io(sim, unit, 'solution_outlet'))
-            unit_solution.update(self._load_solution_trivial(sim, unit, 'solution_bulk'))
-            unit_solution.update(self._load_solution_particle(sim, unit, 'solution_particle'))
-            unit_solution.update(self._load_solution_particle(sim, unit, 'solution_solid'))
-            unit_solution.update(self._load_solution_trivial(sim, unit, 'solution_flux'))
-            unit_solution.update(self._load_solution_trivial(sim, unit, 'solution_volume'))
-
-            unit_solution.update(self._load_solution_io(sim, unit, 'soldot_inlet'))
-            unit_solution.update(self._load_solution_io(sim, unit, 'soldot_outlet'))
-            unit_solution.update(self._load_solution_trivial(sim, unit, 'soldot_bulk'))
-            unit_solution.update(self._load_solution_particle(sim, unit, 'soldot_particle'))
-            unit_solution.update(self._load_solution_particle(sim, unit, 'soldot_solid'))
-            unit_solution.update(self._load_solution_trivial(sim, unit, 'soldot_flux'))
-            unit_solution.update(self._load_solution_trivial(sim, unit, 'soldot_volume'))
+            for solution_str, loader in self._unit_loaders(self._SOLUTION_PREFIXES):
+                unit_solution.update(loader(sim, unit, solution_str, **kwargs))
 
             if len(unit_solution) > 0:
                 solution[unit_index].update(unit_solution)
@@ -1977,61 +3145,39 @@ class CadetDLLRunner(CadetRunnerBase):
 
         return solution
 
-    def load_sensitivity(self, sim: "Cadet") -> None:
+    def load_sensitivity(
+            self,
+            sim: "Cadet",
+            path_filter: Optional[PathFilter] = None,
+            ) -> None:
         """Load sensitivity data from simulation results."""
+        if self.sensitivity_layout == 'stacked':
+            self._load_stacked_sensitivities(sim, path_filter)
+            return
+        if self.sensitivity_layout != 'split':
+            raise ValueError(
+                f"Unknown sensitivity layout: {self.sensitivity_layout!r}. "
+                "Use 'split' or 'stacked'."
+            )
+
         sensitivity = addict.Dict()
         nsens = sim.root.input.sensitivity.get('nsens', 0)
+        kwargs = {'path_filter': path_filter}
 
         for sens in range(nsens):
             sens_index = self._get_index_string('param', sens)
+            if not self._may_be_selected(path_filter, f'output/sensitivity/{sens_index}'):
+                continue
 
             for unit in range(self.res.nunits()):
                 unit_sensitivity = addict.Dict()
                 unit_index = self._get_index_string('unit', unit)
+                group = f'output/sensitivity/{sens_index}/{unit_index}'
+                if not self._may_be_selected(path_filter, group):
+                    continue
 
-                unit_sensitivity.update(
-                    self._load_solution_io(sim, unit, 'sens_inlet', sens)
-                )
-                unit_sensitivity.update(
-                    self._load_solution_io(sim, unit, 'sens_outlet', sens)
-                )
-                unit_sensitivity.update(
-                    self._load_solution_trivial(sim, unit, 'sens_bulk', sens)
-                )
-                unit_sensitivity.update(
-                    self._load_solution_particle(sim, unit, 'sens_particle', sens)
-                )
-                unit_sensitivity.update(
-                    self._load_solution_particle(sim, unit, 'sens_solid', sens)
-                )
-                unit_sensitivity.update(
-                    self._load_solution_trivial(sim, unit, 'sens_flux', sens)
-                )
-                unit_sensitivity.update(
-                    self._load_solution_trivial(sim, unit, 'sens_volume', sens)
-                )
-
-                unit_sensitivity.update(
-                    self._load_solution_io(sim, unit, 'sensdot_inlet', sens)
-                )
-                unit_sensitivity.update(
-                    self._load_solution_io(sim, unit, 'sensdot_outlet', sens)
-                )
-                unit_sensitivity.update(
-                    self._load_solution_trivial(sim, unit, 'sensdot_bulk', sens)
-                )
-                unit_sensitivity.update(
-                    self._load_solution_particle(sim, unit, 'sensdot_particle', sens)
-                )
-                unit_sensitivity.update(
-                    self._load_solution_particle(sim, unit, 'sensdot_solid', sens)
-                )
-                unit_sensitivity.update(
-                    self._load_solution_trivial(sim, unit, 'sensdot_flux', sens)
-                )
-                unit_sensitivity.update(
-                    self._load_solution_trivial(sim, unit, 'sensdot_volume', sens)
-                )
+                for solution_str, loader in self._unit_loaders(self._SENSITIVITY_PREFIXES):
+                    unit_sensitivity.update(loader(sim, unit, solution_str, sens, **kwargs))
 
                 if len(unit_sensitivity) > 0:
                     sensitivity[sens_index][unit_index] = unit_sensitivity
@@ -2039,48 +3185,201 @@ class CadetDLLRunner(CadetRunnerBase):
         if len(sensitivity) > 0:
             sim.root.output.sensitivity = sensitivity
 
-    def load_state(self, sim: "Cadet") -> None:
-        """Load last state from simulation results."""
+    def _load_stacked_sensitivities(
+            self,
+            sim: "Cadet",
+            path_filter: Optional[PathFilter] = None,
+            ) -> None:
+        """Load sensitivity tensors of all unit operations from simulation results."""
+        if sim.root.input.sensitivity.get('nsens', 0) == 0:
+            return
+
+        sensitivity = addict.Dict()
+        for unit in range(self.res.nunits()):
+            unit_index = self._get_index_string('unit', unit)
+            if not self._may_be_selected(path_filter, f'output/sensitivity/{unit_index}'):
+                continue
+
+            unit_sensitivity = addict.Dict()
+            for sens_str in self._result_names(self._SENSITIVITY_PREFIXES):
+                unit_sensitivity.update(self._load_stacked_sensitivity(
+                    sim, unit, sens_str, path_filter=path_filter
+                ))
+
+            if len(unit_sensitivity) > 0:
+                sensitivity[unit_index] = unit_sensitivity
+
+        if len(sensitivity) > 0:
+            sim.root.output.sensitivity = sensitivity
+
+    def _load_stacked_sensitivity(
+            self,
+            sim: "Cadet",
+            unitOpId: int,
+            sens_str: str,
+            path_filter: Optional[PathFilter] = None,
+            res: Optional[SimulationResult] = None,
+            ) -> addict.Dict:
+        """Load the sensitivity tensor(s) of one result of a unit operation."""
+        res = res if res is not None else self.res
+        unit_index = self._get_index_string('unit', unitOpId)
+        if not sim.root.input['return'][unit_index].get(f'write_{sens_str}', 0):
+            return addict.Dict()
+
+        group = f'output/sensitivity/{unit_index}'
+        if path_filter is not None and not path_filter.may_match_stem(f'{group}/{sens_str}'):
+            return addict.Dict()
+
+        if sens_str.endswith(('_particle', '_solid')):
+            npartype = res.npartypes(unitOpId)
+            keys = {
+                partype: sens_str if npartype == 1
+                else f"{sens_str}_{self._get_index_string('partype', partype)}"
+                for partype in range(npartype)
+            }
+        else:
+            keys = {None: sens_str}
+
+        sensitivity = addict.Dict()
+        for partype, key in keys.items():
+            if not self._is_selected(path_filter, f'{group}/{key}'):
+                continue
+            data = res.stacked_sensitivity(sens_str, unitOpId, partype)
+            if data is not None:
+                _, tensor, dims = data
+                if self._is_labeled():
+                    tensor = LabeledArray(tensor, dims)
+                sensitivity[key] = tensor
+
+        return sensitivity
+
+    # Loader of each unit operation result, keyed by the suffix of the result name
+    _UNIT_RESULT_LOADERS = {
+        'inlet': '_load_solution_io',
+        'outlet': '_load_solution_io',
+        'bulk': '_load_solution_trivial',
+        'particle': '_load_solution_particle',
+        'solid': '_load_solution_particle',
+        'flux': '_load_solution_trivial',
+        'volume': '_load_solution_trivial',
+    }
+    _SOLUTION_PREFIXES = ('solution', 'soldot')
+    _SENSITIVITY_PREFIXES = ('sens', 'sensdot')
+
+    def _result_names(self, prefixes: tuple[str, ...]) -> list[str]:
+        """List the result names of a unit operation."""
+        return [
+            f'{prefix}_{suffix}'
+            for prefix in prefixes
+            for suffix in self._UNIT_RESULT_LOADERS
+        ]
+
+    def _unit_loaders(self, prefixes: tuple[str, ...]) -> list[tuple[str, Callable]]:
+        """List the result names of a unit operation with their loader methods."""
+        return [
+            (f'{prefix}_{suffix}', getattr(self, loader))
+            for prefix in prefixes
+            for suffix, loader in self._UNIT_RESULT_LOADERS.items()
+        ]
+
+    def load_state(
+            self,
+            sim: "Cadet",
+            path_filter: Optional[PathFilter] = None,
+            units: bool = True,
+            ) -> None:
+        """
+        Load last state from simulation results.
+
+        If `units` is False, the last states of the unit operations are skipped.
+        """
         write_solution_last = sim.root.input['return'].get('write_solution_last', 0)
         if write_solution_last:
-            sim.root.output['last_state_y'] = self.res.last_state_y()
-            sim.root.output['last_state_ydot'] = self.res.last_state_ydot()
+            if self._is_selected(path_filter, 'output/last_state_y'):
+                sim.root.output['last_state_y'] = self.res.last_state_y()
+            if self._is_selected(path_filter, 'output/last_state_ydot'):
+                sim.root.output['last_state_ydot'] = self.res.last_state_ydot()
 
         write_sens_last = sim.root.input['return'].get('write_sens_last', 0)
         if write_sens_last:
             for idx in range(self.res.nsensitivities()):
                 idx_str_y = self._get_index_string('last_state_sensy', idx)
-                sim.root.output[idx_str_y] = self.res.last_state_sens(idx)
+                if self._is_selected(path_filter, f'output/{idx_str_y}'):
+                    sim.root.output[idx_str_y] = self.res.last_state_sens(idx)
                 idx_str_ydot = self._get_index_string('last_state_sensydot', idx)
-                sim.root.output[idx_str_ydot] = self.res.last_state_sensdot(idx)
+                if self._is_selected(path_filter, f'output/{idx_str_ydot}'):
+                    sim.root.output[idx_str_ydot] = self.res.last_state_sensdot(idx)
+
+        if not units:
+            return
 
         solution = sim.root.output.solution
         for unit in range(self.res.nunits()):
             unit_index = self._get_index_string('unit', unit)
-            write_solution_last = sim.root.input['return'][unit_index].get('write_solution_last_unit', 0)
-            if write_solution_last:
-                solution_last_unit = self.res.last_state_y_unit(unit)
-                solution[unit_index]['last_state_y'] = solution_last_unit
-                soldot_last_unit = self.res.last_state_ydot_unit(unit)
-                solution[unit_index]['last_state_ydot'] = soldot_last_unit
+            solution[unit_index].update(self._load_unit_state(sim, unit, path_filter))
+
+    def _load_unit_state(
+            self,
+            sim: "Cadet",
+            unit: int,
+            path_filter: Optional[PathFilter] = None,
+            res: Optional[SimulationResult] = None,
+            ) -> addict.Dict:
+        """Load the last state of a unit operation from simulation results."""
+        res = res if res is not None else self.res
+        state = addict.Dict()
+
+        unit_index = self._get_index_string('unit', unit)
+        group = f'output/solution/{unit_index}'
+        write_solution_last = sim.root.input['return'][unit_index].get('write_solution_last_unit', 0)
+        if write_solution_last:
+            if self._is_selected(path_filter, f'{group}/last_state_y'):
+                state['last_state_y'] = res.last_state_y_unit(unit)
+            if self._is_selected(path_filter, f'{group}/last_state_ydot'):
+                state['last_state_ydot'] = res.last_state_ydot_unit(unit)
+
+        return state
 
     def _checks_if_write_is_true(func):
-        """Decorator to check if unit operation solution should be written out."""
-        def wrapper(self, sim, unitOpId, solution_str, *args, **kwargs):
+        """
+        Decorator to check if unit operation solution should be written out.
+
+        If a `path_filter` is passed, data that cannot be selected is not loaded and
+        keys of the loaded solution that are not selected are dropped.
+        """
+        def wrapper(self, sim, unitOpId, solution_str, *args, path_filter=None, **kwargs):
             unit_index = self._get_index_string('unit', unitOpId)
             write = sim.root.input['return'][unit_index].get(f'write_{solution_str}', 0)
             if not write:
                 return {}
+
+            if path_filter is not None:
+                sensIdx = args[0] if args else kwargs.get('sensIdx')
+                if sensIdx is None:
+                    group = f'output/solution/{unit_index}'
+                else:
+                    sens_index = self._get_index_string('param', sensIdx)
+                    group = f'output/sensitivity/{sens_index}/{unit_index}'
+                if not path_filter.may_match_stem(f'{group}/{solution_str}'):
+                    return {}
+
             solution = func(self, sim, unitOpId, solution_str, *args, **kwargs)
             if solution is None:
                 return {}
+
+            if path_filter is not None:
+                solution = addict.Dict({
+                    key: value for key, value in solution.items()
+                    if path_filter.matches(f'{group}/{key}')
+                })
             return solution
         return wrapper
 
     def _loads_data(func):
         """Decorator to load data from simulation results before processing further."""
-        def wrapper(self, sim, unitOpId, solution_str, sensIdx=None, *args, **kwargs):
-            solution_fun = getattr(self.res, solution_str)
+        def wrapper(self, sim, unitOpId, solution_str, sensIdx=None, *args, res=None, **kwargs):
+            res = res if res is not None else self.res
+            solution_fun = getattr(res, solution_str)
             if sensIdx is None:
                 data = solution_fun(unitOpId)
             else:
@@ -2103,7 +3402,9 @@ class CadetDLLRunner(CadetRunnerBase):
             ) -> addict.Dict:
         """Load trivial solution data from simulation results."""
         solution = addict.Dict()
-        _, out, _ = data
+        _, out, dims = data
+        if self._is_labeled():
+            out = LabeledArray(out, dims)
         solution[solution_str] = out
         return solution
 
@@ -2121,6 +3422,10 @@ class CadetDLLRunner(CadetRunnerBase):
         solution = addict.Dict()
         _, out, dims = data
 
+        if self._is_labeled():
+            solution[solution_str] = LabeledArray(out, dims)
+            return solution
+
         # Retrieve configuration options
         split_components_data = sim.root.input['return'].get('split_components_data', 1)
         split_ports_data = sim.root.input['return'].get('split_ports_data', 1)
@@ -2190,14 +3495,18 @@ class CadetDLLRunner(CadetRunnerBase):
             sim: "Cadet",
             unitOpId: int,
             solution_str: str,
-            sensIdx: Optional[int] = None
+            sensIdx: Optional[int] = None,
+            res: Optional[SimulationResult] = None,
             ) -> addict.Dict:
         """Load particle-related solution data from simulation results."""
+        res = res if res is not None else self.res
         solution = addict.Dict()
-        solution_fun = getattr(self.res, solution_str)
+        solution_fun = getattr(res, solution_str)
 
-        npartype = self.res.npartypes(unitOpId)
+        npartype = res.npartypes(unitOpId)
+        labeled = self._is_labeled()
 
+        loaded = []
         for partype in range(npartype):
             if sensIdx is None:
                 data = solution_fun(unitOpId, partype)
@@ -2208,31 +3517,63 @@ class CadetDLLRunner(CadetRunnerBase):
                 continue
 
             _, out, dims = data
+            if labeled:
+                out = LabeledArray(out, dims)
+            loaded.append((partype, out))
 
-            if npartype == 1:
-                solution[solution_str] = out
-            else:
+        if len(loaded) == 0:
+            return addict.Dict()
+
+        if npartype == 1:
+            solution[solution_str] = loaded[0][1]
+        elif (
+                labeled and len(loaded) == npartype
+                and all(out.shape == loaded[0][1].shape for _, out in loaded)
+        ):
+            # Stack particle types of equal shape behind the time axis
+            dims = list(loaded[0][1].dims)
+            stacked = numpy.stack([numpy.asarray(out) for _, out in loaded], axis=1)
+            solution[solution_str] = LabeledArray(stacked, dims[:1] + ['nParType'] + dims[1:])
+        else:
+            for partype, out in loaded:
                 par_index = self._get_index_string('partype', partype)
                 solution[f'{solution_str}_{par_index}'] = out
 
-        if len(solution) == 0:
-            return addict.Dict()
-
         return solution
 
+    def _is_labeled(self) -> bool:
+        """Check if results are loaded in the labeled layout."""
+        if self.output_layout == 'labeled':
+            return True
+        if self.output_layout != 'split':
+            raise ValueError(
+                f"Unknown output layout: {self.output_layout!r}. "
+                "Use 'split' or 'labeled'."
+            )
+        return False
+
     @staticmethod
     def _get_index_string(prefix, index):
         """Helper method to get string indices (e.g. (unit, 0) -> 'unit_000')."""
         return f'{prefix}_{index:03d}'
 
-    def load_meta(self, sim: "Cadet") -> None:
+    def load_meta(
+            self,
+            sim: "Cadet",
+            path_filter: Optional[PathFilter] = None,
+            ) -> None:
         """Load meta information about CADET."""
-
-        sim.root.meta.cadet_branch = self.cadet_branch
-        sim.root.meta.cadet_commit = self.cadet_commit_hash
-        sim.root.meta.cadet_version = self.cadet_version
-        sim.root.meta.file_format = self.res.file_format()
-        sim.root.meta.time_sim = self.res.time_sim()
+        meta = {
+            'cadet_branch': lambda: self.cadet_branch,
+            'cadet_commit': lambda: self.cadet_commit_hash,
+            'cadet_version': lambda: self.cadet_version,
+            'file_format': self.res.file_format,
+            'time_sim': self.res.time_sim,
+        }
+
+        for key, get_value in meta.items():
+            if self._is_selected(path_filter, f'meta/{key}'):
+                sim.root.meta[key] = get_value()
 
     @property
     def cadet_version(self) -> str:
@@ -2276,11 +3617,18 @@ class CadetDLLRunner(CadetRunnerBase):
                 "To use initialize_simulation Cadet-Core needs to support at least Version 1.1.0a2"
             )
 
-        pp = cadet_dll_parameterprovider.PARAMETERPROVIDER(sim)
+        pp = self._create_parameter_provider(sim)
 
         log_buffer = self.setup_log_buffer()
 
-        returncode = self._api.initializeSimulation(self._driver, ctypes.byref(pp))
+        driver = self._acquire_driver()
+        try:
+            returncode = self._api.initializeSimulation(driver, ctypes.byref(pp))
+        finally:
+            pp.close()
+
+        # The driver is only clean again once the stepwise simulation is ended
+        self._driver_reusable = False
 
         if returncode != 0:
             log = ""
@@ -2323,7 +3671,8 @@ class CadetDLLRunner(CadetRunnerBase):
 
         t_reached = ctypes.c_double(0.0)
 
-        returncode = self._api.performSimulationStep( self._driver, ctypes.c_double(t_end), ctypes.byref(t_reached))
+        driver = self._acquire_driver()
+        returncode = self._api.performSimulationStep( driver, ctypes.c_double(t_end), ctypes.byref(t_reached))
 
         if returncode != 0:
             log = ""
@@ -2332,7 +3681,7 @@ class CadetDLLRunner(CadetRunnerBase):
             log = log_buffer.getvalue()
             error_message = ""
 
-        self.res = SimulationResult(self._api, self._driver)
+        self.res = SimulationResult(self._api, driver)
 
         return_info = ReturnInformation(
             return_code=returncode,
@@ -2342,6 +3691,110 @@ class CadetDLLRunner(CadetRunnerBase):
 
         return return_info, t_reached.value
 
+    def iterate_steps(
+            self,
+            sim: "Cadet",
+            times: Iterable[float],
+            outputs: Optional[list[str]] = None,
+            ) -> Iterator[SimulationStep]:
+        """
+        Simulate stepwise and yield the data recorded during each step.
+
+        The simulation is initialized before the first step and ended when the
+        generator is exhausted or closed. Only the time points appended by a step are
+        copied out of the driver, so the cost of a step does not grow with the length
+        of the recorded history.
+
+        Parameters
+        ----------
+        sim : Cadet
+            Simulation object containing input data.
+        times : Iterable[float]
+            End times of the steps.
+        outputs : Optional[list[str]]
+            Outputs to yield, as `'unit_XXX/<solution>'`, e.g.
+            `'unit_001/solution_outlet'`. The solution must be recorded by the
+            solution recorder (see `input.return`).
+
+        Raises
+        ------
+        ValueError
+            If an output is not of the form `'unit_XXX/<solution>'`. Raised when
+            called, before the simulation is initialized.
+        RuntimeError
+            If the simulation cannot be initialized. Raised by the first step.
+
+        Returns
+        -------
+        Iterator[SimulationStep]
+            Generator yielding the results of each step. Iteration stops after a
+            failed step.
+        """
+        getters = [self._parse_step_output(output) for output in outputs or []]
+        return self._iterate_steps(sim, times, getters)
+
+    def _iterate_steps(
+            self,
+            sim: "Cadet",
+            times: Iterable[float],
+            getters: list[tuple[str, int, str]],
+            ) -> Iterator[SimulationStep]:
+        """Generator of `iterate_steps` for outputs parsed by `_parse_step_output`."""
+        return_information = self.initialize_simulation(sim)
+        if return_information.return_code != 0:
+            self.end_simulation()
+            raise RuntimeError(
+                f"Failed to initialize simulation:\n{return_information.error_message}"
+            )
+
+        try:
+            n_recorded = 0
+            for t_end in times:
+                return_information, t_reached = self.perform_simulation_step(t_end)
+
+                solution_times = self.res.solution_times(own_data=False)
+                if solution_times is None:
+                    solution_times = numpy.empty((0, ))
+
+                step_outputs = {}
+                for output, unit, solution_str in getters:
+                    solution = getattr(self.res, solution_str)(unit, own_data=False)
+                    if solution is None:
+                        step_outputs[output] = None
+                    else:
+                        step_outputs[output] = solution[1][n_recorded:].copy()
+
+                time = solution_times[n_recorded:].copy()
+                n_recorded = len(solution_times)
+
+                yield SimulationStep(
+                    return_information=return_information,
+                    t_reached=t_reached,
+                    time=time,
+                    outputs=step_outputs,
+                )
+
+                if return_information.return_code != 0:
+                    break
+        finally:
+            self.end_simulation()
+
+    @staticmethod
+    def _parse_step_output(output: str) -> tuple[str, int, str]:
+        """Split an output of `iterate_steps` into unit index and solution getter."""
+        unit_str, _, solution_str = output.strip('/').partition('/')
+        prefix, _, index = unit_str.partition('_')
+        if (
+                prefix != 'unit' or not index.isdigit()
+                or not solution_str.startswith(('solution_', 'soldot_'))
+                or solution_str == 'solution_times'
+                or not hasattr(SimulationResult, solution_str)):
+            raise ValueError(
+                f"Invalid output {output!r}. Expected 'unit_XXX/<solution>', "
+                "e.g. 'unit_001/solution_outlet'."
+            )
+        return output, int(index), solution_str
+
     def end_simulation(self) -> ReturnInformation:
         if self._cadet_capi_version < Version("1.1.0a2"):
             raise RuntimeError(
@@ -2349,6 +3802,7 @@ class CadetDLLRunner(CadetRunnerBase):
                 "To use end_simulation Cadet-Core needs to support at least Version 1.1.0a2"
             )
 
-        returncode = self._api.endSimulation(self._driver)
+        returncode = self._api.endSimulation(self._acquire_driver())
+        self._driver_reusable = returncode == 0
 
         return returncode
\ No newline at end of file
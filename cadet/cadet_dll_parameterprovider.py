@@ -1,7 +1,11 @@
 import ctypes
+import threading
+import time
 import cadet.cadet_dll_utils as utils
 import addict
-from typing import Any, Dict, Optional, Union
+import h5py
+import numpy as np
+from typing import Any, Callable, Dict, Optional, Union
 
 
 c_cadet_result = ctypes.c_int
@@ -28,6 +32,28 @@ class NestedDictReader:
         self._root = data
         self._cursor = [data]
         self.buffer: Optional[Any] = None
+        self._buffers: list[Any] = []
+
+    def keep(self, value: Any) -> Any:
+        """
+        Keep a value alive for the lifetime of the reader.
+
+        Memory handed out to CADET (e.g. strings) must stay valid after the callback
+        returns, even if other callbacks are invoked before it is copied.
+
+        Parameters
+        ----------
+        value : Any
+            The value to keep.
+
+        Returns
+        -------
+        Any
+            The value.
+        """
+        self._buffers.append(value)
+        self.buffer = value
+        return value
 
     def push_scope(self, scope: str) -> bool:
         """
@@ -69,6 +95,310 @@ class NestedDictReader:
         return self._cursor[-1]
 
 
+class CompiledParameter:
+    """
+    Pre-typed value of a single parameter of the simulation input.
+
+    Numeric values are converted once into a contiguous double array with a ctypes
+    pointer, string values into a list of bytes. The int32 and uint8 (bool)
+    representations and the `char*` array of strings are created on first request
+    and cached.
+
+    Parameters
+    ----------
+    value : Any
+        The parameter value, i.e. a scalar, string, list or NumPy array.
+    """
+
+    __slots__ = (
+        'is_array', 'n_elements', 'doubles', 'double_pointer',
+        '_ints', '_int_pointer', '_bools', '_bool_pointer',
+        'strings', '_string_array',
+    )
+
+    def __init__(self, value: Any) -> None:
+        self.is_array = isinstance(value, (list, np.ndarray))
+        if isinstance(value, list):
+            self.n_elements = len(value)
+        elif isinstance(value, np.ndarray):
+            self.n_elements = value.size
+        else:
+            self.n_elements = 1
+
+        self.doubles: Optional[np.ndarray] = None
+        self.double_pointer = None
+        self._ints: Optional[np.ndarray] = None
+        self._int_pointer = None
+        self._bools: Optional[np.ndarray] = None
+        self._bool_pointer = None
+        self.strings: Optional[list[bytes]] = None
+        self._string_array = None
+
+        if self._is_string(value):
+            self.strings = self._to_bytes(value)
+            return
+
+        try:
+            doubles = np.ascontiguousarray(value, dtype=np.double).ravel()
+        except (TypeError, ValueError):
+            return
+        self.doubles = doubles
+        self.double_pointer = doubles.ctypes.data_as(ctypes.POINTER(ctypes.c_double))
+
+    @staticmethod
+    def _is_string(value: Any) -> bool:
+        if isinstance(value, (str, bytes)):
+            return True
+        if isinstance(value, np.ndarray):
+            return value.dtype.kind in 'SUO' and value.size > 0 \
+                and isinstance(value.flat[0], (str, bytes))
+        if isinstance(value, list):
+            return len(value) > 0 and isinstance(value[0], (str, bytes))
+        return False
+
+    @staticmethod
+    def _to_bytes(value: Any) -> list[bytes]:
+        if isinstance(value, (str, bytes)):
+            value = [value]
+        elif isinstance(value, np.ndarray):
+            value = value.ravel().tolist()
+        return [item.encode('utf-8') if isinstance(item, str) else item for item in value]
+
+    def assign(self, value: Any) -> bool:
+        """
+        Overwrite the value in place, keeping the preallocated buffers.
+
+        Parameters
+        ----------
+        value : Any
+            The new value. Must be numeric and have as many elements as the current
+            value.
+
+        Returns
+        -------
+        bool
+            True if the value was assigned, False if it does not fit the buffers and a
+            new `CompiledParameter` has to be created instead.
+        """
+        if self.doubles is None or self._is_string(value):
+            return False
+
+        try:
+            doubles = np.asarray(value, dtype=np.double)
+        except (TypeError, ValueError):
+            return False
+        if doubles.size != self.doubles.size:
+            return False
+
+        self.doubles[...] = doubles.ravel()
+        if self._ints is not None:
+            self._ints[...] = self.doubles
+        if self._bools is not None:
+            self._bools[...] = self.doubles
+        self.is_array = isinstance(value, (list, np.ndarray))
+        return True
+
+    @property
+    def ints(self) -> Optional[np.ndarray]:
+        """Optional[np.ndarray]: The value as contiguous int32 array."""
+        if self._ints is None and self.doubles is not None:
+            self._ints = self.doubles.astype(np.int32)
+            self._int_pointer = self._ints.ctypes.data_as(ctypes.POINTER(ctypes.c_int))
+        return self._ints
+
+    @property
+    def int_pointer(self):
+        """ctypes.POINTER(ctypes.c_int): Pointer to the int32 array."""
+        if self.ints is None:
+            return None
+        return self._int_pointer
+
+    @property
+    def bools(self) -> Optional[np.ndarray]:
+        """Optional[np.ndarray]: The value as contiguous uint8 array."""
+        if self._bools is None and self.doubles is not None:
+            self._bools = self.doubles.astype(np.uint8)
+            self._bool_pointer = self._bools.ctypes.data_as(ctypes.POINTER(ctypes.c_uint8))
+        return self._bools
+
+    @property
+    def bool_pointer(self):
+        """ctypes.POINTER(ctypes.c_uint8): Pointer to the uint8 array."""
+        if self.bools is None:
+            return None
+        return self._bool_pointer
+
+    @property
+    def string_pointer(self):
+        """ctypes.POINTER(ctypes.c_char_p): Pointer to the array of strings."""
+        if self.strings is None:
+            return None
+        if self._string_array is None:
+            self._string_array = (ctypes.c_char_p * len(self.strings))(*self.strings)
+        return ctypes.cast(self._string_array, ctypes.POINTER(ctypes.c_char_p))
+
+
+class CompiledInput:
+    """
+    Flat, pre-typed table of the simulation input for the compiled parameter provider.
+
+    The input tree is walked once. Every scope is stored under its path (e.g.
+    `b'model/unit_000'`) as a table that maps parameter names, as `bytes` in the
+    spelling requested by CADET (upper case for parameters), to `CompiledParameter`
+    entries and sub-scope names to the tables of the sub-scopes.
+
+    Parameters
+    ----------
+    data : dict
+        The input tree, i.e. `sim.root.input`.
+    """
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        self.scopes: dict[bytes, dict[bytes, Any]] = {}
+        root = self._compile(data, b'')
+        self._cursor = [root]
+
+    def _compile(self, data: Dict[str, Any], path: bytes) -> dict[bytes, Any]:
+        """Compile the scope at `path` and all of its sub-scopes."""
+        table = {}
+        self.scopes[path] = table
+        for key, item in data.items():
+            if isinstance(item, dict):
+                name = key.encode('utf-8')
+                sub_path = path + b'/' + name if path else name
+                table[name] = _Scope(self._compile(item, sub_path))
+            else:
+                table[str.upper(key).encode('utf-8')] = CompiledParameter(item)
+        return table
+
+    def reset(self) -> None:
+        """
+        Return to the root scope.
+        """
+        del self._cursor[1:]
+
+    def patch(self, path: str, value: Any) -> None:
+        """
+        Set the value of a parameter.
+
+        Numeric values of unchanged size are written into the existing buffers, so
+        pointers handed out before remain valid. Other values replace the entry.
+
+        Parameters
+        ----------
+        path : str
+            Path of the parameter relative to the input, e.g.
+            `'model/unit_001/col_porosity'`.
+        value : Any
+            The new value.
+
+        Raises
+        ------
+        KeyError
+            If the scope of the parameter does not exist.
+        """
+        scope, _, key = path.strip('/').rpartition('/')
+        table = self.scopes[scope.encode('utf-8')]
+        name = str.upper(key).encode('utf-8')
+
+        entry = table.get(name)
+        if isinstance(entry, CompiledParameter) and entry.assign(value):
+            return
+        table[name] = CompiledParameter(value)
+
+    def detach(self, path: str) -> None:
+        """
+        Copy the buffer of an array parameter that is shared with the input.
+
+        Numeric arrays are compiled without copying them, so patching them in place
+        would also modify the input. Parameters that are not compiled are ignored.
+
+        Parameters
+        ----------
+        path : str
+            Path of the parameter relative to the input, e.g.
+            `'model/unit_001/init_c'`.
+
+        Raises
+        ------
+        KeyError
+            If the scope of the parameter does not exist.
+        """
+        scope, _, key = path.strip('/').rpartition('/')
+        table = self.scopes[scope.encode('utf-8')]
+        name = str.upper(key).encode('utf-8')
+
+        entry = table.get(name)
+        if isinstance(entry, CompiledParameter) and entry.is_array and entry.doubles is not None:
+            table[name] = CompiledParameter(entry.doubles.copy())
+
+    def push_scope(self, scope: bytes) -> bool:
+        """
+        Enter a nested scope.
+
+        Parameters
+        ----------
+        scope : bytes
+            The name of the nested scope.
+
+        Returns
+        -------
+        bool
+            True if the scope exists and was entered, otherwise False.
+        """
+        entry = self._cursor[-1].get(scope)
+        if not isinstance(entry, _Scope):
+            return False
+        self._cursor.append(entry.table)
+        return True
+
+    def pop_scope(self) -> None:
+        """
+        Exit the current scope.
+        """
+        if len(self._cursor) > 1:
+            self._cursor.pop()
+
+    def current(self) -> dict[bytes, Any]:
+        """
+        Get the table of the current scope.
+
+        Returns
+        -------
+        dict[bytes, Any]
+            The entries of the current scope.
+        """
+        return self._cursor[-1]
+
+    def get(self, name: bytes) -> Optional[CompiledParameter]:
+        """
+        Get a parameter of the current scope.
+
+        Parameters
+        ----------
+        name : bytes
+            The name of the parameter.
+
+        Returns
+        -------
+        Optional[CompiledParameter]
+            The parameter, or None if it does not exist or names a scope.
+        """
+        entry = self._cursor[-1].get(name)
+        if isinstance(entry, CompiledParameter):
+            return entry
+        return None
+
+
+class _Scope:
+    """Entry of a sub-scope in a `CompiledInput` table."""
+
+    __slots__ = ('table', )
+
+    def __init__(self, table: dict[bytes, Any]) -> None:
+        self.table = table
+
+
 def recursively_convert_dict(data: Dict[str, Any]) -> addict.Dict:
     """
     Recursively convert dictionary keys to uppercase while preserving nested structure.
@@ -104,33 +434,62 @@ class PARAMETERPROVIDER(ctypes.Structure):
     ----------
     simulation : Cadet
         The simulation object containing the input data.
+    trace : Optional[ParameterTrace]
+        If given, every callback records the accessed parameter in the trace.
     """
 
-    def __init__(self, simulation: "Cadet") -> None:
+    # Python implementation of each callback, in the order of `_fields_[1:]`
+    _callbacks = (
+        utils.param_provider_get_double,
+        utils.param_provider_get_int,
+        utils.param_provider_get_bool,
+        utils.param_provider_get_string,
+
+        utils.param_provider_get_double_array,
+        utils.param_provider_get_int_array,
+        utils.param_provider_get_bool_array,
+        utils.param_provider_get_string_array,
+
+        utils.param_provider_get_double_array_item,
+        utils.param_provider_get_int_array_item,
+        utils.param_provider_get_bool_array_item,
+        utils.param_provider_get_string_array_item,
+
+        utils.param_provider_exists,
+        utils.param_provider_is_array,
+        utils.param_provider_num_elements,
+        utils.param_provider_push_scope,
+        utils.param_provider_pop_scope,
+    )
+
+    def __init__(
+            self,
+            simulation: "Cadet",
+            trace: Optional["ParameterTrace"] = None,
+            ) -> None:
         sim_input = recursively_convert_dict(simulation.root.input)
         self.userData = NestedDictReader(sim_input)
+        self._set_callbacks(trace)
 
-        # Assign function pointers at instance level
-        self.getDouble = self._fields_[1][1](utils.param_provider_get_double)
-        self.getInt = self._fields_[2][1](utils.param_provider_get_int)
-        self.getBool = self._fields_[3][1](utils.param_provider_get_bool)
-        self.getString = self._fields_[4][1](utils.param_provider_get_string)
-
-        self.getDoubleArray = self._fields_[5][1](utils.param_provider_get_double_array)
-        self.getIntArray = self._fields_[6][1](utils.param_provider_get_int_array)
-        self.getBoolArray = ctypes.cast(None, self._fields_[7][1])
-        self.getStringArray = ctypes.cast(None, self._fields_[8][1])
+    def _set_callbacks(self, trace: Optional["ParameterTrace"] = None) -> None:
+        """
+        Assign the function pointers at instance level.
 
-        self.getDoubleArrayItem = self._fields_[9][1](utils.param_provider_get_double_array_item)
-        self.getIntArrayItem = self._fields_[10][1](utils.param_provider_get_int_array_item)
-        self.getBoolArrayItem = self._fields_[11][1](utils.param_provider_get_bool_array_item)
-        self.getStringArrayItem = self._fields_[12][1](utils.param_provider_get_string_array_item)
+        Parameters
+        ----------
+        trace : Optional[ParameterTrace]
+            If given, the callbacks record each access in the trace.
+        """
+        for (name, prototype), callback in zip(self._fields_[1:], self._callbacks):
+            if trace is not None:
+                callback = trace.wrap(name, callback)
+            setattr(self, name, prototype(callback))
 
-        self.exists = self._fields_[13][1](utils.param_provider_exists)
-        self.isArray = self._fields_[14][1](utils.param_provider_is_array)
-        self.numElements = self._fields_[15][1](utils.param_provider_num_elements)
-        self.pushScope = self._fields_[16][1](utils.param_provider_push_scope)
-        self.popScope = self._fields_[17][1](utils.param_provider_pop_scope)
+    def close(self) -> None:
+        """
+        Release the resources held by the provider after the simulation is configured.
+        """
+        pass
 
     _fields_ = [
         # 0 (Position must match indices in __init__ method.)
@@ -161,3 +520,439 @@ class PARAMETERPROVIDER(ctypes.Structure):
         ('pushScope', ctypes.CFUNCTYPE(c_cadet_result, ctypes.py_object, ctypes.c_char_p)),
         ('popScope', ctypes.CFUNCTYPE(c_cadet_result, ctypes.py_object)),
     ]
+
+
+class CompiledParameterProvider(PARAMETERPROVIDER):
+    """
+    Parameter provider backed by a flat, pre-typed table of the simulation input.
+
+    In contrast to `PARAMETERPROVIDER`, the input tree is not deep-copied into a
+    nested dictionary. It is compiled once into a `CompiledInput`. The callbacks look
+    up the `bytes` names passed by CADET directly and hand out preallocated buffers,
+    so no decoding or conversion is done while CADET configures the simulation.
+
+    Parameters
+    ----------
+    simulation : Cadet
+        The simulation object containing the input data.
+    trace : Optional[ParameterTrace]
+        If given, every callback records the accessed parameter in the trace.
+    """
+
+    _callbacks = (
+        utils.compiled_provider_get_double,
+        utils.compiled_provider_get_int,
+        utils.compiled_provider_get_bool,
+        utils.compiled_provider_get_string,
+
+        utils.compiled_provider_get_double_array,
+        utils.compiled_provider_get_int_array,
+        utils.compiled_provider_get_bool_array,
+        utils.compiled_provider_get_string_array,
+
+        utils.compiled_provider_get_double_array_item,
+        utils.compiled_provider_get_int_array_item,
+        utils.compiled_provider_get_bool_array_item,
+        utils.compiled_provider_get_string_array_item,
+
+        utils.compiled_provider_exists,
+        utils.compiled_provider_is_array,
+        utils.compiled_provider_num_elements,
+        utils.compiled_provider_push_scope,
+        utils.param_provider_pop_scope,
+    )
+
+    def __init__(
+            self,
+            simulation: "Cadet",
+            trace: Optional["ParameterTrace"] = None,
+            ) -> None:
+        self.userData = self._create_reader(simulation)
+        self._set_callbacks(trace)
+
+    def _create_reader(self, simulation: "Cadet") -> "CompiledInput":
+        """Compile the input of the simulation."""
+        return CompiledInput(simulation.root.input)
+
+
+class BoundParameters:
+    """
+    Parameters of a simulation bound to a persistent parameter provider.
+
+    The provider is compiled once from the simulation input. Setting values only
+    patches the bound parameters in the provider and in the simulation input, so the
+    simulation can be rerun without rebuilding the provider.
+
+    Parameters
+    ----------
+    simulation : Cadet
+        The simulation object containing the input data.
+    paths : list[str]
+        Paths of the varied parameters relative to the input, e.g.
+        `'model/unit_001/col_porosity'`.
+
+    Raises
+    ------
+    KeyError
+        If the scope of a parameter does not exist in the simulation input.
+    """
+
+    def __init__(self, simulation: "Cadet", paths: list[str]) -> None:
+        self.simulation = simulation
+        self.paths = [path.strip('/') for path in paths]
+        self.provider = CompiledParameterProvider(simulation)
+
+        self._nodes = []
+        for path in self.paths:
+            keys = path.split('/')
+            node = simulation.root.input
+            for key in keys[:-1]:
+                if key not in node:
+                    raise KeyError(f"Scope of parameter {path} does not exist.")
+                node = node[key]
+            self._nodes.append((node, keys[-1]))
+            # Bound values are patched in place, which must not modify the input
+            self.provider.userData.detach(path)
+
+    def set_values(self, values: Union[dict[str, Any], list[Any]]) -> None:
+        """
+        Set the values of the bound parameters.
+
+        Parameters
+        ----------
+        values : Union[dict[str, Any], list[Any]]
+            The new values, either in the order of `paths` or as a dictionary mapping
+            (a subset of) the bound paths to values.
+
+        Raises
+        ------
+        KeyError
+            If a path is not bound.
+        ValueError
+            If the number of values does not match the number of bound parameters.
+        """
+        if isinstance(values, dict):
+            indices = {path: i for i, path in enumerate(self.paths)}
+            items = []
+            for path, value in values.items():
+                index = indices.get(path.strip('/'))
+                if index is None:
+                    raise KeyError(f"Parameter {path} is not bound.")
+                items.append((index, value))
+        else:
+            if len(values) != len(self.paths):
+                raise ValueError(
+                    f"Expected {len(self.paths)} values, got {len(values)}."
+                )
+            items = enumerate(values)
+
+        compiled = self.provider.userData
+        for index, value in items:
+            node, key = self._nodes[index]
+            node[key] = value
+            compiled.patch(self.paths[index], value)
+
+    def get_provider(self) -> CompiledParameterProvider:
+        """
+        Get the provider, reset to the root scope of the input.
+
+        Returns
+        -------
+        CompiledParameterProvider
+            The persistent parameter provider.
+        """
+        self.provider.userData.reset()
+        return self.provider
+
+
+class H5InputReader:
+    """
+    Reader serving the parameter provider callbacks directly from an HDF5 group.
+
+    Scopes map to subgroups. Datasets are only read when CADET requests them and are
+    converted into a `CompiledParameter`, which is cached until the reader is closed
+    so the buffers handed to CADET stay valid.
+
+    Parameters
+    ----------
+    group : h5py.Group
+        The input group, usually `/input` of a CADET file.
+    """
+
+    def __init__(self, group: h5py.Group) -> None:
+        self._cursor = [group]
+        self._cache: dict[tuple[str, bytes], CompiledParameter] = {}
+
+    def reset(self) -> None:
+        """
+        Return to the root scope.
+        """
+        del self._cursor[1:]
+
+    def push_scope(self, scope: bytes) -> bool:
+        """
+        Enter a subgroup.
+
+        Parameters
+        ----------
+        scope : bytes
+            The name of the subgroup.
+
+        Returns
+        -------
+        bool
+            True if the subgroup exists and was entered, otherwise False.
+        """
+        item = self._cursor[-1].get(scope)
+        if not isinstance(item, h5py.Group):
+            return False
+        self._cursor.append(item)
+        return True
+
+    def pop_scope(self) -> None:
+        """
+        Exit the current subgroup.
+        """
+        if len(self._cursor) > 1:
+            self._cursor.pop()
+
+    def current(self) -> h5py.Group:
+        """
+        Get the group of the current scope.
+
+        Returns
+        -------
+        h5py.Group
+            The current group.
+        """
+        return self._cursor[-1]
+
+    def get(self, name: bytes) -> Optional[CompiledParameter]:
+        """
+        Read a dataset of the current group.
+
+        Parameters
+        ----------
+        name : bytes
+            The name of the dataset.
+
+        Returns
+        -------
+        Optional[CompiledParameter]
+            The parameter, or None if it does not exist or names a group.
+        """
+        group = self._cursor[-1]
+        key = (group.name, name)
+        entry = self._cache.get(key)
+        if entry is None:
+            item = group.get(name)
+            if not isinstance(item, h5py.Dataset):
+                return None
+            entry = CompiledParameter(item[()])
+            self._cache[key] = entry
+        return entry
+
+    def close(self) -> None:
+        """
+        Drop the cached parameters.
+        """
+        self._cache.clear()
+        self.reset()
+
+
+class H5ParameterProvider(CompiledParameterProvider):
+    """
+    Parameter provider reading the input directly from the HDF5 file of a simulation.
+
+    The `/input` group of `simulation.filename` is opened read-only and served to
+    CADET without materializing the input tree in Python. Datasets are read on
+    demand. The file is closed by `close`.
+
+    Parameters
+    ----------
+    simulation : Cadet
+        The simulation object whose file contains the input data.
+    trace : Optional[ParameterTrace]
+        If given, every callback records the accessed parameter in the trace.
+    """
+
+    def _create_reader(self, simulation: "Cadet") -> H5InputReader:
+        """Open the input group of the simulation file."""
+        self._h5file = h5py.File(simulation.filename, 'r')
+        try:
+            return H5InputReader(self._h5file['input'])
+        except KeyError:
+            self._h5file.close()
+            raise
+
+    def close(self) -> None:
+        """
+        Close the simulation file.
+        """
+        self.userData.close()
+        self._h5file.close()
+
+
+class ParameterTrace:
+    """
+    Record of the parameters CADET reads through a parameter provider.
+
+    Pass the trace to a provider (or set `CadetDLLRunner.parameter_trace`) to record
+    the path of every parameter and scope accessed by CADET, with the number of
+    callbacks and the time spent in Python for each. Traces accumulate over runs.
+
+    Paths are relative to the input. Scopes are spelled as in the input (e.g.
+    `'model/unit_000'`), parameters as requested by CADET (e.g.
+    `'model/unit_000/COL_POROSITY'`). Queries of missing parameters are recorded as
+    well.
+
+    Attributes
+    ----------
+    counts : dict[str, int]
+        Number of callbacks per path.
+    times : dict[str, int]
+        Time spent in the callbacks per path, in nanoseconds.
+    """
+
+    def __init__(self) -> None:
+        self.counts: dict[str, int] = {}
+        self.times: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _scopes(self) -> list[str]:
+        """Get the scope stack of the provider being traced in the current thread."""
+        scopes = getattr(self._local, 'scopes', None)
+        if scopes is None:
+            scopes = self._local.scopes = []
+        return scopes
+
+    def _record(self, path: str, elapsed: int) -> None:
+        with self._lock:
+            self.counts[path] = self.counts.get(path, 0) + 1
+            self.times[path] = self.times.get(path, 0) + elapsed
+
+    def wrap(self, name: str, callback: Callable) -> Callable:
+        """
+        Wrap a parameter provider callback to record its accesses.
+
+        Parameters
+        ----------
+        name : str
+            Name of the callback in the provider, e.g. `'getDouble'`.
+        callback : Callable
+            The callback.
+
+        Returns
+        -------
+        Callable
+            The recording callback.
+        """
+        if name == 'popScope':
+            def traced(reader):
+                start = time.perf_counter_ns()
+                result = callback(reader)
+                elapsed = time.perf_counter_ns() - start
+                scopes = self._scopes()
+                if scopes:
+                    self._record('/'.join(scopes), elapsed)
+                    scopes.pop()
+                return result
+        elif name == 'pushScope':
+            def traced(reader, scope):
+                start = time.perf_counter_ns()
+                result = callback(reader, scope)
+                elapsed = time.perf_counter_ns() - start
+                scopes = self._scopes()
+                scope = scope.decode('utf-8')
+                self._record('/'.join(scopes + [scope]), elapsed)
+                if result == 0:
+                    scopes.append(scope)
+                return result
+        else:
+            def traced(reader, parameter, *args):
+                start = time.perf_counter_ns()
+                result = callback(reader, parameter, *args)
+                elapsed = time.perf_counter_ns() - start
+                self._record('/'.join(self._scopes() + [parameter.decode('utf-8')]), elapsed)
+                return result
+
+        return traced
+
+    def reset(self) -> None:
+        """
+        Discard all recorded accesses.
+        """
+        with self._lock:
+            self.counts.clear()
+            self.times.clear()
+        self._local = threading.local()
+
+    @property
+    def total_time(self) -> int:
+        """int: Total time spent in the callbacks, in nanoseconds."""
+        return sum(self.times.values())
+
+    def summary(self) -> list[tuple[str, int, int]]:
+        """
+        Summarize the recorded accesses.
+
+        Returns
+        -------
+        list[tuple[str, int, int]]
+            Path, number of callbacks and time in nanoseconds per path, most
+            expensive first.
+        """
+        return sorted(
+            ((path, count, self.times[path]) for path, count in self.counts.items()),
+            key=lambda item: item[2],
+            reverse=True,
+        )
+
+    def prune(
+            self,
+            data: Dict[str, Any],
+            keep: Optional[list[str]] = None,
+            ) -> addict.Dict:
+        """
+        Create a minimal copy of an input tree containing only the accessed entries.
+
+        Parameters are matched case-insensitively. Entered scopes are kept even if no
+        parameter in them was read, so CADET takes the same code paths with the
+        pruned input. Values are not copied.
+
+        Parameters
+        ----------
+        data : dict
+            The input tree, i.e. `sim.root.input`, that was traced.
+        keep : Optional[list[str]]
+            Paths of scopes or parameters to keep completely, e.g. `['return']` since
+            the flags in `input.return` are also read when the results are loaded.
+
+        Returns
+        -------
+        addict.Dict
+            The pruned input tree.
+        """
+        accessed = set(self.counts)
+        keep = {path.strip('/').lower() for path in keep or []}
+        return self._prune(data, '', accessed, keep)
+
+    def _prune(
+            self,
+            data: Dict[str, Any],
+            prefix: str,
+            accessed: set[str],
+            keep: set[str],
+            ) -> addict.Dict:
+        pruned = addict.Dict()
+        for key, item in data.items():
+            if (prefix + key).lower() in keep:
+                pruned[key] = item
+            elif isinstance(item, dict):
+                path = prefix + key
+                if path in accessed or any(k.startswith(path.lower() + '/') for k in keep):
+                    pruned[key] = self._prune(item, path + '/', accessed, keep)
+            elif prefix + str.upper(key) in accessed:
+                pruned[key] = item
+        return pruned
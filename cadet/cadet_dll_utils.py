@@ -176,8 +176,7 @@ def param_provider_get_string(
     elif hasattr(o[0], 'decode'):
         bytes_val = o[0]
 
-    reader.buffer = bytes_val
-    val[0] = ctypes.cast(reader.buffer, ctypes.c_char_p)
+    val[0] = ctypes.cast(reader.keep(bytes_val), ctypes.c_char_p)
     return 0
 
 
@@ -269,24 +268,154 @@ def param_provider_get_int_array(
 
     o = c[n]
 
-    # Ensure object is a properly aligned numpy array
-    if isinstance(o, list):  # Convert lists to numpy arrays
-        o = np.array(o, dtype=np.double)
-        c[n] = o  # Update the reader's storage
-
-    # Validate the array
-    if not isinstance(o, np.ndarray) or o.dtype != np.int32 or not o.flags.c_contiguous:
-        log_print(f"Error: Parameter {n} is not a contiguous int array.")
+    # Convert to a contiguous int32 array, kept alive by the reader
+    try:
+        o = reader.keep(np.ascontiguousarray(o, dtype=np.int32))
+    except (TypeError, ValueError):
+        log_print(f"Error: Parameter {n} is not an int array.")
         return -1
 
     # Provide array data to the caller
     n_elem[0] = ctypes.c_int(o.size)
-    val[0] = np.ctypeslib.as_ctypes(o)
+    val[0] = o.ctypes.data_as(ctypes.POINTER(ctypes.c_int))
 
     log_print(f"GET array [int] {n}: {o}")
     return 0
 
 
+def param_provider_get_bool_array(
+        reader: Any,
+        name: ctypes.c_char_p,
+        n_elem: ctypes.POINTER(ctypes.c_int),
+        val: ctypes.POINTER(ctypes.POINTER(ctypes.c_uint8))
+        ) -> int:
+    """
+    Retrieve a boolean array from the reader based on the provided name.
+
+    Parameters
+    ----------
+    reader : Any
+        The reader object containing the current data scope.
+    name : ctypes.c_char_p
+        The name of the parameter to retrieve.
+    n_elem : ctypes.POINTER(ctypes.c_int)
+        A pointer to store the number of elements in the array.
+    val : ctypes.POINTER(ctypes.POINTER(ctypes.c_uint8))
+        A pointer to store the retrieved array.
+
+    Returns
+    -------
+    int
+        0 if the array was found and retrieved successfully, -1 otherwise.
+    """
+    n = name.decode('utf-8')
+    c = reader.current()
+
+    if n not in c:
+        log_print(f"Parameter {n} not found.")
+        return -1
+
+    o = c[n]
+
+    # Convert to a contiguous uint8 array, kept alive by the reader
+    try:
+        o = reader.keep(np.ascontiguousarray(o, dtype=np.uint8))
+    except (TypeError, ValueError):
+        log_print(f"Error: Parameter {n} is not a bool array.")
+        return -1
+
+    n_elem[0] = ctypes.c_int(o.size)
+    val[0] = o.ctypes.data_as(ctypes.POINTER(ctypes.c_uint8))
+
+    log_print(f"GET array [bool] {n}: {o}")
+    return 0
+
+
+def param_provider_get_string_array(
+        reader: Any,
+        name: ctypes.c_char_p,
+        n_elem: ctypes.POINTER(ctypes.c_int),
+        val: ctypes.POINTER(ctypes.POINTER(ctypes.c_char_p))
+        ) -> int:
+    """
+    Retrieve a string array from the reader based on the provided name.
+
+    Parameters
+    ----------
+    reader : Any
+        The reader object containing the current data scope.
+    name : ctypes.c_char_p
+        The name of the parameter to retrieve.
+    n_elem : ctypes.POINTER(ctypes.c_int)
+        A pointer to store the number of elements in the array.
+    val : ctypes.POINTER(ctypes.POINTER(ctypes.c_char_p))
+        A pointer to store the retrieved array of strings.
+
+    Returns
+    -------
+    int
+        0 if the array was found and retrieved successfully, -1 otherwise.
+    """
+    n = name.decode('utf-8')
+    c = reader.current()
+
+    if n not in c:
+        log_print(f"Parameter {n} not found.")
+        return -1
+
+    try:
+        strings = string_array(c[n])
+    except TypeError:
+        log_print(f"Error: Parameter {n} is not a string array.")
+        return -1
+
+    # The array references the bytes objects, both are kept alive by the reader
+    reader.keep(strings)
+
+    n_elem[0] = ctypes.c_int(len(strings))
+    val[0] = ctypes.cast(strings, ctypes.POINTER(ctypes.c_char_p))
+
+    log_print(f"GET array [string] {n}: {list(strings)}")
+    return 0
+
+
+def string_array(value: Any) -> ctypes.Array:
+    """
+    Convert a string or a sequence of strings into a ctypes array of `char*`.
+
+    Parameters
+    ----------
+    value : Any
+        A str or bytes, or a list or NumPy array of them.
+
+    Raises
+    ------
+    TypeError
+        If `value` contains anything but str or bytes.
+
+    Returns
+    -------
+    ctypes.Array
+        Array of `ctypes.c_char_p` referencing the encoded strings.
+    """
+    if isinstance(value, (str, bytes)):
+        value = [value]
+    elif isinstance(value, np.ndarray):
+        value = value.ravel().tolist()
+    elif not isinstance(value, list):
+        raise TypeError(f"Unexpected type for string array: {type(value)}.")
+
+    items = []
+    for item in value:
+        if isinstance(item, str):
+            item = item.encode('utf-8')
+        elif not isinstance(item, bytes):
+            raise TypeError(f"Unexpected type for string array item: {type(item)}.")
+        items.append(item)
+
+    return (ctypes.c_char_p * len(items))(*items)
+
+
 # %% Array items
 
 def param_provider_get_double_array_item(
@@ -469,8 +598,7 @@ def param_provider_get_string_array_item(
             "Must be of type bytes, str, or np.ndarray."
         )
 
-    reader.buffer = bytes_val
-    val[0] = ctypes.cast(reader.buffer, ctypes.c_char_p)
+    val[0] = ctypes.cast(reader.keep(bytes_val), ctypes.c_char_p)
 
     log_print(f"GET array [string] ({index}) {n}: {bytes_val}")
     return 0
@@ -622,3 +750,521 @@ def param_provider_pop_scope(reader: Any) -> int:
     """
     reader.pop_scope()
     return 0
+
+
+# %% Compiled provider
+# Callbacks of `CompiledParameterProvider`. The reader is a `CompiledInput` and the
+# names are looked up as bytes, values are taken from the pre-typed entries.
+
+def compiled_provider_get_double(
+        reader: Any,
+        name: bytes,
+        val: ctypes.POINTER(ctypes.c_double)
+        ) -> int:
+    """
+    Retrieve a double value (the first element of arrays) from a compiled input.
+
+    Parameters
+    ----------
+    reader : CompiledInput
+        The compiled input.
+    name : bytes
+        The name of the parameter to retrieve.
+    val : ctypes.POINTER(ctypes.c_double)
+        A pointer to store the retrieved double value.
+
+    Returns
+    -------
+    int
+        0 if the value was found and retrieved successfully, -1 otherwise.
+    """
+    entry = reader.get(name)
+    if entry is None or entry.doubles is None or entry.doubles.size == 0:
+        return -1
+
+    val[0] = entry.doubles[0]
+    return 0
+
+
+def compiled_provider_get_int(
+        reader: Any,
+        name: bytes,
+        val: ctypes.POINTER(ctypes.c_int)
+        ) -> int:
+    """
+    Retrieve an integer value (the first element of arrays) from a compiled input.
+
+    Parameters
+    ----------
+    reader : CompiledInput
+        The compiled input.
+    name : bytes
+        The name of the parameter to retrieve.
+    val : ctypes.POINTER(ctypes.c_int)
+        A pointer to store the retrieved integer value.
+
+    Returns
+    -------
+    int
+        0 if the value was found and retrieved successfully, -1 otherwise.
+    """
+    entry = reader.get(name)
+    if entry is None or entry.doubles is None or entry.doubles.size == 0:
+        return -1
+
+    val[0] = entry.ints[0]
+    return 0
+
+
+def compiled_provider_get_bool(
+        reader: Any,
+        name: bytes,
+        val: ctypes.POINTER(ctypes.c_uint8)
+        ) -> int:
+    """
+    Retrieve a boolean value (the first element of arrays) from a compiled input.
+
+    Parameters
+    ----------
+    reader : CompiledInput
+        The compiled input.
+    name : bytes
+        The name of the parameter to retrieve.
+    val : ctypes.POINTER(ctypes.c_uint8)
+        A pointer to store the retrieved boolean value.
+
+    Returns
+    -------
+    int
+        0 if the value was found and retrieved successfully, -1 otherwise.
+    """
+    entry = reader.get(name)
+    if entry is None or entry.doubles is None or entry.doubles.size == 0:
+        return -1
+
+    val[0] = int(entry.ints[0])
+    return 0
+
+
+def compiled_provider_get_string(
+        reader: Any,
+        name: bytes,
+        val: ctypes.POINTER(ctypes.c_char_p)
+        ) -> int:
+    """
+    Retrieve a string value (the first element of arrays) from a compiled input.
+
+    Parameters
+    ----------
+    reader : CompiledInput
+        The compiled input.
+    name : bytes
+        The name of the parameter to retrieve.
+    val : ctypes.POINTER(ctypes.c_char_p)
+        A pointer to store the retrieved string value. The string is owned by the
+        compiled input.
+
+    Returns
+    -------
+    int
+        0 if the value was found and retrieved successfully, -1 otherwise.
+    """
+    entry = reader.get(name)
+    if entry is None or not entry.strings:
+        return -1
+
+    val[0] = entry.strings[0]
+    return 0
+
+
+def compiled_provider_get_double_array(
+        reader: Any,
+        name: bytes,
+        n_elem: ctypes.POINTER(ctypes.c_int),
+        val: ctypes.POINTER(ctypes.POINTER(ctypes.c_double))
+        ) -> int:
+    """
+    Retrieve a double array from a compiled input.
+
+    Parameters
+    ----------
+    reader : CompiledInput
+        The compiled input.
+    name : bytes
+        The name of the parameter to retrieve.
+    n_elem : ctypes.POINTER(ctypes.c_int)
+        A pointer to store the number of elements in the array.
+    val : ctypes.POINTER(ctypes.POINTER(ctypes.c_double))
+        A pointer to store the retrieved array. The array is owned by the compiled
+        input.
+
+    Returns
+    -------
+    int
+        0 if the array was found and retrieved successfully, -1 otherwise.
+    """
+    entry = reader.get(name)
+    if entry is None or entry.doubles is None:
+        return -1
+
+    n_elem[0] = entry.doubles.size
+    val[0] = entry.double_pointer
+    return 0
+
+
+def compiled_provider_get_int_array(
+        reader: Any,
+        name: bytes,
+        n_elem: ctypes.POINTER(ctypes.c_int),
+        val: ctypes.POINTER(ctypes.POINTER(ctypes.c_int))
+        ) -> int:
+    """
+    Retrieve an integer array from a compiled input.
+
+    Parameters
+    ----------
+    reader : CompiledInput
+        The compiled input.
+    name : bytes
+        The name of the parameter to retrieve.
+    n_elem : ctypes.POINTER(ctypes.c_int)
+        A pointer to store the number of elements in the array.
+    val : ctypes.POINTER(ctypes.POINTER(ctypes.c_int))
+        A pointer to store the retrieved array. The array is owned by the compiled
+        input.
+
+    Returns
+    -------
+    int
+        0 if the array was found and retrieved successfully, -1 otherwise.
+    """
+    entry = reader.get(name)
+    if entry is None or entry.doubles is None:
+        return -1
+
+    n_elem[0] = entry.doubles.size
+    val[0] = entry.int_pointer
+    return 0
+
+
+def compiled_provider_get_bool_array(
+        reader: Any,
+        name: bytes,
+        n_elem: ctypes.POINTER(ctypes.c_int),
+        val: ctypes.POINTER(ctypes.POINTER(ctypes.c_uint8))
+        ) -> int:
+    """
+    Retrieve a boolean array from a compiled input.
+
+    Parameters
+    ----------
+    reader : CompiledInput
+        The compiled input.
+    name : bytes
+        The name of the parameter to retrieve.
+    n_elem : ctypes.POINTER(ctypes.c_int)
+        A pointer to store the number of elements in the array.
+    val : ctypes.POINTER(ctypes.POINTER(ctypes.c_uint8))
+        A pointer to store the retrieved array. The array is owned by the compiled
+        input.
+
+    Returns
+    -------
+    int
+        0 if the array was found and retrieved successfully, -1 otherwise.
+    """
+    entry = reader.get(name)
+    if entry is None or entry.doubles is None:
+        return -1
+
+    n_elem[0] = entry.doubles.size
+    val[0] = entry.bool_pointer
+    return 0
+
+
+def compiled_provider_get_string_array(
+        reader: Any,
+        name: bytes,
+        n_elem: ctypes.POINTER(ctypes.c_int),
+        val: ctypes.POINTER(ctypes.POINTER(ctypes.c_char_p))
+        ) -> int:
+    """
+    Retrieve a string array from a compiled input.
+
+    Parameters
+    ----------
+    reader : CompiledInput
+        The compiled input.
+    name : bytes
+        The name of the parameter to retrieve.
+    n_elem : ctypes.POINTER(ctypes.c_int)
+        A pointer to store the number of elements in the array.
+    val : ctypes.POINTER(ctypes.POINTER(ctypes.c_char_p))
+        A pointer to store the retrieved array of strings. The array is owned by the
+        compiled input.
+
+    Returns
+    -------
+    int
+        0 if the array was found and retrieved successfully, -1 otherwise.
+    """
+    entry = reader.get(name)
+    if entry is None or entry.strings is None:
+        return -1
+
+    n_elem[0] = len(entry.strings)
+    val[0] = entry.string_pointer
+    return 0
+
+
+def compiled_provider_get_double_array_item(
+        reader: Any,
+        name: bytes,
+        index: int,
+        val: ctypes.POINTER(ctypes.c_double)
+        ) -> int:
+    """
+    Retrieve an item of a double array from a compiled input.
+
+    Scalars are returned for any index.
+
+    Parameters
+    ----------
+    reader : CompiledInput
+        The compiled input.
+    name : bytes
+        The name of the parameter to retrieve.
+    index : int
+        The index of the array item to retrieve.
+    val : ctypes.POINTER(ctypes.c_double)
+        A pointer to store the retrieved double value.
+
+    Returns
+    -------
+    int
+        0 if the value was found and retrieved successfully, -1 otherwise.
+    """
+    entry = reader.get(name)
+    if entry is None or entry.doubles is None:
+        return -1
+
+    if not entry.is_array:
+        index = 0
+    if not 0 <= index < entry.doubles.size:
+        return -1
+
+    val[0] = entry.doubles[index]
+    return 0
+
+
+def compiled_provider_get_int_array_item(
+        reader: Any,
+        name: bytes,
+        index: int,
+        val: ctypes.POINTER(ctypes.c_int)
+        ) -> int:
+    """
+    Retrieve an item of an integer array from a compiled input.
+
+    Scalars are returned for any index.
+
+    Parameters
+    ----------
+    reader : CompiledInput
+        The compiled input.
+    name : bytes
+        The name of the parameter to retrieve.
+    index : int
+        The index of the array item to retrieve.
+    val : ctypes.POINTER(ctypes.c_int)
+        A pointer to store the retrieved integer value.
+
+    Returns
+    -------
+    int
+        0 if the value was found and retrieved successfully, -1 otherwise.
+    """
+    entry = reader.get(name)
+    if entry is None or entry.doubles is None:
+        return -1
+
+    if not entry.is_array:
+        index = 0
+    if not 0 <= index < entry.doubles.size:
+        return -1
+
+    val[0] = entry.ints[index]
+    return 0
+
+
+def compiled_provider_get_bool_array_item(
+        reader: Any,
+        name: bytes,
+        index: int,
+        val: ctypes.POINTER(ctypes.c_uint8)
+        ) -> int:
+    """
+    Retrieve an item of a boolean array from a compiled input.
+
+    Scalars are returned for any index.
+
+    Parameters
+    ----------
+    reader : CompiledInput
+        The compiled input.
+    name : bytes
+        The name of the parameter to retrieve.
+    index : int
+        The index of the array item to retrieve.
+    val : ctypes.POINTER(ctypes.c_uint8)
+        A pointer to store the retrieved boolean value.
+
+    Returns
+    -------
+    int
+        0 if the value was found and retrieved successfully, -1 otherwise.
+    """
+    entry = reader.get(name)
+    if entry is None or entry.doubles is None:
+        return -1
+
+    if not entry.is_array:
+        index = 0
+    if not 0 <= index < entry.doubles.size:
+        return -1
+
+    val[0] = int(entry.ints[index])
+    return 0
+
+
+def compiled_provider_get_string_array_item(
+        reader: Any,
+        name: bytes,
+        index: int,
+        val: ctypes.POINTER(ctypes.c_char_p)
+        ) -> int:
+    """
+    Retrieve an item of a string array from a compiled input.
+
+    Scalars are returned for any index.
+
+    Parameters
+    ----------
+    reader : CompiledInput
+        The compiled input.
+    name : bytes
+        The name of the parameter to retrieve.
+    index : int
+        The index of the array item to retrieve.
+    val : ctypes.POINTER(ctypes.c_char_p)
+        A pointer to store the retrieved string value. The string is owned by the
+        compiled input.
+
+    Returns
+    -------
+    int
+        0 if the value was found and retrieved successfully, -1 otherwise.
+    """
+    entry = reader.get(name)
+    if entry is None or not entry.strings:
+        return -1
+
+    if not entry.is_array:
+        index = 0
+    if not 0 <= index < len(entry.strings):
+        return -1
+
+    val[0] = entry.strings[index]
+    return 0
+
+
+def compiled_provider_exists(reader: Any, name: bytes) -> int:
+    """
+    Check if a parameter or scope exists in the current scope of a compiled input.
+
+    Parameters
+    ----------
+    reader : CompiledInput
+        The compiled input.
+    name : bytes
+        The name of the parameter or scope to check.
+
+    Returns
+    -------
+    int
+        1 if the name exists, 0 otherwise.
+    """
+    return 1 if name in reader.current() else 0
+
+
+def compiled_provider_is_array(
+        reader: Any,
+        name: bytes,
+        res: ctypes.POINTER(ctypes.c_uint8)
+        ) -> int:
+    """
+    Check if a parameter of a compiled input is an array.
+
+    Parameters
+    ----------
+    reader : CompiledInput
+        The compiled input.
+    name : bytes
+        The name of the parameter to check.
+    res : ctypes.POINTER(ctypes.c_uint8)
+        A pointer to store the result (1 if the parameter is an array, 0 otherwise).
+
+    Returns
+    -------
+    int
+        0 if the check was successful, -1 if the parameter does not exist.
+    """
+    entry = reader.get(name)
+    if entry is None:
+        return -1
+
+    res[0] = 1 if entry.is_array else 0
+    return 0
+
+
+def compiled_provider_num_elements(reader: Any, name: bytes) -> int:
+    """
+    Get the number of elements of a parameter of a compiled input.
+
+    Parameters
+    ----------
+    reader : CompiledInput
+        The compiled input.
+    name : bytes
+        The name of the parameter to check.
+
+    Returns
+    -------
+    int
+        The number of elements if the parameter is an array, 1 for scalars and -1 if
+        the parameter does not exist.
+    """
+    entry = reader.get(name)
+    if entry is None:
+        return -1
+
+    return entry.n_elements
+
+
+def compiled_provider_push_scope(reader: Any, name: bytes) -> int:
+    """
+    Enter a scope of a compiled input.
+
+    Parameters
+    ----------
+    reader : CompiledInput
+        The compiled input.
+    name : bytes
+        The name of the scope to push.
+
+    Returns
+    -------
+    int
+        0 if the scope was successfully pushed, -1 otherwise.
+    """
+    return 0 if reader.push_scope(name) else -1
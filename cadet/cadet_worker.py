@@ -0,0 +1,525 @@
+import multiprocessing
+from multiprocessing import shared_memory
+import os
+from pathlib import Path
+import secrets
+import threading
+import traceback
+from typing import Any, Optional
+
+from addict import Dict
+import numpy
+
+from cadet.h5 import H5, PathFilter
+from cadet.runner import CadetRunnerBase, ReturnInformation, time_phase
+from cadet.cadet_dll import CadetDLLRunner
+
+
+# Byte alignment of the arrays packed into a shared memory block
+_ALIGNMENT = 64
+# Prefix of the names of the shared memory blocks, short enough for macOS
+_SHM_PREFIX = 'cadet_'
+
+
+class CadetWorkerRunner(CadetRunnerBase):
+    """
+    Runner for CADET simulations in a persistent worker process.
+
+    The worker process keeps the CADET library loaded and its driver warm, so each
+    run has the latency of the DLL interface while a crash of the solver cannot take
+    down the calling process. Jobs are sent to the worker over a pipe, results are
+    returned through a shared memory block instead of being serialized. The block is
+    named by the caller for each job, so that it can be released even if the worker
+    is terminated or crashes before reporting it.
+
+    One worker process is started per runner and reused for all runs. Use
+    `CadetWorkerRunner.shared` to obtain a runner that is shared by all callers using
+    the same library.
+    """
+
+    _shared_runners: dict[Path, "CadetWorkerRunner"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, dll_path: os.PathLike | str) -> None:
+        """
+        Initialize the CadetWorkerRunner and start the worker process.
+
+        Parameters
+        ----------
+        dll_path : os.PathLike or str
+            Path to the CADET DLL.
+        """
+        self._cadet_path = Path(dll_path)
+        self._process = None
+        self._connection = None
+        self._lock = threading.Lock()
+        self._pending = threading.local()
+        self._start_worker()
+
+    @classmethod
+    def shared(cls, dll_path: os.PathLike | str) -> "CadetWorkerRunner":
+        """
+        Get the runner shared by all callers using the same CADET DLL.
+
+        Parameters
+        ----------
+        dll_path : os.PathLike or str
+            Path to the CADET DLL.
+
+        Returns
+        -------
+        CadetWorkerRunner
+            The shared runner instance. It is created on first use.
+        """
+        dll_path = Path(dll_path)
+        with cls._shared_lock:
+            runner = cls._shared_runners.get(dll_path)
+            if runner is None:
+                runner = cls(dll_path)
+                cls._shared_runners[dll_path] = runner
+        return runner
+
+    def _start_worker(self) -> None:
+        """Start the worker process and wait until the CADET library is loaded."""
+        context = multiprocessing.get_context("spawn")
+        connection, worker_connection = context.Pipe()
+        process = context.Process(
+            target=_worker_main,
+            args=(self._cadet_path, worker_connection),
+            daemon=True,
+        )
+        process.start()
+        worker_connection.close()
+
+        try:
+            status, payload = connection.recv()
+        except EOFError:
+            process.join()
+            raise RuntimeError(
+                f"CADET worker process failed to start (exit code {process.exitcode})."
+            )
+
+        if status != 'ready':
+            process.join()
+            raise ValueError(f"CADET worker process failed to start:\n{payload}")
+
+        self._cadet_version = payload['cadet_version']
+        self._cadet_branch = payload['cadet_branch']
+        self._cadet_build_type = payload['cadet_build_type']
+        self._cadet_commit_hash = payload['cadet_commit_hash']
+
+        self._process = process
+        self._connection = connection
+
+    def _stop_worker(self, terminate: bool = False) -> None:
+        """Stop the worker process, forcibly if `terminate` is True."""
+        process = self._process
+        connection = self._connection
+        self._process = None
+        self._connection = None
+
+        if process is None:
+            return
+
+        if not terminate and process.is_alive():
+            try:
+                connection.send(('shutdown',))
+            except (BrokenPipeError, OSError):
+                pass
+            process.join(timeout=5)
+
+        if process.is_alive():
+            process.terminate()
+        process.join()
+
+        connection.close()
+
+    def close(self) -> None:
+        """Shut down the worker process."""
+        with self._lock:
+            self._stop_worker()
+
+    def __del__(self) -> None:
+        """Shut down the worker process on object deletion."""
+        if hasattr(self, "_process"):
+            self._stop_worker()
+
+    def __getstate__(self):
+        # The worker process cannot be pickled, only keep _cadet_path
+        return {"_cadet_path": self._cadet_path}
+
+    def __setstate__(self, state):
+        # Restore the state, the worker is started on first use
+        self.__dict__.update(state)
+        self._process = None
+        self._connection = None
+        self._lock = threading.Lock()
+        self._pending = threading.local()
+
+    def run(
+            self,
+            simulation: "Cadet",
+            timeout: Optional[float] = None,
+    ) -> ReturnInformation:
+        """
+        Run a CADET simulation in the worker process.
+
+        If the worker process dies during the run, a non-zero return code is reported
+        and a new worker process is started for the next run.
+
+        Parameters
+        ----------
+        simulation : Cadet
+            Simulation object containing input data.
+        timeout : Optional[float]
+            Maximum time allowed for the simulation to run, in seconds.
+
+        Raises
+        ------
+        TimeoutError
+            If the simulation does not finish within `timeout`. The worker process is
+            terminated in that case.
+
+        Returns
+        -------
+        ReturnInformation
+            Information about the simulation run.
+        """
+        self.clear()
+        timings = {} if self.collect_timings else None
+
+        with self._lock, time_phase(timings, 'run'):
+            if self._process is None:
+                self._start_worker()
+
+            shm_name = _new_shm_name()
+            self._connection.send(('run', simulation.root.input.to_dict(), shm_name))
+
+            if not self._connection.poll(timeout):
+                self._stop_worker(terminate=True)
+                _unlink_shared_memory(shm_name)
+                raise TimeoutError(
+                    f"CADET worker did not finish the simulation within {timeout} s."
+                )
+
+            try:
+                status, *payload = self._connection.recv()
+            except (EOFError, ConnectionResetError):
+                process = self._process
+                self._stop_worker(terminate=True)
+                _unlink_shared_memory(shm_name)
+                exitcode = process.exitcode
+                return ReturnInformation(
+                    return_code=exitcode if exitcode else -1,
+                    error_message=(
+                        "CADET worker process terminated unexpectedly "
+                        f"(exit code {exitcode})."
+                    ),
+                    log="",
+                    timings=timings,
+                )
+
+        if status == 'error':
+            _unlink_shared_memory(shm_name)
+            raise RuntimeError(f"CADET worker failed to run the simulation:\n{payload[0]}")
+
+        return_info, manifest, shm_name = payload
+        self._pending.results = _PackedResults(manifest, shm_name)
+        if timings is not None:
+            return_info.timings = timings
+
+        return return_info
+
+    def clear(self) -> None:
+        """
+        Clear the simulation results of the last run in the calling thread.
+        """
+        results = getattr(self._pending, 'results', None)
+        self._pending.results = None
+        if results is not None:
+            results.release()
+
+    def load_results(
+            self,
+            sim: "Cadet",
+            paths: Optional[list[str]] = None,
+            own_data: bool = True,
+            lazy: bool = False,
+    ) -> None:
+        """
+        Load the results of the last run in the calling thread into the provided object.
+
+        Parameters
+        ----------
+        sim : Cadet
+            The simulation object where results will be loaded.
+        paths : Optional[list[str]]
+            Paths or glob patterns of the results to load, relative to the root.
+            Only selected arrays are copied out of shared memory. If None, all results
+            are loaded.
+        own_data : bool, default=True
+            Ignored, results are always copied out of shared memory.
+        lazy : bool, default=False
+            Ignored, results are always copied out of shared memory immediately.
+        """
+        results = getattr(self._pending, 'results', None)
+        if results is None:
+            return
+
+        path_filter = PathFilter(paths) if paths is not None else None
+        sim.root.update(results.unpack(path_filter))
+
+    @property
+    def cadet_version(self) -> str:
+        return self._cadet_version
+
+    @property
+    def cadet_branch(self) -> str:
+        return self._cadet_branch
+
+    @property
+    def cadet_build_type(self) -> str:
+        return self._cadet_build_type
+
+    @property
+    def cadet_commit_hash(self) -> str:
+        return self._cadet_commit_hash
+
+    @property
+    def cadet_path(self) -> os.PathLike:
+        return self._cadet_path
+
+
+def _worker_main(dll_path: Path, connection) -> None:
+    """
+    Entry point of the worker process.
+
+    Loads the CADET library once and serves simulation jobs from `connection` until it
+    is closed or a shutdown request is received.
+    """
+    try:
+        runner = CadetDLLRunner(dll_path)
+    except Exception:
+        connection.send(('error', traceback.format_exc()))
+        return
+
+    connection.send(('ready', {
+        'cadet_version': runner.cadet_version,
+        'cadet_branch': runner.cadet_branch,
+        'cadet_build_type': runner.cadet_build_type,
+        'cadet_commit_hash': runner.cadet_commit_hash,
+    }))
+
+    while True:
+        try:
+            message = connection.recv()
+        except EOFError:
+            break
+
+        if message[0] == 'shutdown':
+            break
+
+        try:
+            sim = H5()
+            sim.root.input = Dict(message[1])
+
+            return_info = runner.run(sim)
+            if return_info.return_code == 0:
+                runner.load_results(sim)
+            runner.clear()
+
+            results = Dict({
+                key: sim.root[key] for key in ('output', 'meta') if key in sim.root
+            })
+            manifest, shm_name = _pack_results(results, message[2])
+        except Exception:
+            connection.send(('error', traceback.format_exc()))
+            continue
+
+        connection.send(('done', return_info, manifest, shm_name))
+
+
+def _flatten(data: dict, prefix: tuple = ()) -> list[tuple[tuple[str, ...], Any]]:
+    """Flatten a nested dictionary into a list of (path, value) pairs."""
+    items = []
+    for key, value in data.items():
+        if isinstance(value, dict):
+            items.extend(_flatten(value, prefix + (key,)))
+        else:
+            items.append((prefix + (key,), value))
+    return items
+
+
+def _new_shm_name() -> str:
+    """Create a unique name for the shared memory block of a job."""
+    return _SHM_PREFIX + secrets.token_hex(8)
+
+
+def _unlink_shared_memory(shm_name: str) -> None:
+    """Release the shared memory block `shm_name` if it exists."""
+    try:
+        shm = shared_memory.SharedMemory(name=shm_name)
+    except FileNotFoundError:
+        return
+    shm.close()
+    shm.unlink()
+
+
+def _pack_results(
+        results: dict,
+        shm_name: Optional[str] = None,
+        ) -> tuple[dict, Optional[str]]:
+    """
+    Pack a result tree into a shared memory block.
+
+    Arrays are copied into a single shared memory block; all other values are kept in
+    the manifest.
+
+    Parameters
+    ----------
+    results : dict
+        The (nested) result tree.
+    shm_name : Optional[str]
+        Name of the shared memory block to create. If None, a unique name is chosen.
+
+    Returns
+    -------
+    tuple[dict, Optional[str]]
+        The manifest describing the packed tree and the name of the shared memory
+        block, or None if the tree contains no arrays.
+    """
+    arrays = []
+    values = []
+    size = 0
+    for path, value in _flatten(results):
+        if isinstance(value, numpy.ndarray) and not value.dtype.hasobject:
+            arrays.append((path, value, size))
+            size += -(-value.nbytes // _ALIGNMENT) * _ALIGNMENT
+        else:
+            values.append((path, value))
+
+    if size == 0:
+        values.extend((path, value) for path, value, _ in arrays)
+        return {'arrays': [], 'values': values}, None
+
+    shm = shared_memory.SharedMemory(name=shm_name, create=True, size=size)
+    try:
+        for path, value, offset in arrays:
+            target = numpy.ndarray(value.shape, value.dtype, buffer=shm.buf, offset=offset)
+            target[...] = value
+            del target
+    finally:
+        shm.close()
+
+    manifest = {
+        'arrays': [
+            (path, value.dtype.str, value.shape, offset)
+            for path, value, offset in arrays
+        ],
+        'values': values,
+    }
+
+    return manifest, shm.name
+
+
+class _PackedResults:
+    """
+    Result tree packed by `_pack_results`, held in shared memory until it is unpacked.
+
+    Parameters
+    ----------
+    manifest : dict
+        The manifest describing the packed tree.
+    shm_name : Optional[str]
+        Name of the shared memory block holding the arrays.
+    """
+
+    def __init__(self, manifest: dict, shm_name: Optional[str]) -> None:
+        self.manifest = manifest
+        self.shm_name = shm_name
+
+    def unpack(self, path_filter: Optional[PathFilter] = None) -> Dict:
+        """
+        Rebuild the result tree and release the shared memory.
+
+        Parameters
+        ----------
+        path_filter : Optional[PathFilter]
+            If given, only values whose path is selected are unpacked.
+
+        Returns
+        -------
+        Dict
+            The result tree.
+        """
+        try:
+            return _unpack_results(self.manifest, self.shm_name, path_filter)
+        finally:
+            self.shm_name = None
+
+    def release(self) -> None:
+        """Release the shared memory without unpacking."""
+        if self.shm_name is None:
+            return
+
+        shm_name = self.shm_name
+        self.shm_name = None
+        _unlink_shared_memory(shm_name)
+
+    def __del__(self) -> None:
+        self.release()
+
+
+def _unpack_results(
+        manifest: dict,
+        shm_name: Optional[str],
+        path_filter: Optional[PathFilter] = None,
+        ) -> Dict:
+    """
+    Rebuild a result tree packed by `_pack_results` and release the shared memory.
+
+    Parameters
+    ----------
+    manifest : dict
+        The manifest describing the packed tree.
+    shm_name : Optional[str]
+        Name of the shared memory block holding the arrays.
+    path_filter : Optional[PathFilter]
+        If given, only values whose path is selected are unpacked.
+
+    Returns
+    -------
+    Dict
+        The result tree.
+    """
+    results = Dict()
+
+    def is_selected(path):
+        return path_filter is None or path_filter.matches('/'.join(path))
+
+    def set_value(path, value):
+        node = results
+        for key in path[:-1]:
+            node = node[key]
+        node[path[-1]] = value
+
+    for path, value in manifest['values']:
+        if is_selected(path):
+            set_value(path, value)
+
+    if shm_name is None:
+        return results
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        for path, dtype, shape, offset in manifest['arrays']:
+            if not is_selected(path):
+                continue
+            view = numpy.ndarray(shape, dtype, buffer=shm.buf, offset=offset)
+            set_value(path, view.copy())
+            del view
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return results
@@ -1,4 +1,5 @@
 import copy
+from fnmatch import fnmatchcase
 import json
 import os
 from pathlib import Path
@@ -16,6 +17,81 @@ import numpy
 import filelock
 import contextlib
 
+from cadet.labeled_array import LabeledArray
+
+
+# Attribute storing the dimension names of a LabeledArray dataset
+_DIMS_ATTRIBUTE = 'dims'
+
+# Attribute marking groups that contain LabeledArray datasets, so that the dimension
+# names are only looked up in these groups
+_LABELED_ATTRIBUTE = 'labeled'
+
+
+class CopyOnWriteDict(Dict):
+    """
+    Dictionary sharing the subtrees and arrays of another dictionary until modified.
+
+    The sub-dictionaries of the source are shared until they are accessed by key or
+    attribute, which replaces them by a `CopyOnWriteDict` of their own. Arrays are
+    shared as read-only views, so that modifying them in place raises a ValueError;
+    assign new values instead. Lists are copied.
+
+    Changes to the copy never affect the source, but changes made in place to the
+    source are visible in the copy. Iterating, e.g. with `items()`, returns the shared
+    sub-dictionaries themselves; they must not be modified.
+
+    Parameters
+    ----------
+    source : Optional[dict]
+        The dictionary to share.
+    """
+
+    # Fallback for instances created without __init__, e.g. by copy or pickle
+    _shared: frozenset = frozenset()
+
+    def __init__(self, source: Optional[dict] = None, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        shared = set()
+        for key, value in (source or {}).items():
+            if isinstance(value, dict):
+                shared.add(key)
+            elif isinstance(value, numpy.ndarray):
+                value = value.view()
+                value.flags.writeable = False
+            elif isinstance(value, list):
+                value = list(value)
+            dict.__setitem__(self, key, value)
+        object.__setattr__(self, '_shared', shared)
+
+    def __getitem__(self, key: Any) -> Any:
+        value = super().__getitem__(key)
+        if key in self._shared:
+            value = CopyOnWriteDict(value)
+            dict.__setitem__(self, key, value)
+            self._shared.discard(key)
+        return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        if key in self._shared:
+            self._shared.discard(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        if key in self._shared:
+            self._shared.discard(key)
+        super().__delitem__(key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        return default
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        if key in self._shared:
+            self[key]
+        return super().pop(key, *default)
+
 
 class H5:
     """
@@ -46,6 +122,8 @@ class H5:
         Appends new keys to the HDF5 file without reading existing data.
     update(other: "H5") -> None
         Merges another H5 object's data with the current one.
+    clone() -> "H5"
+        Creates a copy sharing the data of the current one until it is modified.
     """
 
     pp = pprint.PrettyPrinter(indent=4)
@@ -127,7 +205,8 @@ class H5:
             self,
             paths: Optional[list[str]] = None,
             update: bool = False,
-            lock: bool = False
+            lock: bool = False,
+            patterns: Optional[list[str]] = None,
             ) -> None:
         """
         Load data from the specified HDF5 file.
@@ -142,7 +221,15 @@ class H5:
             If False, discard existing data and only keep loaded data.
         lock : bool, optional
             If True, uses a file lock while loading.
+        patterns : Optional[List[str]], optional
+            Paths or glob patterns of the data to load, e.g.
+            'output/solution/unit_*/solution_outlet'. Patterns are matched against the
+            keys after applying `inverse_transform`. Only datasets that match are read.
+            Cannot be combined with `paths`.
         """
+        if paths is not None and patterns is not None:
+            raise ValueError("Only one of paths and patterns can be set.")
+
         if self.filename is not None:
             lock_file = filelock.FileLock(
                     self.filename + '.lock'
@@ -150,9 +237,14 @@ class H5:
 
             with lock_file:
                 with h5py.File(self.filename, 'r') as h5file:
-                    data = Dict(
-                        recursively_load(h5file, '/', self.inverse_transform, paths)
-                    )
+                    if patterns is not None:
+                        data = recursively_load_filtered(
+                            h5file, '/', self.inverse_transform, PathFilter(patterns)
+                        )
+                    else:
+                        data = Dict(
+                            recursively_load(h5file, '/', self.inverse_transform, paths)
+                        )
                     if update:
                         self.root.update(data)
                     else:
@@ -302,6 +394,25 @@ class H5:
         else:
             print("Filename must be set before save can be used")
 
+    def clone(self) -> "H5":
+        """
+        Create a copy that shares the data of this object until it is modified.
+
+        Unlike `H5(other.root)` or `copy.deepcopy`, no array is copied: `root` of the
+        clone is a `CopyOnWriteDict`, i.e. subtrees are copied when they are accessed
+        and arrays are shared as read-only views. Assigning new values to the clone
+        does not affect this object.
+
+        Returns
+        -------
+        H5
+            The clone.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone.root = CopyOnWriteDict(self.root)
+        return clone
+
     def __str__(self) -> str:
         """
         Return a string representation of the object.
@@ -368,6 +479,112 @@ class H5:
         obj[parts[-1]] = value
 
 
+class PathFilter:
+    """
+    Match slash-separated paths against a list of paths or glob patterns.
+
+    A pattern matches a path if it matches the path itself or one of its parent groups,
+    e.g. 'output/solution/unit_003' matches all data of that unit. Patterns are matched
+    segment by segment using `fnmatch` rules, e.g. 'output/solution/unit_*/solution_outlet'.
+    Leading slashes are ignored.
+
+    Parameters
+    ----------
+    patterns : list[str]
+        Paths or glob patterns.
+    """
+
+    def __init__(self, patterns: list[str]) -> None:
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        self.patterns = [
+            tuple(part for part in pattern.split('/') if part) for pattern in patterns
+        ]
+
+    @staticmethod
+    def _split(path: str) -> list[str]:
+        return [part for part in path.split('/') if part]
+
+    def matches(self, path: str) -> bool:
+        """
+        Check if a path or one of its parent groups is selected.
+
+        Parameters
+        ----------
+        path : str
+            Slash-separated path.
+
+        Returns
+        -------
+        bool
+            True if the path is selected.
+        """
+        parts = self._split(path)
+        for pattern in self.patterns:
+            if len(pattern) <= len(parts) and all(
+                    fnmatchcase(part, pat) for part, pat in zip(parts, pattern)):
+                return True
+        return False
+
+    def may_contain(self, path: str) -> bool:
+        """
+        Check if a group or any of its members may be selected.
+
+        Parameters
+        ----------
+        path : str
+            Slash-separated path of the group.
+
+        Returns
+        -------
+        bool
+            True if the group or any of its members may be selected.
+        """
+        parts = self._split(path)
+        for pattern in self.patterns:
+            if all(fnmatchcase(part, pat) for part, pat in zip(parts, pattern)):
+                return True
+        return False
+
+    def may_match_stem(self, path: str) -> bool:
+        """
+        Check if a path or a path extending its last segment may be selected.
+
+        This is used to decide whether data has to be fetched at all before the final
+        keys are known, e.g. 'solution_outlet' may end up as 'solution_outlet_comp_000'.
+        The check is conservative, i.e. it may return True for data that is then not
+        selected by `matches`.
+
+        Parameters
+        ----------
+        path : str
+            Slash-separated path whose last segment is the stem of the final key.
+
+        Returns
+        -------
+        bool
+            True if data stored under the stem may be selected.
+        """
+        parts = self._split(path)
+        *groups, stem = parts
+        for pattern in self.patterns:
+            if len(pattern) < len(parts):
+                if all(fnmatchcase(part, pat) for part, pat in zip(parts, pattern)):
+                    return True
+                continue
+
+            if not all(fnmatchcase(part, pat) for part, pat in zip(groups, pattern)):
+                continue
+
+            pat = pattern[len(groups)]
+            literal = pat
+            for wildcard in '*?[':
+                literal = literal.split(wildcard)[0]
+            if literal.startswith(stem) or (literal != pat and stem.startswith(literal)):
+                return True
+        return False
+
+
 def convert_from_numpy(data: Dict, func: Optional[callable] = None) -> Dict:
     """
     Convert a dictionary with NumPy objects into native Python types.
@@ -499,23 +716,78 @@ def recursively_load(
             item = h5file.get(path, None)
             if item is not None:
                 if isinstance(item, h5py._hl.dataset.Dataset):
-                    set_path(ans, path, item[()])
+                    set_path(ans, path, read_dataset(item, _is_labeled(item.parent)))
                 elif isinstance(item, h5py._hl.group.Group):
                     set_path(
                         ans, path, recursively_load(h5file, path + '/', func, None)
                     )
     else:
-        for key_original in h5file[path].keys():
+        group = h5file[path]
+        labeled = _is_labeled(group)
+        for key_original in group.keys():
             key = func(key_original)
             local_path = path + key
-            item = h5file[path][key_original]
+            item = group[key_original]
             if isinstance(item, h5py._hl.dataset.Dataset):
-                ans[key] = item[()]
+                ans[key] = read_dataset(item, labeled)
             elif isinstance(item, h5py._hl.group.Group):
                 ans[key] = recursively_load(h5file, local_path + '/', func, None)
     return ans
 
 
+def recursively_load_filtered(
+        h5file: h5py.File,
+        path: str,
+        func: callable,
+        path_filter: "PathFilter",
+        prefix: str = ''
+        ) -> Dict:
+    """
+    Recursively load the data matching a path filter from an HDF5 file.
+
+    Groups that cannot contain any matching data are not traversed.
+
+    Parameters
+    ----------
+    h5file : h5py.File
+        The HDF5 file to load data from.
+    path : str
+        Path within the HDF5 file.
+    func : callable
+        Transformation function for dictionary keys.
+    path_filter : PathFilter
+        Filter selecting the data to load. It is applied to the transformed keys.
+    prefix : str, optional
+        Transformed path of the group at `path`.
+
+    Returns
+    -------
+    Dict
+        Loaded data.
+    """
+    ans = Dict()
+    group = h5file[path]
+    labeled = None
+    for key_original in group.keys():
+        key = func(key_original)
+        local_path = prefix + key
+        item = group[key_original]
+        if path_filter.matches(local_path):
+            if isinstance(item, h5py._hl.dataset.Dataset):
+                if labeled is None:
+                    labeled = _is_labeled(group)
+                ans[key] = read_dataset(item, labeled)
+            elif isinstance(item, h5py._hl.group.Group):
+                ans[key] = recursively_load(h5file, path + key_original + '/', func, None)
+        elif isinstance(item, h5py._hl.group.Group) and path_filter.may_contain(local_path):
+            data = recursively_load_filtered(
+                h5file, path + key_original + '/', func, path_filter, local_path + '/'
+            )
+            if len(data) > 0:
+                ans[key] = data
+    return ans
+
+
 def recursively_save(h5file: h5py.File, path: str, dic: Dict, func: callable) -> None:
     """
     Recursively save data to an HDF5 file.
@@ -579,6 +851,44 @@ def recursively_save(h5file: h5py.File, path: str, dic: Dict, func: callable) ->
             else:
                 raise
 
+        if isinstance(item, LabeledArray) and item.dims is not None:
+            dataset = h5file[path + func(key)]
+            dataset.attrs[_DIMS_ATTRIBUTE] = list(item.dims)
+            dataset.parent.attrs[_LABELED_ATTRIBUTE] = True
+
+
+def _is_labeled(group: h5py.Group) -> bool:
+    """Check if a group contains datasets written for a `LabeledArray`."""
+    return _LABELED_ATTRIBUTE in group.attrs
+
+
+def read_dataset(dataset: h5py.Dataset, labeled: bool = False) -> Any:
+    """
+    Read the value of a dataset.
+
+    Parameters
+    ----------
+    dataset : h5py.Dataset
+        The dataset to read.
+    labeled : bool, default=False
+        If True, datasets with dimension names, as written for a `LabeledArray`,
+        are returned as `LabeledArray`. Only set it for datasets in groups marked by
+        `recursively_save`, looking up the names slows down reading.
+
+    Returns
+    -------
+    Any
+        The value of the dataset.
+    """
+    value = dataset[()]
+    if not labeled:
+        return value
+    dims = dataset.attrs.get(_DIMS_ATTRIBUTE)
+    if dims is not None and len(dims) == numpy.ndim(value):
+        dims = [dim.decode('utf-8') if isinstance(dim, bytes) else str(dim) for dim in dims]
+        return LabeledArray(value, dims)
+    return value
+
 
 def recursively_turn_dict_to_python_list(dictionary: dict, current_lines_list: list = None, prefix: str = None):
     """
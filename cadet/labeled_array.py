@@ -0,0 +1,111 @@
+from typing import Any, Optional
+
+import numpy
+
+
+class LabeledArray(numpy.ndarray):
+    """
+    NumPy array with named dimensions.
+
+    Results of the labeled output layout are stored as a single contiguous array per
+    quantity, e.g. `solution_outlet` with dimensions `('nTime', 'nPort', 'nComp')`.
+    Components, ports and particle types are accessed as views with `sel`, so no
+    data is copied or stored twice.
+
+    Operations that keep the number of dimensions keep the names, all other
+    operations (e.g. reductions or integer indexing) drop them.
+
+    Parameters
+    ----------
+    data : Any
+        The array data. Arrays are not copied.
+    dims : list[str]
+        The name of each dimension.
+
+    Raises
+    ------
+    ValueError
+        If the number of names does not match the number of dimensions.
+    """
+
+    def __new__(cls, data: Any, dims: list[str]) -> "LabeledArray":
+        array = numpy.asarray(data).view(cls)
+        if len(dims) != array.ndim:
+            raise ValueError(
+                f"Got {len(dims)} dimension names for an array with {array.ndim} "
+                "dimensions."
+            )
+        array.dims = tuple(dims)
+        return array
+
+    def __array_finalize__(self, obj: Optional[numpy.ndarray]) -> None:
+        dims = getattr(obj, 'dims', None)
+        self.dims = dims if dims is not None and len(dims) == self.ndim else None
+
+    def __reduce__(self):
+        reconstruct, args, state = super().__reduce__()
+        return reconstruct, args, (state, self.dims)
+
+    def __setstate__(self, state):
+        array_state, self.dims = state
+        super().__setstate__(array_state)
+
+    def axis(self, dim: str) -> int:
+        """
+        Get the axis of a dimension.
+
+        Parameters
+        ----------
+        dim : str
+            The name of the dimension.
+
+        Raises
+        ------
+        KeyError
+            If the array has no dimension of that name.
+
+        Returns
+        -------
+        int
+            The axis of the dimension.
+        """
+        if self.dims is None or dim not in self.dims:
+            raise KeyError(f"Array has no dimension {dim}. Dimensions: {self.dims}.")
+        return self.dims.index(dim)
+
+    def sel(self, **indices: Any) -> "LabeledArray":
+        """
+        Select entries along named dimensions.
+
+        Parameters
+        ----------
+        **indices : Any
+            Index (int, slice or array) per dimension name, e.g. `nComp=0`.
+
+        Returns
+        -------
+        LabeledArray
+            The selection. A view unless advanced indexing is used. Dimensions
+            selected by an integer are removed.
+        """
+        index = [slice(None)] * self.ndim
+        for dim, value in indices.items():
+            index[self.axis(dim)] = value
+
+        dims = [
+            dim for dim, value in zip(self.dims, index)
+            if not isinstance(value, (int, numpy.integer))
+        ]
+        return LabeledArray(numpy.asarray(self)[tuple(index)], dims)
+
+    def comp(self, index: int) -> "LabeledArray":
+        """Select a component."""
+        return self.sel(nComp=index)
+
+    def port(self, index: int) -> "LabeledArray":
+        """Select a port."""
+        return self.sel(nPort=index)
+
+    def partype(self, index: int) -> "LabeledArray":
+        """Select a particle type."""
+        return self.sel(nParType=index)
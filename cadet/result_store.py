@@ -0,0 +1,325 @@
+"""
+Append-only store of simulation runs in a single HDF5 file.
+
+Every run is stored in its own group, next to a columnar index of selected scalar
+inputs and summary metrics. Range queries only read the index, the runs themselves
+are read on demand.
+"""
+import functools
+import os
+from pathlib import Path
+from typing import Any, Callable, Mapping, Optional
+import warnings
+
+from addict import Dict
+import filelock
+import numpy
+with warnings.catch_warnings():
+    warnings.filterwarnings("ignore", category=FutureWarning)
+    import h5py
+
+from cadet.cadet_dll import LazyResultGroup
+from cadet.h5 import (
+    H5, PathFilter, _is_labeled, read_dataset, recursively_load,
+    recursively_load_filtered, recursively_save,
+)
+
+# Group of the runs and of the index in the store file
+_RUNS_GROUP = 'runs'
+_INDEX_GROUP = 'index'
+
+# Attribute listing the columns of the index
+_COLUMNS_ATTRIBUTE = 'columns'
+
+# Rows by which the index datasets grow
+_INDEX_CHUNK = 1024
+
+
+class ResultStore:
+    """
+    Append-only store of simulation runs with a columnar index.
+
+    The input and output trees of each run are stored in the group `runs/<run_id>`
+    of a single HDF5 file, with upper case parameter names as in CADET files. The
+    index holds one float column per indexed value, so that queries over many runs
+    only read the index. Values that are missing or not scalar are stored as NaN.
+
+    Runs can be added by many processes at once; all access to the file is
+    serialized by a file lock (`<filename>.lock`). Run IDs are assigned
+    consecutively. A run is only visible once its index row has been written, so
+    runs of interrupted writers are overwritten by the next run.
+
+    Parameters
+    ----------
+    filename : os.PathLike or str
+        Path to the store file. It is created by the first `add`.
+    index : Optional[list[str]]
+        Paths of the indexed values relative to the root of a simulation, e.g.
+        `'input/model/unit_001/col_porosity'` or `'meta/time_sim'`.
+    metrics : Optional[Mapping[str, Callable[[Dict], float]]]
+        Summary metrics of each run, by column name. Each function is called with
+        the root of the simulation, e.g.
+        `{'peak': lambda root: root.output.solution.unit_001.solution_outlet.max()}`.
+    timeout : float, default=-1
+        Maximum time to wait for the file lock, in seconds. Negative values wait
+        indefinitely.
+
+    Raises
+    ------
+    ValueError
+        If the file exists with different index columns.
+    """
+
+    def __init__(
+            self,
+            filename: os.PathLike | str,
+            index: Optional[list[str]] = None,
+            metrics: Optional[Mapping[str, Callable[[Dict], float]]] = None,
+            timeout: float = -1,
+            ) -> None:
+        self.filename = Path(filename)
+        self.metrics = dict(metrics or {})
+        self._lock = filelock.FileLock(str(self.filename) + '.lock', timeout=timeout)
+
+        columns = [path.strip('/') for path in index or []] + list(self.metrics)
+        stored = self._stored_columns()
+        if stored is None:
+            self.columns = columns
+        elif index is None and metrics is None:
+            self.columns = stored
+        elif stored != columns:
+            raise ValueError(
+                f"Store {self.filename} is indexed by {stored}, not by {columns}."
+            )
+        else:
+            self.columns = stored
+
+    def _stored_columns(self) -> Optional[list[str]]:
+        """Get the index columns of the store file, or None if it does not exist."""
+        if not self.filename.exists():
+            return None
+        with self._lock, h5py.File(self.filename, 'r') as h5file:
+            if _INDEX_GROUP not in h5file:
+                return None
+            return [
+                column.decode('utf-8') if isinstance(column, bytes) else str(column)
+                for column in h5file[_INDEX_GROUP].attrs[_COLUMNS_ATTRIBUTE]
+            ]
+
+    def _row(self, root: Dict) -> list[float]:
+        """Get the index values of a simulation."""
+        row = []
+        for column in self.columns:
+            if column in self.metrics:
+                value = self.metrics[column](root)
+            else:
+                value = root
+                for key in column.split('/'):
+                    value = value.get(key) if isinstance(value, dict) else None
+            try:
+                value = float(numpy.asarray(value, dtype=float))
+            except (TypeError, ValueError):
+                value = numpy.nan
+            row.append(value)
+        return row
+
+    def add(self, simulation: H5, groups: Optional[list[str]] = None) -> int:
+        """
+        Append a run to the store.
+
+        Parameters
+        ----------
+        simulation : H5
+            The simulation, usually a `Cadet` object after `run_simulation`.
+        groups : Optional[list[str]]
+            Groups of `root` to store. Defaults to `input`, `output` and `meta`.
+
+        Returns
+        -------
+        int
+            The ID of the run.
+        """
+        if groups is None:
+            groups = ['input', 'output', 'meta']
+        root = simulation.root
+        row = self._row(root)
+        data = Dict({group: root[group] for group in groups if group in root})
+
+        with self._lock, h5py.File(self.filename, 'a') as h5file:
+            index = h5file.require_group(_INDEX_GROUP)
+            if _COLUMNS_ATTRIBUTE not in index.attrs:
+                index.attrs[_COLUMNS_ATTRIBUTE] = self.columns
+                index.attrs['size'] = 0
+                for column in self.columns:
+                    index.create_dataset(
+                        column, shape=(0,), maxshape=(None,), dtype=float,
+                        chunks=(_INDEX_CHUNK,),
+                    )
+            run_id = int(index.attrs['size'])
+
+            path = f'{_RUNS_GROUP}/{run_id}'
+            if path in h5file:
+                # Left over by an interrupted writer
+                del h5file[path]
+            recursively_save(h5file, path + '/', data, str.upper)
+
+            for column, value in zip(self.columns, row):
+                dataset = index[column]
+                if dataset.shape[0] <= run_id:
+                    dataset.resize((run_id + _INDEX_CHUNK,))
+                dataset[run_id] = value
+            index.attrs['size'] = run_id + 1
+
+        return run_id
+
+    def __len__(self) -> int:
+        """Number of runs in the store."""
+        return self._read_index([])[0]
+
+    def _read_index(self, columns: list[str]) -> tuple[int, dict[str, numpy.ndarray]]:
+        """Read the number of runs and the values of `columns`."""
+        if not self.filename.exists():
+            return 0, {column: numpy.empty(0) for column in columns}
+
+        with self._lock, h5py.File(self.filename, 'r') as h5file:
+            if _INDEX_GROUP not in h5file:
+                return 0, {column: numpy.empty(0) for column in columns}
+            index = h5file[_INDEX_GROUP]
+            size = int(index.attrs['size'])
+            return size, {column: index[column][:size] for column in columns}
+
+    def read_index(
+            self,
+            columns: Optional[list[str]] = None,
+            ) -> dict[str, numpy.ndarray]:
+        """
+        Read columns of the index.
+
+        Parameters
+        ----------
+        columns : Optional[list[str]]
+            The columns to read. Defaults to all columns.
+
+        Raises
+        ------
+        KeyError
+            If a column is not indexed.
+
+        Returns
+        -------
+        dict[str, numpy.ndarray]
+            The values of each column, indexed by run ID.
+        """
+        if columns is None:
+            columns = self.columns
+        columns = [column.strip('/') for column in columns]
+        for column in columns:
+            if column not in self.columns:
+                raise KeyError(f"Column {column} is not indexed.")
+
+        return self._read_index(columns)[1]
+
+    def query(
+            self,
+            ranges: Mapping[str, tuple[Optional[float], Optional[float]]],
+            ) -> numpy.ndarray:
+        """
+        Find the runs whose indexed values lie in the given ranges.
+
+        Parameters
+        ----------
+        ranges : Mapping[str, tuple[Optional[float], Optional[float]]]
+            Inclusive lower and upper bound of each column, None for an open bound,
+            e.g. `{'input/model/unit_001/col_porosity': (0.3, 0.35)}`. Runs must
+            match all ranges.
+
+        Raises
+        ------
+        KeyError
+            If a column is not indexed.
+
+        Returns
+        -------
+        numpy.ndarray
+            The IDs of the matching runs in ascending order.
+        """
+        ranges = {column.strip('/'): bounds for column, bounds in ranges.items()}
+        for column in ranges:
+            if column not in self.columns:
+                raise KeyError(f"Column {column} is not indexed.")
+
+        size, index = self._read_index(list(ranges))
+        mask = numpy.ones(size, dtype=bool)
+        for column, (lower, upper) in ranges.items():
+            values = index[column]
+            # NaN compares false, so runs without a value never match
+            if lower is not None:
+                mask &= values >= lower
+            if upper is not None:
+                mask &= values <= upper
+            if lower is None and upper is None:
+                mask &= ~numpy.isnan(values)
+        return numpy.flatnonzero(mask)
+
+    def load(
+            self,
+            run_id: int,
+            patterns: Optional[list[str]] = None,
+            lazy: bool = False,
+            ) -> Dict:
+        """
+        Load a run.
+
+        Parameters
+        ----------
+        run_id : int
+            The ID of the run.
+        patterns : Optional[list[str]]
+            Paths or glob patterns of the data to load, relative to the root of the
+            run, e.g. `'output/solution/unit_001/solution_outlet'`. Defaults to all
+            data. Ignored if `lazy` is True.
+        lazy : bool, default=False
+            If True, only the structure of the run is read. Each dataset is read
+            when it is first accessed.
+
+        Raises
+        ------
+        KeyError
+            If the run does not exist.
+
+        Returns
+        -------
+        Dict
+            The root of the run.
+        """
+        if not 0 <= run_id < len(self):
+            raise KeyError(f"Run {run_id} does not exist.")
+
+        path = f'{_RUNS_GROUP}/{run_id}/'
+        with self._lock, h5py.File(self.filename, 'r') as h5file:
+            if lazy:
+                return self._lazy_group(h5file[path], path)
+            if patterns is not None:
+                return recursively_load_filtered(
+                    h5file, path, str.lower, PathFilter(patterns)
+                )
+            return Dict(recursively_load(h5file, path, str.lower, None))
+
+    def _lazy_group(self, group: h5py.Group, path: str) -> LazyResultGroup:
+        """Create a group whose datasets are read on first access."""
+        lazy_group = LazyResultGroup()
+        for key, item in group.items():
+            if isinstance(item, h5py.Group):
+                lazy_group[key] = self._lazy_group(item, f'{path}{key}/')
+            else:
+                name = str.lower(key)
+                lazy_group.add_loader(
+                    name, functools.partial(self._read_dataset, path + key, name)
+                )
+        return lazy_group
+
+    def _read_dataset(self, path: str, name: str) -> dict[str, Any]:
+        """Read a single dataset for a lazy group."""
+        with self._lock, h5py.File(self.filename, 'r') as h5file:
+            dataset = h5file[path]
+            return {name: read_dataset(dataset, _is_labeled(dataset.parent))}
@@ -1,11 +1,16 @@
+import contextlib
 import os
 import pathlib
+import platform
 import re
 import subprocess
+import threading
+import time
+import tracemalloc
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 from packaging.version import Version
 
 
@@ -22,10 +27,249 @@ class ReturnInformation:
         A string containing the error message if an error occurred. Empty if no error.
     log : str
         A string containing log information.
+    timings : Optional[dict[str, int]]
+        Wall time of the phases of the run in nanoseconds, or None if timings are not
+        collected (see `CadetRunnerBase.collect_timings`). Phases that did not occur
+        are missing. Possible phases are:
+
+        - 'save': Last `Cadet.save` before the run.
+        - 'provider': Construction of the parameter provider (DLL).
+        - 'run': Call of the solver, including process spawn (CLI) or parameter
+          provider callbacks (DLL).
+        - 'solver': Time spent in the solver, from `meta.time_sim`.
+        - 'spawn': Process spawn and file input/output of the solver (CLI), i.e.
+          'run' - 'solver'.
+        - 'load': Result extraction (DLL) or `load_from_file` (CLI).
+        - 'total': Complete `Cadet.run_simulation`.
+    memory : Optional[dict[str, int]]
+        Memory usage of the run in bytes, or None if it is not collected (see
+        `CadetRunnerBase.collect_memory`). Possible entries are:
+
+        - 'child_peak_rss': Peak resident set size of the cadet-cli process (CLI,
+          not available on Windows).
+        - 'python_peak': Peak of the memory allocated by Python during the run and
+          loading of the results, from `tracemalloc`. This is process-wide and
+          includes concurrent runs of other threads.
+        - 'rss_delta': Change of the resident set size of the calling process by
+          the run and loading of the results (Linux only).
     """
     return_code: int
     error_message: str
     log: str
+    timings: Optional[dict[str, int]] = None
+    memory: Optional[dict[str, int]] = None
+
+
+class _Phase:
+    """Context manager adding its wall time to an entry of a timings dictionary."""
+
+    __slots__ = ('timings', 'phase', 'start')
+
+    def __init__(self, timings: dict[str, int], phase: str) -> None:
+        self.timings = timings
+        self.phase = phase
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter_ns()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        elapsed = time.perf_counter_ns() - self.start
+        self.timings[self.phase] = self.timings.get(self.phase, 0) + elapsed
+
+
+_NOT_MEASURED = contextlib.nullcontext()
+
+
+def current_rss() -> Optional[int]:
+    """
+    Get the resident set size of the current process.
+
+    Returns
+    -------
+    Optional[int]
+        The resident set size in bytes, or None if it cannot be determined on this
+        platform.
+    """
+    try:
+        with open('/proc/self/statm') as statm:
+            resident_pages = int(statm.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf('SC_PAGE_SIZE')
+
+
+class _MemoryProbe:
+    """Context manager recording the Python allocation peak and the RSS change."""
+
+    __slots__ = ('memory', 'rss')
+
+    # tracemalloc is process-wide, so it is shared by all probes of the process
+    _lock = threading.Lock()
+    _active = 0
+    _started = False
+
+    def __init__(self, memory: dict[str, int]) -> None:
+        self.memory = memory
+
+    def __enter__(self) -> None:
+        self.rss = current_rss()
+        cls = type(self)
+        with cls._lock:
+            if cls._active == 0:
+                cls._started = not tracemalloc.is_tracing()
+                if cls._started:
+                    tracemalloc.start()
+                else:
+                    tracemalloc.reset_peak()
+            cls._active += 1
+
+    def __exit__(self, *exc_info: Any) -> None:
+        cls = type(self)
+        with cls._lock:
+            _, peak = tracemalloc.get_traced_memory()
+            cls._active -= 1
+            if cls._active == 0 and cls._started:
+                tracemalloc.stop()
+        self.memory['python_peak'] = peak
+
+        rss = current_rss()
+        if rss is not None and self.rss is not None:
+            self.memory['rss_delta'] = rss - self.rss
+
+
+def track_memory(
+        memory: Optional[dict[str, int]],
+        ) -> contextlib.AbstractContextManager:
+    """
+    Measure the memory usage of the calling process.
+
+    The peak of the memory allocated by Python is measured with `tracemalloc`, which
+    is started for the block if it is not tracing yet. Otherwise, its peak is reset.
+    `tracemalloc` traces the whole process: if blocks overlap, e.g. in concurrent
+    runs, the peak is only reset when the first of them starts and includes the
+    allocations of all threads.
+
+    Parameters
+    ----------
+    memory : Optional[dict[str, int]]
+        Dictionary to store 'python_peak' and 'rss_delta' in, in bytes. If None,
+        nothing is measured.
+
+    Returns
+    -------
+    contextlib.AbstractContextManager
+        Context manager measuring the memory usage of its block.
+    """
+    if memory is None:
+        return _NOT_MEASURED
+    return _MemoryProbe(memory)
+
+
+def _run_process(
+        args: list,
+        timeout: Optional[float] = None,
+        ) -> tuple[subprocess.CompletedProcess, Optional[int]]:
+    """
+    Run a process and measure its peak resident set size.
+
+    The process is reaped with `os.wait4` to obtain its resource usage. On platforms
+    without `os.wait4`, `subprocess.run` is used and no peak is measured.
+
+    Parameters
+    ----------
+    args : list
+        The command line.
+    timeout : Optional[float]
+        Maximum time allowed for the process to run, in seconds.
+
+    Raises
+    ------
+    subprocess.TimeoutExpired
+        If the process does not finish within `timeout`. It is killed in that case.
+
+    Returns
+    -------
+    tuple[subprocess.CompletedProcess, Optional[int]]
+        The completed process with captured output and its peak resident set size
+        in bytes.
+    """
+    if not hasattr(os, 'wait4'):
+        return subprocess.run(args, timeout=timeout, capture_output=True), None
+
+    process = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+    # Read both pipes concurrently so the process cannot block on a full pipe
+    output = {}
+
+    def read(name, stream):
+        output[name] = stream.read()
+
+    readers = [
+        threading.Thread(target=read, args=(name, stream))
+        for name, stream in (('stdout', process.stdout), ('stderr', process.stderr))
+    ]
+    for reader in readers:
+        reader.start()
+
+    timed_out = threading.Event()
+
+    def kill():
+        timed_out.set()
+        process.kill()
+
+    timer = threading.Timer(timeout, kill) if timeout is not None else None
+    if timer is not None:
+        timer.start()
+    try:
+        _, status, rusage = os.wait4(process.pid, 0)
+    finally:
+        if timer is not None:
+            timer.cancel()
+    process.returncode = os.waitstatus_to_exitcode(status)
+
+    for reader in readers:
+        reader.join()
+    process.stdout.close()
+    process.stderr.close()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(
+            args, timeout, output=output['stdout'], stderr=output['stderr']
+        )
+
+    # ru_maxrss is given in kilobytes on Linux and in bytes on macOS
+    peak_rss = rusage.ru_maxrss
+    if platform.system() != 'Darwin':
+        peak_rss *= 1024
+
+    completed = subprocess.CompletedProcess(
+        args, process.returncode, output['stdout'], output['stderr']
+    )
+    return completed, peak_rss
+
+
+def time_phase(
+        timings: Optional[dict[str, int]],
+        phase: str,
+        ) -> contextlib.AbstractContextManager:
+    """
+    Measure the wall time of a phase of a run.
+
+    Parameters
+    ----------
+    timings : Optional[dict[str, int]]
+        Timings to add the wall time to, in nanoseconds. If None, nothing is measured.
+    phase : str
+        Name of the phase.
+
+    Returns
+    -------
+    contextlib.AbstractContextManager
+        Context manager measuring the wall time of its block.
+    """
+    if timings is None:
+        return _NOT_MEASURED
+    return _Phase(timings, phase)
 
 
 class CadetRunnerBase(ABC):
@@ -33,8 +277,20 @@ class CadetRunnerBase(ABC):
     Abstract base class for CADET runners.
 
     Subclasses must implement the `run`, `clear`, and `load_results` methods.
+
+    Attributes
+    ----------
+    collect_timings : bool
+        If True, `run` reports the wall time of its phases in
+        `ReturnInformation.timings`.
+    collect_memory : bool
+        If True, `run` reports the memory usage of the run in
+        `ReturnInformation.memory`.
     """
 
+    collect_timings: bool = False
+    collect_memory: bool = False
+
     @abstractmethod
     def run(
             self,
@@ -66,7 +322,13 @@ class CadetRunnerBase(ABC):
         pass
 
     @abstractmethod
-    def load_results(self, sim: "Cadet") -> None:
+    def load_results(
+            self,
+            sim: "Cadet",
+            paths: Optional[list[str]] = None,
+            own_data: bool = True,
+            lazy: bool = False,
+    ) -> Optional[Any]:
         """
         Load the results of the simulation into the provided object.
 
@@ -74,6 +336,22 @@ class CadetRunnerBase(ABC):
         ----------
         sim : Cadet
             The simulation object where results will be loaded.
+        paths : Optional[list[str]]
+            Paths or glob patterns of the results to load, relative to the root, e.g.
+            'output/solution/unit_003/solution_outlet*' or 'meta/time_sim'.
+            If None, all results are loaded.
+        own_data : bool, default=True
+            If False, runners that support it load arrays as views into memory held
+            by the runner instead of copies.
+        lazy : bool, default=False
+            If True, runners that support it only fetch results when they are first
+            accessed.
+
+        Returns
+        -------
+        Optional[Any]
+            A handle on the memory backing the loaded views, or None if the loaded
+            arrays own their data.
         """
         pass
 
@@ -152,16 +430,31 @@ class CadetCLIRunner(CadetRunnerBase):
         if simulation.filename is None:
             raise ValueError("Filename must be set before run can be used")
 
-        data = subprocess.run(
-            [self.cadet_path, str(simulation.filename)],
-            timeout=timeout,
-            capture_output=True
-        )
+        timings = {} if self.collect_timings else None
+        memory = None
+
+        with time_phase(timings, 'run'):
+            if self.collect_memory:
+                data, peak_rss = _run_process(
+                    [self.cadet_path, str(simulation.filename)],
+                    timeout=timeout,
+                )
+                memory = {}
+                if peak_rss is not None:
+                    memory['child_peak_rss'] = peak_rss
+            else:
+                data = subprocess.run(
+                    [self.cadet_path, str(simulation.filename)],
+                    timeout=timeout,
+                    capture_output=True
+                )
 
         return_info = ReturnInformation(
             return_code=data.returncode,
             error_message=data.stderr.decode('utf-8'),
-            log=data.stdout.decode('utf-8')
+            log=data.stdout.decode('utf-8'),
+            timings=timings,
+            memory=memory,
         )
 
         return return_info
@@ -174,7 +467,13 @@ class CadetCLIRunner(CadetRunnerBase):
         """
         pass
 
-    def load_results(self, sim: "Cadet") -> None:
+    def load_results(
+            self,
+            sim: "Cadet",
+            paths: Optional[list[str]] = None,
+            own_data: bool = True,
+            lazy: bool = False,
+    ) -> None:
         """
         Load the results of the simulation into the provided object.
 
@@ -182,8 +481,19 @@ class CadetCLIRunner(CadetRunnerBase):
         ----------
         sim : Cadet
             The simulation object where results will be loaded.
+        paths : Optional[list[str]]
+            Paths or glob patterns of the results to load, relative to the root.
+            Only matching datasets are read from the file. If None, all of `/meta` and
+            `/output` is loaded.
+        own_data : bool, default=True
+            Ignored, results read from file always own their data.
+        lazy : bool, default=False
+            Ignored, results are always read from file immediately.
         """
-        sim.load_from_file(paths=["/meta", "/output"], update=True)
+        if paths is None:
+            sim.load_from_file(paths=["/meta", "/output"], update=True)
+        else:
+            sim.load_from_file(patterns=paths, update=True)
 
     def _get_cadet_version(self) -> dict:
         """
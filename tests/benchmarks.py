@@ -0,0 +1,460 @@
+"""
+Micro-benchmarks of the Python-side hot paths.
+
+The benchmarks measure the wall time and the peak memory allocated by Python of
+saving and loading HDF5 and JSON files, generating Python scripts, the parameter
+provider, the fan-out of IO solutions and complete runs of the DLL and CLI runners.
+They do not require a CADET installation: the runners use the stand-in installation
+of `tests.fake_cadet`, which is built with the C compiler of the machine.
+
+The file is not collected by a plain `pytest` run. Run the benchmarks with::
+
+    pytest tests/benchmarks.py -m benchmark
+
+or as a script, which can store the results and compare them to a baseline::
+
+    python -m tests.benchmarks --output new.json --compare baseline.json
+
+With pytest, the results are written to the file in the environment variable
+`CADET_BENCHMARK_OUTPUT`, if set.
+"""
+
+import argparse
+import ctypes
+import json
+import os
+from pathlib import Path
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Optional
+
+from addict import Dict
+import h5py
+import numpy as np
+import pytest
+
+from cadet import Cadet, H5
+from cadet.cadet_dll import CadetDLLRunner
+from cadet.cadet_dll_parameterprovider import (
+    CompiledParameterProvider, PARAMETERPROVIDER
+)
+from cadet.h5 import recursively_load, recursively_save
+from tests.fake_cadet import build
+
+pytestmark = pytest.mark.benchmark
+
+N_UNITS = 20
+N_COMP = 4
+N_TIME = 1001
+N_COL = 50
+N_PORT = 4
+
+BENCHMARKS: dict[str, Callable[[Path], Callable[[], Any]]] = {}
+
+
+def benchmark(func: Callable[[Path], Callable[[], Any]]):
+    """
+    Register a benchmark.
+
+    The decorated function prepares the benchmark in a temporary directory and
+    returns the function to measure.
+    """
+    BENCHMARKS[func.__name__] = func
+    return func
+
+
+class Simulation:
+    """Stand-in for a Cadet object, providing the input tree only."""
+
+    def __init__(self, root: Dict):
+        self.root = root
+
+
+class CadetFile(H5):
+    """HDF5 file with the key transformation of CADET files."""
+
+    def transform(self, x):
+        return str.upper(x)
+
+    def inverse_transform(self, x):
+        return str.lower(x)
+
+
+def make_input() -> Dict:
+    """Create the input of a flow sheet of `N_UNITS` general rate models."""
+    model = Dict()
+    model.nunits = N_UNITS
+    for unit in range(N_UNITS):
+        unit_input = model[f'unit_{unit:03d}']
+        unit_input.unit_type = 'GENERAL_RATE_MODEL'
+        unit_input.ncomp = N_COMP
+        unit_input.col_dispersion = 5.75e-8
+        unit_input.col_length = 0.014
+        unit_input.col_porosity = 0.37
+        unit_input.par_porosity = 0.75
+        unit_input.par_radius = 4.5e-5
+        unit_input.film_diffusion = [6.9e-6] * N_COMP
+        unit_input.par_diffusion = [7e-10, 6.07e-11, 6.07e-11, 6.07e-11][:N_COMP]
+        unit_input.init_c = [50.0] + [0.0] * (N_COMP - 1)
+        unit_input.init_q = [1200.0] + [0.0] * (N_COMP - 1)
+        unit_input.adsorption_model = 'STERIC_MASS_ACTION'
+        unit_input.adsorption.is_kinetic = 0
+        unit_input.adsorption.sma_ka = [0.0, 35.5, 1.59, 7.7][:N_COMP]
+        unit_input.adsorption.sma_kd = [0.0, 1000.0, 1000.0, 1000.0][:N_COMP]
+        unit_input.adsorption.sma_lambda = 1200.0
+        unit_input.adsorption.sma_nu = [0.0, 4.7, 5.29, 3.7][:N_COMP]
+        unit_input.adsorption.sma_sigma = [0.0, 11.83, 10.6, 10.0][:N_COMP]
+        unit_input.discretization.ncol = N_COL
+        unit_input.discretization.npar = 10
+        unit_input.discretization.nbound = [1] * N_COMP
+        unit_input.discretization.par_disc_type = 'EQUIDISTANT_PAR'
+        for section in range(3):
+            unit_input[f'sec_{section:03d}'].const_coeff = np.linspace(0, 1, N_COMP)
+            unit_input[f'sec_{section:03d}'].lin_coeff = np.zeros(N_COMP)
+
+    model.connections.nswitches = 1
+    model.connections.switch_000.section = 0
+    model.connections.switch_000.connections = np.arange(7.0 * (N_UNITS - 1))
+
+    simulation_input = Dict()
+    simulation_input.model = model
+    simulation_input.solver.user_solution_times = np.linspace(0, 1500, N_TIME)
+    simulation_input.solver.sections.nsec = 3
+    simulation_input.solver.sections.section_times = [0.0, 10.0, 90.0, 1500.0]
+    simulation_input.solver.sections.section_continuity = [0, 0]
+    simulation_input.solver.time_integrator.abstol = 1e-10
+    simulation_input.solver.time_integrator.reltol = 1e-6
+    simulation_input['return'].split_components_data = 1
+    return simulation_input
+
+
+def make_root() -> Dict:
+    """Create input and output of a realistically sized simulation."""
+    root = Dict()
+    root.input = make_input()
+    rng = np.random.default_rng(0)
+    for unit in range(N_UNITS):
+        solution = root.output.solution[f'unit_{unit:03d}']
+        solution.solution_outlet = rng.random((N_TIME, N_COMP))
+        solution.solution_inlet = rng.random((N_TIME, N_COMP))
+        solution.solution_bulk = rng.random((N_TIME, N_COL, N_COMP))
+    root.output.solution.solution_time = root.input.solver.user_solution_times
+    return root
+
+
+@benchmark
+def h5_save(directory: Path) -> Callable[[], Any]:
+    root = make_root()
+    filename = directory / 'save.h5'
+
+    def run():
+        with h5py.File(filename, 'w') as h5file:
+            recursively_save(h5file, '/', root, str.upper)
+
+    return run
+
+
+@benchmark
+def h5_load(directory: Path) -> Callable[[], Any]:
+    filename = directory / 'load.h5'
+    with h5py.File(filename, 'w') as h5file:
+        recursively_save(h5file, '/', make_root(), str.upper)
+
+    def run():
+        with h5py.File(filename, 'r') as h5file:
+            return recursively_load(h5file, '/', str.lower, None)
+
+    return run
+
+
+@benchmark
+def json_save(directory: Path) -> Callable[[], Any]:
+    file = CadetFile()
+    file.root.input = make_input()
+    filename = directory / 'save.json'
+    return lambda: file.save_json(filename)
+
+
+@benchmark
+def json_load(directory: Path) -> Callable[[], Any]:
+    file = CadetFile()
+    file.root.input = make_input()
+    filename = directory / 'load.json'
+    file.save_json(filename)
+    return lambda: file.load_json(filename)
+
+
+@benchmark
+def python_script(directory: Path) -> Callable[[], Any]:
+    file = CadetFile()
+    file.root.input = make_input()
+    filename = str(directory / 'script.py')
+    return lambda: file.save_as_python_script(filename)
+
+
+def query_parameters(pp: ctypes.Structure) -> None:
+    """Query the parameters of all units, as CADET does when configuring a model."""
+    value = ctypes.c_double()
+    n_elem = ctypes.c_int()
+    array = ctypes.POINTER(ctypes.c_double)()
+    string = ctypes.c_char_p()
+
+    pp.pushScope(pp.userData, b'model')
+    for unit in range(N_UNITS):
+        pp.pushScope(pp.userData, f'unit_{unit:03d}'.encode())
+        pp.getString(pp.userData, b'UNIT_TYPE', ctypes.byref(string))
+        for name in (b'COL_DISPERSION', b'COL_LENGTH', b'COL_POROSITY', b'PAR_RADIUS'):
+            pp.exists(pp.userData, name)
+            pp.getDouble(pp.userData, name, ctypes.byref(value))
+        for name in (b'FILM_DIFFUSION', b'PAR_DIFFUSION', b'INIT_C', b'INIT_Q'):
+            pp.isArray(pp.userData, name, ctypes.byref(ctypes.c_uint8()))
+            pp.getDoubleArray(pp.userData, name, ctypes.byref(n_elem), ctypes.byref(array))
+        pp.pushScope(pp.userData, b'adsorption')
+        for name in (b'SMA_KA', b'SMA_KD', b'SMA_NU', b'SMA_SIGMA'):
+            pp.getDoubleArray(pp.userData, name, ctypes.byref(n_elem), ctypes.byref(array))
+        pp.popScope(pp.userData)
+        pp.popScope(pp.userData)
+    pp.popScope(pp.userData)
+
+
+@benchmark
+def parameter_provider_construction(directory: Path) -> Callable[[], Any]:
+    simulation = Simulation(make_root())
+    return lambda: PARAMETERPROVIDER(simulation)
+
+
+@benchmark
+def parameter_provider_callbacks(directory: Path) -> Callable[[], Any]:
+    pp = PARAMETERPROVIDER(Simulation(make_root()))
+    return lambda: query_parameters(pp)
+
+
+@benchmark
+def compiled_provider_construction(directory: Path) -> Callable[[], Any]:
+    simulation = Simulation(make_root())
+    return lambda: CompiledParameterProvider(simulation)
+
+
+@benchmark
+def compiled_provider_callbacks(directory: Path) -> Callable[[], Any]:
+    pp = CompiledParameterProvider(Simulation(make_root()))
+    return lambda: query_parameters(pp)
+
+
+class FakeResult:
+    """Stand-in for a SimulationResult, returning the same outlet for every unit."""
+
+    def __init__(self, data):
+        self.data = data
+
+    def solution_outlet(self, unitOpId):
+        return self.data
+
+
+@benchmark
+def solution_io_fan_out(directory: Path) -> Callable[[], Any]:
+    # The IO loader only depends on the output layout, not on a loaded library
+    runner = CadetDLLRunner.__new__(CadetDLLRunner)
+    simulation = Simulation(make_root())
+    for unit in range(N_UNITS):
+        simulation.root.input['return'][f'unit_{unit:03d}'].write_solution_outlet = 1
+    res = FakeResult((
+        simulation.root.input.solver.user_solution_times,
+        np.random.default_rng(0).random((N_TIME, N_PORT, 32)),
+        ['nTime', 'nPort', 'nComp'],
+    ))
+
+    def run():
+        for unit in range(N_UNITS):
+            runner._load_solution_io(simulation, unit, 'solution_outlet', res=res)
+
+    return run
+
+
+def make_fake_model(directory: Path, use_dll: bool) -> Cadet:
+    """
+    Create a simulation of `N_UNITS` units for the stand-in CADET installation.
+
+    Raises
+    ------
+    RuntimeError
+        If the stand-in installation cannot be built.
+    """
+    install_path = directory / 'fake_cadet'
+    if not (install_path / 'lib').exists():
+        build(install_path)
+
+    model = Cadet(install_path=install_path, use_dll=use_dll)
+    model.filename = str(directory / f'fake_{use_dll}.h5')
+    model.root.input = make_input()
+    for unit in range(N_UNITS):
+        unit_return = model.root.input['return'][f'unit_{unit:03d}']
+        unit_return.write_solution_inlet = 1
+        unit_return.write_solution_outlet = 1
+        unit_return.write_solution_bulk = 1
+    model.root.input['return'].write_solution_times = 1
+    return model
+
+
+@benchmark
+def dll_run_simulation(directory: Path) -> Callable[[], Any]:
+    model = make_fake_model(directory, use_dll=True)
+    return model.run_simulation
+
+
+@benchmark
+def cli_run_simulation(directory: Path) -> Callable[[], Any]:
+    model = make_fake_model(directory, use_dll=False)
+
+    def run():
+        model.save()
+        return model.run_simulation()
+
+    return run
+
+
+def measure(func: Callable[[], Any], repeat: int = 5) -> dict[str, float]:
+    """
+    Measure the wall time and the peak memory of a function.
+
+    The memory is measured in a separate call, since tracing allocations slows
+    down the function.
+
+    Returns
+    -------
+    dict[str, float]
+        Minimum, median and mean time in seconds and peak memory in bytes.
+    """
+    func()
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'time_min': min(times),
+        'time_median': statistics.median(times),
+        'time_mean': statistics.mean(times),
+        'peak_memory': peak_memory,
+        'repeat': repeat,
+    }
+
+
+def run_benchmarks(names: Optional[list[str]] = None, repeat: int = 5) -> dict[str, dict]:
+    """Run the benchmarks of the given names, or all benchmarks."""
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for name in names or BENCHMARKS:
+            try:
+                func = BENCHMARKS[name](Path(directory))
+            except RuntimeError as e:
+                print(f"Skipping {name}: {e}")
+                continue
+            results[name] = measure(func, repeat)
+    return results
+
+
+def write_results(results: dict[str, dict], filename: str | Path) -> None:
+    """Write benchmark results and information about the environment to JSON."""
+    data = {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'h5py': h5py.__version__,
+        'machine': platform.machine(),
+        'benchmarks': results,
+    }
+    with Path(filename).open('w') as fp:
+        json.dump(data, fp, indent=4, sort_keys=True)
+
+
+def compare_results(
+        results: dict[str, dict],
+        baseline: dict[str, dict],
+        tolerance: float = 0.2,
+        ) -> list[str]:
+    """
+    Compare benchmark results to a baseline.
+
+    Returns
+    -------
+    list[str]
+        Names of the benchmarks whose median time or peak memory increased by more
+        than `tolerance`.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        time_ratio = result['time_median'] / baseline[name]['time_median']
+        memory_ratio = result['peak_memory'] / max(baseline[name]['peak_memory'], 1)
+        print(f"{name:35s} time {time_ratio:6.2f}x  memory {memory_ratio:6.2f}x")
+        if time_ratio > 1 + tolerance or memory_ratio > 1 + tolerance:
+            regressions.append(name)
+    return regressions
+
+
+_results: dict[str, dict] = {}
+
+
+@pytest.fixture(scope='module', autouse=True)
+def benchmark_output():
+    yield
+    output = os.environ.get('CADET_BENCHMARK_OUTPUT')
+    if output and _results:
+        write_results(_results, output)
+
+
+@pytest.mark.parametrize('name', list(BENCHMARKS))
+def test_benchmark(name, tmp_path):
+    try:
+        func = BENCHMARKS[name](tmp_path)
+    except RuntimeError as e:
+        pytest.skip(str(e))
+    _results[name] = measure(func)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('names', nargs='*', help="Benchmarks to run (default: all).")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help="Write the results to this JSON file.")
+    parser.add_argument('--compare', help="Compare the results to this JSON file.")
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.names, args.repeat)
+    for name, result in results.items():
+        print(
+            f"{name:35s} {result['time_median'] * 1e3:10.3f} ms "
+            f"{result['peak_memory'] / 2**20:10.3f} MiB"
+        )
+
+    if args.output:
+        write_results(results, args.output)
+
+    if args.compare:
+        with Path(args.compare).open() as fp:
+            baseline = json.load(fp)['benchmarks']
+        regressions = compare_results(results, baseline, args.tolerance)
+        if regressions:
+            print(f"Regressions: {', '.join(regressions)}")
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Stand-in CADET installation for testing and benchmarking without CADET-Core.
+
+`build` compiles the fake libcadet (libcadet.c) and creates `cadet-cli` and
+`createLWE` executables backed by cli.py, laid out like a CADET installation::
+
+    from cadet import Cadet
+    from tests.fake_cadet import build
+
+    simulation = Cadet(install_path=build(tmp_path))
+
+Only Linux and macOS with a C compiler are supported.
+"""
+
+import os
+from pathlib import Path
+import platform
+import shutil
+import subprocess
+import sys
+from typing import Optional
+
+SOURCE_DIR = Path(__file__).parent
+
+_WRAPPER = """#!{python}
+import sys
+sys.path.insert(0, {source_dir!r})
+from cli import {function}
+sys.exit({function}(sys.argv[1:]))
+"""
+
+
+def find_compiler() -> Optional[str]:
+    """Find a C compiler, preferring the one in `$CC`."""
+    for compiler in (os.environ.get('CC'), 'cc', 'gcc', 'clang'):
+        if compiler and shutil.which(compiler):
+            return compiler
+    return None
+
+
+def build(install_path: os.PathLike) -> Path:
+    """
+    Build the stand-in CADET installation.
+
+    Parameters
+    ----------
+    install_path : os.PathLike
+        Root directory of the installation. `bin/` and `lib/` are created in it.
+
+    Raises
+    ------
+    RuntimeError
+        If the platform is not supported, no C compiler is found, or compilation
+        fails.
+
+    Returns
+    -------
+    Path
+        The root directory of the installation.
+    """
+    if platform.system() == 'Windows':
+        raise RuntimeError("The fake CADET installation is not supported on Windows.")
+
+    compiler = find_compiler()
+    if compiler is None:
+        raise RuntimeError("No C compiler found to build the fake CADET library.")
+
+    install_path = Path(install_path)
+    bin_dir = install_path / 'bin'
+    lib_dir = install_path / 'lib'
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    lib_dir.mkdir(parents=True, exist_ok=True)
+
+    library = 'libcadet.dylib' if platform.system() == 'Darwin' else 'libcadet.so'
+    result = subprocess.run(
+        [
+            compiler, '-O2', '-shared', '-fPIC', '-std=gnu99',
+            '-o', str(lib_dir / library), str(SOURCE_DIR / 'libcadet.c'),
+        ],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Building the fake CADET library failed:\n{result.stderr}")
+
+    for executable, function in (('cadet-cli', 'cadet_cli'), ('createLWE', 'create_lwe')):
+        path = bin_dir / executable
+        path.write_text(_WRAPPER.format(
+            python=sys.executable, source_dir=str(SOURCE_DIR), function=function
+        ))
+        path.chmod(0o755)
+
+    return install_path
@@ -0,0 +1,141 @@
+"""
+Stand-ins for the `cadet-cli` and `createLWE` executables.
+
+`cadet_cli` reads the same parameters as the fake libcadet (see libcadet.c) from an
+HDF5 file and writes the same synthetic solution to its `/output` group, honoring
+the `write_*` flags and the component and port splitting of `/input/return`.
+If `/input/solver/FAKE_SLEEP` is set, it sleeps for that many seconds first to
+simulate a slow solver.
+"""
+
+import sys
+import time
+
+import h5py
+import numpy as np
+
+VERSION_TEXT = """This is cadet-cli version 5.1.0 (refs/heads/fake branch)
+Built from commit 0000000000000000000000000000000000000000
+Build variant Release
+"""
+
+
+def outlet_value(unit: int, n_comp: int, times: np.ndarray) -> np.ndarray:
+    """Synthetic outlet of a unit operation, shape (nTime, nComp)."""
+    times = times[:, np.newaxis]
+    return times / (times + unit + np.arange(n_comp) + 1.0)
+
+
+def read_int(group: h5py.Group, name: str, default: int) -> int:
+    return int(group[name][()]) if name in group else default
+
+
+def write_port(
+        group: h5py.Group,
+        name: str,
+        data: np.ndarray,
+        return_unit: h5py.Group,
+        return_group: h5py.Group,
+        ) -> None:
+    """Write a single-port solution with the splitting of the CLI."""
+    if not read_int(return_unit, f'WRITE_{name}', 0):
+        return
+
+    if read_int(return_group, 'SINGLE_AS_MULTI_PORT', 0) \
+            and read_int(return_group, 'SPLIT_PORTS_DATA', 1):
+        name += '_PORT_000'
+
+    if read_int(return_group, 'SPLIT_COMPONENTS_DATA', 1):
+        for comp in range(data.shape[-1]):
+            group[f'{name}_COMP_{comp:03d}'] = data[:, comp]
+    else:
+        group[name] = data
+
+
+def cadet_cli(argv: list[str]) -> int:
+    if argv == ['--version']:
+        print(VERSION_TEXT, end='')
+        return 0
+
+    if len(argv) != 1:
+        print("Usage: cadet-cli <file>", file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    with h5py.File(argv[0], 'r+') as h5file:
+        sim_input = h5file['input']
+        if 'USER_SOLUTION_TIMES' not in sim_input['solver']:
+            print("Fake cadet-cli requires solver/USER_SOLUTION_TIMES", file=sys.stderr)
+            return 1
+        times = sim_input['solver/USER_SOLUTION_TIMES'][()]
+        if 'FAKE_SLEEP' in sim_input['solver']:
+            time.sleep(float(sim_input['solver/FAKE_SLEEP'][()]))
+
+        return_group = sim_input['return']
+        if 'output' in h5file:
+            del h5file['output']
+        output = h5file.create_group('output')
+        solution = output.create_group('solution')
+
+        model = sim_input['model']
+        last_state = []
+        for unit in range(read_int(model, 'NUNITS', 0)):
+            unit_index = f'unit_{unit:03d}'
+            unit_input = model[unit_index]
+            n_comp = read_int(unit_input, 'NCOMP', 1)
+            n_col = 1
+            if 'discretization' in unit_input:
+                n_col = read_int(unit_input['discretization'], 'NCOL', 1)
+
+            outlet = outlet_value(unit, n_comp, times)
+            inlet = outlet / 2
+            bulk = outlet[:, np.newaxis, :] * (np.arange(n_col) + 1.0)[:, np.newaxis] / n_col
+            last_state.extend([inlet[-1], outlet[-1], bulk[-1].ravel()])
+
+            return_unit = return_group.get(unit_index, {})
+            unit_solution = solution.create_group(unit_index)
+            write_port(unit_solution, 'SOLUTION_OUTLET', outlet, return_unit, return_group)
+            write_port(unit_solution, 'SOLUTION_INLET', inlet, return_unit, return_group)
+            if read_int(return_unit, 'WRITE_SOLUTION_BULK', 0):
+                unit_solution['SOLUTION_BULK'] = bulk
+
+        if read_int(return_group, 'WRITE_SOLUTION_TIMES', 0):
+            solution['SOLUTION_TIMES'] = times
+        if read_int(return_group, 'WRITE_SOLUTION_LAST', 0):
+            output['LAST_STATE_Y'] = np.concatenate(last_state)
+
+        meta = h5file.require_group('meta')
+        for name, value in (('FILE_FORMAT', 40000), ('TIME_SIM', time.perf_counter() - start)):
+            if name in meta:
+                del meta[name]
+            meta[name] = value
+
+    print(f"Simulated {len(last_state) // 3} units at {len(times)} time points")
+    return 0
+
+
+def create_lwe(argv: list[str]) -> int:
+    if len(argv) != 2 or argv[0] != '-o':
+        print("Usage: createLWE -o <file>", file=sys.stderr)
+        return 1
+
+    with h5py.File(argv[1], 'w') as h5file:
+        model = h5file.create_group('input/model')
+        model['NUNITS'] = 3
+        for unit, (unit_type, n_col) in enumerate(
+                (('INLET', 1), ('GENERAL_RATE_MODEL', 16), ('OUTLET', 1))
+        ):
+            unit_input = model.create_group(f'unit_{unit:03d}')
+            unit_input['UNIT_TYPE'] = np.bytes_(unit_type)
+            unit_input['NCOMP'] = 4
+            unit_input.create_group('discretization')['NCOL'] = n_col
+
+        h5file['input/solver/USER_SOLUTION_TIMES'] = np.linspace(0, 1500, 1501)
+        return_group = h5file.create_group('input/return')
+        return_group['SPLIT_COMPONENTS_DATA'] = 0
+        return_group['WRITE_SOLUTION_TIMES'] = 1
+        for unit in range(3):
+            return_unit = return_group.create_group(f'unit_{unit:03d}')
+            return_unit['WRITE_SOLUTION_INLET'] = 1
+            return_unit['WRITE_SOLUTION_OUTLET'] = 1
+    return 0
@@ -0,0 +1,519 @@
+/*
+ * Stand-in for libcadet implementing the CADET C-API v1.1.0a2.
+ *
+ * The fake driver queries the model structure from the parameter provider and
+ * returns synthetic solutions without solving anything, so the Python overhead
+ * around the solver can be tested and benchmarked without a CADET build.
+ *
+ * Queried parameters (relative to /input):
+ *   model/NUNITS, model/unit_XXX/UNIT_TYPE, model/unit_XXX/NCOMP (default 1),
+ *   model/unit_XXX/discretization/NCOL (default 1), solver/USER_SOLUTION_TIMES
+ *
+ * For unit u, component c and time t, the outlet is f = t / (t + u + c + 1),
+ * the inlet is f / 2 and bulk cell k of n cells is f * (k + 1) / n. The fake
+ * cadet-cli (cli.py) writes the same values.
+ */
+
+#include <stdint.h>
+#include <stdlib.h>
+#include <stdio.h>
+#include <string.h>
+#include <time.h>
+
+#define CDT_OK 0
+#define CDT_ERROR -1
+#define CDT_ERROR_INVALID_INPUTS -2
+#define CDT_DATA_NOT_STORED -3
+
+#define LOG_ERROR 2
+#define LOG_INFO 4
+
+typedef int cdtResult;
+
+typedef struct
+{
+	void* userData;
+
+	cdtResult (*getDouble)(void* userData, const char* paramName, double* val);
+	cdtResult (*getInt)(void* userData, const char* paramName, int* val);
+	cdtResult (*getBool)(void* userData, const char* paramName, uint8_t* val);
+	cdtResult (*getString)(void* userData, const char* paramName, const char** val);
+
+	cdtResult (*getDoubleArray)(void* userData, const char* paramName, int* numElements, double** vals);
+	cdtResult (*getIntArray)(void* userData, const char* paramName, int* numElements, int** vals);
+	cdtResult (*getBoolArray)(void* userData, const char* paramName, int* numElements, uint8_t** vals);
+	cdtResult (*getStringArray)(void* userData, const char* paramName, int* numElements, const char*** vals);
+
+	cdtResult (*getDoubleArrayItem)(void* userData, const char* paramName, int idx, double* val);
+	cdtResult (*getIntArrayItem)(void* userData, const char* paramName, int idx, int* val);
+	cdtResult (*getBoolArrayItem)(void* userData, const char* paramName, int idx, uint8_t* val);
+	cdtResult (*getStringArrayItem)(void* userData, const char* paramName, int idx, const char** val);
+
+	int (*exists)(void* userData, const char* elemName);
+	cdtResult (*isArray)(void* userData, const char* elemName, uint8_t* res);
+	int (*numElements)(void* userData, const char* elemName);
+	cdtResult (*pushScope)(void* userData, const char* scope);
+	cdtResult (*popScope)(void* userData);
+} cdtParameterProvider;
+
+typedef struct
+{
+	int nComp;
+	int nCol;
+	double* inlet;
+	double* outlet;
+	double* bulk;
+} Unit;
+
+typedef struct
+{
+	int nUnits;
+	Unit* units;
+	int nTime;
+	int nReached;
+	double* time;
+	double* lastState;
+	int nStates;
+	double timeSim;
+	double timeout;
+} Driver;
+
+typedef void (*cdtLogReceiver)(const char* file, const char* func, unsigned int line, int level, const char* levelName, const char* message);
+
+static cdtLogReceiver logReceiver = NULL;
+static int logLevel = LOG_ERROR;
+
+static void emitLog(int level, const char* levelName, const char* func, const char* message)
+{
+	if (logReceiver && (level <= logLevel))
+		logReceiver(__FILE__, func, __LINE__, level, levelName, message);
+}
+
+const char* cdtGetLibraryVersion() { return "5.1.0"; }
+const char* cdtGetLibraryCommitHash() { return "0000000000000000000000000000000000000000"; }
+const char* cdtGetLibraryBranchRefspec() { return "refs/heads/fake"; }
+const char* cdtGetLibraryBuildType() { return "Release"; }
+const char* cdtGetLatestCAPIVersion() { return "1.1.0a2"; }
+
+void cdtSetLogReceiver(cdtLogReceiver recv) { logReceiver = recv; }
+void cdtSetLogLevel(int level) { logLevel = level; }
+
+static double now()
+{
+	struct timespec ts;
+	clock_gettime(CLOCK_MONOTONIC, &ts);
+	return ts.tv_sec + ts.tv_nsec * 1e-9;
+}
+
+static void clearDriver(Driver* drv)
+{
+	for (int i = 0; i < drv->nUnits; ++i)
+	{
+		free(drv->units[i].inlet);
+		free(drv->units[i].outlet);
+		free(drv->units[i].bulk);
+	}
+	free(drv->units);
+	free(drv->time);
+	free(drv->lastState);
+
+	const double timeout = drv->timeout;
+	memset(drv, 0, sizeof(Driver));
+	drv->timeout = timeout;
+}
+
+static void* createDriver()
+{
+	return calloc(1, sizeof(Driver));
+}
+
+static void deleteDriver(void* drv)
+{
+	if (!drv)
+		return;
+	clearDriver((Driver*)drv);
+	free(drv);
+}
+
+static cdtResult getFileFormat(int* fileFormat)
+{
+	*fileFormat = 40000;
+	return CDT_OK;
+}
+
+static int getIntOrDefault(cdtParameterProvider* pp, const char* name, int fallback)
+{
+	int value = fallback;
+	if (pp->exists(pp->userData, name))
+		pp->getInt(pp->userData, name, &value);
+	return value;
+}
+
+static cdtResult configure(Driver* drv, cdtParameterProvider* pp)
+{
+	clearDriver(drv);
+
+	if (pp->pushScope(pp->userData, "solver") != CDT_OK)
+		return CDT_ERROR;
+	int nTime = 0;
+	double* time = NULL;
+	const cdtResult timeResult = pp->getDoubleArray(pp->userData, "USER_SOLUTION_TIMES", &nTime, &time);
+	pp->popScope(pp->userData);
+	if ((timeResult != CDT_OK) || (nTime <= 0))
+	{
+		emitLog(LOG_ERROR, "Error", __func__, "Fake driver requires solver/USER_SOLUTION_TIMES");
+		return CDT_ERROR;
+	}
+
+	drv->nTime = nTime;
+	drv->time = malloc(nTime * sizeof(double));
+	memcpy(drv->time, time, nTime * sizeof(double));
+
+	if (pp->pushScope(pp->userData, "model") != CDT_OK)
+		return CDT_ERROR;
+
+	drv->nUnits = getIntOrDefault(pp, "NUNITS", 0);
+	drv->units = calloc(drv->nUnits, sizeof(Unit));
+
+	for (int i = 0; i < drv->nUnits; ++i)
+	{
+		Unit* unit = drv->units + i;
+		char scope[16];
+		snprintf(scope, sizeof(scope), "unit_%03d", i);
+		if (pp->pushScope(pp->userData, scope) != CDT_OK)
+		{
+			pp->popScope(pp->userData);
+			return CDT_ERROR;
+		}
+
+		const char* unitType = NULL;
+		pp->getString(pp->userData, "UNIT_TYPE", &unitType);
+
+		unit->nComp = getIntOrDefault(pp, "NCOMP", 1);
+		unit->nCol = 1;
+		if (pp->pushScope(pp->userData, "discretization") == CDT_OK)
+		{
+			unit->nCol = getIntOrDefault(pp, "NCOL", 1);
+			pp->popScope(pp->userData);
+		}
+		pp->popScope(pp->userData);
+
+		unit->inlet = calloc(nTime * unit->nComp, sizeof(double));
+		unit->outlet = calloc(nTime * unit->nComp, sizeof(double));
+		unit->bulk = calloc(nTime * unit->nCol * unit->nComp, sizeof(double));
+		drv->nStates += (unit->nCol + 2) * unit->nComp;
+	}
+
+	pp->popScope(pp->userData);
+
+	drv->lastState = calloc(drv->nStates, sizeof(double));
+	return CDT_OK;
+}
+
+static double outletValue(int unit, int comp, double t)
+{
+	return t / (t + unit + comp + 1.0);
+}
+
+static void integrate(Driver* drv, double tEnd)
+{
+	const double start = now();
+
+	int idx = drv->nReached;
+	for (; (idx < drv->nTime) && (drv->time[idx] <= tEnd); ++idx)
+	{
+		const double t = drv->time[idx];
+		for (int i = 0; i < drv->nUnits; ++i)
+		{
+			Unit* unit = drv->units + i;
+			for (int c = 0; c < unit->nComp; ++c)
+			{
+				const double f = outletValue(i, c, t);
+				unit->outlet[idx * unit->nComp + c] = f;
+				unit->inlet[idx * unit->nComp + c] = f / 2.0;
+				for (int k = 0; k < unit->nCol; ++k)
+					unit->bulk[(idx * unit->nCol + k) * unit->nComp + c] = f * (k + 1.0) / unit->nCol;
+			}
+		}
+	}
+	drv->nReached = idx;
+
+	// Last state: inlet, outlet and bulk of each unit at the last time point
+	if (idx > 0)
+	{
+		double* state = drv->lastState;
+		for (int i = 0; i < drv->nUnits; ++i)
+		{
+			const Unit* unit = drv->units + i;
+			const int nComp = unit->nComp;
+			memcpy(state, unit->inlet + (idx - 1) * nComp, nComp * sizeof(double));
+			memcpy(state + nComp, unit->outlet + (idx - 1) * nComp, nComp * sizeof(double));
+			memcpy(state + 2 * nComp, unit->bulk + (idx - 1) * unit->nCol * nComp, unit->nCol * nComp * sizeof(double));
+			state += (unit->nCol + 2) * nComp;
+		}
+	}
+
+	drv->timeSim += now() - start;
+}
+
+static cdtResult runSimulation(void* drv, cdtParameterProvider* pp)
+{
+	Driver* driver = (Driver*)drv;
+	if (!driver || !pp)
+		return CDT_ERROR_INVALID_INPUTS;
+
+	if (configure(driver, pp) != CDT_OK)
+		return CDT_ERROR;
+
+	integrate(driver, driver->time[driver->nTime - 1]);
+
+	char message[128];
+	snprintf(message, sizeof(message), "Simulated %d units at %d time points", driver->nUnits, driver->nTime);
+	emitLog(LOG_INFO, "Info", __func__, message);
+	return CDT_OK;
+}
+
+static cdtResult initializeSimulation(void* drv, cdtParameterProvider* pp)
+{
+	if (!drv || !pp)
+		return CDT_ERROR_INVALID_INPUTS;
+	return configure((Driver*)drv, pp);
+}
+
+static cdtResult performSimulationStep(void* drv, double tEnd, double* tReached)
+{
+	Driver* driver = (Driver*)drv;
+	if (!driver || !driver->time)
+		return CDT_ERROR_INVALID_INPUTS;
+
+	const double tFinal = driver->time[driver->nTime - 1];
+	if (tEnd > tFinal)
+		tEnd = tFinal;
+
+	integrate(driver, tEnd);
+	*tReached = tEnd;
+	return CDT_OK;
+}
+
+static cdtResult endSimulation(void* drv)
+{
+	return drv ? CDT_OK : CDT_ERROR_INVALID_INPUTS;
+}
+
+static cdtResult setTimeout(void* drv, double* timeout)
+{
+	if (!drv || !timeout)
+		return CDT_ERROR_INVALID_INPUTS;
+	((Driver*)drv)->timeout = *timeout;
+	return CDT_OK;
+}
+
+static cdtResult getNumUnitOp(void* drv, int* nUnits)
+{
+	*nUnits = ((Driver*)drv)->nUnits;
+	return CDT_OK;
+}
+
+static cdtResult getNumParTypes(void* drv, int unitOpId, int* nParTypes)
+{
+	*nParTypes = 0;
+	return CDT_OK;
+}
+
+static cdtResult getNumSensitivities(void* drv, int* nSens)
+{
+	*nSens = 0;
+	return CDT_OK;
+}
+
+static Unit* getUnit(void* drv, int unitOpId)
+{
+	Driver* driver = (Driver*)drv;
+	if (!driver || (unitOpId < 0) || (unitOpId >= driver->nUnits) || (driver->nReached == 0))
+		return NULL;
+	return driver->units + unitOpId;
+}
+
+static cdtResult getPortSolution(void* drv, int unitOpId, int inlet, double const** time, double const** data, int* nTime, int* nPort, int* nComp)
+{
+	const Unit* unit = getUnit(drv, unitOpId);
+	if (!unit)
+		return CDT_ERROR_INVALID_INPUTS;
+
+	const Driver* driver = (Driver*)drv;
+	if (time)
+		*time = driver->time;
+	*data = inlet ? unit->inlet : unit->outlet;
+	*nTime = driver->nReached;
+	if (nPort)
+		*nPort = 1;
+	*nComp = unit->nComp;
+	return CDT_OK;
+}
+
+static cdtResult getSolutionInlet(void* drv, int unitOpId, double const** time, double const** data, int* nTime, int* nPort, int* nComp)
+{
+	return getPortSolution(drv, unitOpId, 1, time, data, nTime, nPort, nComp);
+}
+
+static cdtResult getSolutionOutlet(void* drv, int unitOpId, double const** time, double const** data, int* nTime, int* nPort, int* nComp)
+{
+	return getPortSolution(drv, unitOpId, 0, time, data, nTime, nPort, nComp);
+}
+
+static cdtResult getSolutionBulk(void* drv, int unitOpId, double const** time, double const** data, int* nTime, int* nAxialCells, int* nRadialCells, int* nComp, uint8_t* keepAxialSingletonDimension)
+{
+	const Unit* unit = getUnit(drv, unitOpId);
+	if (!unit)
+		return CDT_ERROR_INVALID_INPUTS;
+
+	const Driver* driver = (Driver*)drv;
+	if (time)
+		*time = driver->time;
+	*data = unit->bulk;
+	*nTime = driver->nReached;
+	*nAxialCells = unit->nCol;
+	*nRadialCells = 0;
+	*nComp = unit->nComp;
+	*keepAxialSingletonDimension = 0;
+	return CDT_OK;
+}
+
+static cdtResult getLastState(void* drv, double const** state, int* nStates)
+{
+	const Driver* driver = (Driver*)drv;
+	if (!driver || (driver->nReached == 0))
+		return CDT_DATA_NOT_STORED;
+	*state = driver->lastState;
+	*nStates = driver->nStates;
+	return CDT_OK;
+}
+
+static cdtResult getSolutionTimes(void* drv, double const** time, int* nTime)
+{
+	const Driver* driver = (Driver*)drv;
+	if (!driver || (driver->nReached == 0))
+		return CDT_DATA_NOT_STORED;
+	*time = driver->time;
+	*nTime = driver->nReached;
+	return CDT_OK;
+}
+
+static cdtResult getTimeSim(void* drv, double* timeSim)
+{
+	*timeSim = ((Driver*)drv)->timeSim;
+	return CDT_OK;
+}
+
+/*
+ * Accessors of data the fake driver does not produce. Declared without a
+ * prototype, so a single function can be used for all signatures.
+ */
+static cdtResult notStored()
+{
+	return CDT_DATA_NOT_STORED;
+}
+
+typedef void* fp;
+
+typedef struct
+{
+	fp getFileFormat;
+
+	fp createDriver;
+	fp deleteDriver;
+	fp runSimulation;
+
+	fp getNumUnitOp;
+	fp getNumParTypes;
+	fp getNumSensitivities;
+
+	fp getSolutionInlet;
+	fp getSolutionOutlet;
+	fp getSolutionBulk;
+	fp getSolutionParticle;
+	fp getSolutionSolid;
+	fp getSolutionFlux;
+	fp getSolutionVolume;
+
+	fp getSolutionDerivativeInlet;
+	fp getSolutionDerivativeOutlet;
+	fp getSolutionDerivativeBulk;
+	fp getSolutionDerivativeParticle;
+	fp getSolutionDerivativeSolid;
+	fp getSolutionDerivativeFlux;
+	fp getSolutionDerivativeVolume;
+
+	fp getSensitivityInlet;
+	fp getSensitivityOutlet;
+	fp getSensitivityBulk;
+	fp getSensitivityParticle;
+	fp getSensitivitySolid;
+	fp getSensitivityFlux;
+	fp getSensitivityVolume;
+
+	fp getSensitivityDerivativeInlet;
+	fp getSensitivityDerivativeOutlet;
+	fp getSensitivityDerivativeBulk;
+	fp getSensitivityDerivativeParticle;
+	fp getSensitivityDerivativeSolid;
+	fp getSensitivityDerivativeFlux;
+	fp getSensitivityDerivativeVolume;
+
+	fp getLastState;
+	fp getLastStateTimeDerivative;
+	fp getLastUnitState;
+	fp getLastUnitStateTimeDerivative;
+	fp getLastSensitivityState;
+	fp getLastSensitivityStateTimeDerivative;
+	fp getLastSensitivityUnitState;
+	fp getLastSensitivityUnitStateTimeDerivative;
+
+	fp getPrimaryCoordinates;
+	fp getSecondaryCoordinates;
+	fp getParticleCoordinates;
+	fp getSolutionTimes;
+
+	fp getTimeSim;
+
+	fp timeout;
+
+	fp initializeSimulation;
+	fp performSimulationStep;
+	fp endSimulation;
+} cdtAPIv1_1_0a2;
+
+cdtResult cdtGetAPIv1_1_0a2(cdtAPIv1_1_0a2* ptr)
+{
+	if (!ptr)
+		return CDT_ERROR_INVALID_INPUTS;
+
+	// Fill all accessors first, then overwrite the implemented ones
+	fp* entries = (fp*)ptr;
+	for (size_t i = 0; i < sizeof(cdtAPIv1_1_0a2) / sizeof(fp); ++i)
+		entries[i] = (fp)&notStored;
+
+	ptr->getFileFormat = (fp)&getFileFormat;
+	ptr->createDriver = (fp)&createDriver;
+	ptr->deleteDriver = (fp)&deleteDriver;
+	ptr->runSimulation = (fp)&runSimulation;
+
+	ptr->getNumUnitOp = (fp)&getNumUnitOp;
+	ptr->getNumParTypes = (fp)&getNumParTypes;
+	ptr->getNumSensitivities = (fp)&getNumSensitivities;
+
+	ptr->getSolutionInlet = (fp)&getSolutionInlet;
+	ptr->getSolutionOutlet = (fp)&getSolutionOutlet;
+	ptr->getSolutionBulk = (fp)&getSolutionBulk;
+
+	ptr->getLastState = (fp)&getLastState;
+	ptr->getSolutionTimes = (fp)&getSolutionTimes;
+	ptr->getTimeSim = (fp)&getTimeSim;
+
+	ptr->timeout = (fp)&setTimeout;
+	ptr->initializeSimulation = (fp)&initializeSimulation;
+	ptr->performSimulationStep = (fp)&performSimulationStep;
+	ptr->endSimulation = (fp)&endSimulation;
+
+	return CDT_OK;
+}
@@ -4,8 +4,14 @@ Test general properties of Cadet.
 
 from pathlib import Path
 import re
+from unittest.mock import patch
+
+from addict import Dict
+import numpy as np
 import pytest
+
 from cadet import Cadet
+from cadet.runner import ReturnInformation
 
 
 @pytest.mark.parametrize("use_dll", [True, False])
@@ -36,5 +42,104 @@ def test_create_lwe_and_run_cli_smoke(install_path, tmp_path):
     assert return_information.return_code == 0
 
 
+def make_sweep_model():
+    with patch.object(Cadet, 'autodetect_cadet', return_value=None):
+        model = Cadet(use_dll=False)
+    model.root.input.model.nunits = 1
+    model.root.input.model.unit_000.unit_type = "GENERAL_RATE_MODEL"
+    model.root.input.model.unit_000.ncomp = 2
+    model.root.input.model.unit_000.col_porosity = 0.3
+    model.root.input.model.unit_000.discretization.ncol = 4
+    return model
+
+
+def fake_run_simulation(calls):
+    """Record the initial state of each run and return the porosity as last state."""
+    def run_simulation(self, **kwargs):
+        model = self.root.input.model
+        calls.append((model.unit_000.col_porosity, model.get('init_state_y')))
+        if self.root.input['return'].get('write_solution_last'):
+            self.root.output.last_state_y = np.full(3, model.unit_000.col_porosity)
+        return ReturnInformation(return_code=0, error_message="", log="")
+    return run_simulation
+
+
+def test_warm_start_from():
+    previous = make_sweep_model()
+    model = make_sweep_model()
+
+    with pytest.raises(ValueError):
+        model.warm_start_from(previous)
+
+    previous.root.output.last_state_y = np.arange(3.0)
+    previous.root.output.last_state_ydot = np.zeros(3)
+    assert model.warm_start_from(previous)
+    np.testing.assert_array_equal(model.root.input.model.init_state_y, [0, 1, 2])
+    np.testing.assert_array_equal(model.root.input.model.init_state_ydot, [0, 0, 0])
+
+    model.root.input.model.unit_000.col_porosity = 0.5
+    assert model.warm_start_from(previous)
+
+    model.root.input.model.unit_000.discretization.ncol = 8
+    assert not model.warm_start_from(previous)
+
+
+def test_run_sweep_continuation():
+    model = make_sweep_model()
+    points = [
+        {'model/unit_000/col_porosity': value} for value in (0.5, 0.1, 0.4, 0.2)
+    ]
+
+    calls = []
+    with patch.object(Cadet, 'run_simulation', fake_run_simulation(calls)):
+        results = model.run_sweep(points, continuation=True)
+
+    assert [porosity for porosity, _ in calls] == [0.1, 0.2, 0.4, 0.5]
+    assert calls[0][1] is None
+    for (_, init_state), (porosity, _) in zip(calls[1:], calls):
+        np.testing.assert_array_equal(init_state, np.full(3, porosity))
+
+    for point, (return_information, output) in zip(points, results):
+        assert return_information.return_code == 0
+        assert output.last_state_y[0] == point['model/unit_000/col_porosity']
+
+    assert model.root.input.model.unit_000.col_porosity == 0.3
+    assert 'init_state_y' not in model.root.input.model
+    assert 'write_solution_last' not in model.root.input['return']
+    assert 'output' not in model.root
+
+
+def test_run_sweep_without_continuation():
+    model = make_sweep_model()
+    points = [{'model/unit_000/col_porosity': value} for value in (0.5, 0.1)]
+
+    calls = []
+    with patch.object(Cadet, 'run_simulation', fake_run_simulation(calls)):
+        results = model.run_sweep(points)
+
+    assert calls == [(0.5, None), (0.1, None)]
+    assert all(output == Dict() for _, output in results)
+
+
+def test_derive():
+    model = make_sweep_model()
+    model.root.input.model.unit_000.init_c = np.ones(2)
+    model.root.output.last_state_y = np.arange(3.0)
+
+    variant = model.derive({'model/unit_000/col_porosity': 0.4})
+
+    assert variant.root.input.model.unit_000.col_porosity == 0.4
+    assert model.root.input.model.unit_000.col_porosity == 0.3
+    assert np.shares_memory(
+        variant.root.input.model.unit_000.init_c, model.root.input.model.unit_000.init_c
+    )
+    assert 'output' not in variant.root
+    assert 'output' in model.root
+    assert variant.cadet_runner is model.cadet_runner
+
+    clone = model.clone()
+    np.testing.assert_array_equal(clone.root.output.last_state_y, [0, 1, 2])
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
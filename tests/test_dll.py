@@ -1,5 +1,6 @@
 from pathlib import Path
 import subprocess
+import numpy as np
 import pytest
 
 from cadet import Cadet
@@ -1472,5 +1473,147 @@ def test_meta(use_dll, test_case):
         assert isinstance(model.root.meta[meta_key], meta_type)
 
 
+@pytest.mark.parametrize("use_dll", use_dll)
+@pytest.mark.parametrize("test_case", [grm_sens])
+def test_load_selection(use_dll, test_case):
+    model = setup_model(cadet_root, use_dll, **test_case.model_options)
+    setup_solution_recorder(model, **test_case.solution_recorder_options)
+
+    return_info = model.run_simulation(
+        load=['output/solution/unit_000/solution_outlet*', 'meta/time_sim']
+    )
+    assert return_info.return_code == 0
+
+    assert model.root.meta.keys() == {'time_sim'}
+    assert model.root.output.keys() == {'solution'}
+    assert model.root.output.solution.keys() == {'unit_000'}
+    assert model.root.output.solution.unit_000.keys() == {'solution_outlet'}
+
+
+@pytest.mark.parametrize("test_case", [grm_sens])
+def test_zero_copy_results(test_case):
+    model = setup_model(cadet_root, True, **test_case.model_options)
+    setup_solution_recorder(model, **test_case.solution_recorder_options)
+
+    model.run_simulation()
+    reference = model.root.output.solution.unit_000.solution_particle
+
+    model.run_simulation(own_data=False)
+    particle = model.root.output.solution.unit_000.solution_particle
+    assert not particle.flags.writeable
+    np.testing.assert_array_equal(particle, reference)
+
+    model.release_results()
+    particle = model.root.output.solution.unit_000.solution_particle
+    assert particle.flags.owndata
+    np.testing.assert_array_equal(particle, reference)
+
+
+@pytest.mark.parametrize("test_case", [grm_sens])
+def test_lazy_results(test_case):
+    model = setup_model(cadet_root, True, **test_case.model_options)
+    setup_solution_recorder(model, **test_case.solution_recorder_options)
+
+    model.run_simulation()
+    reference = model.root.output.to_dict()
+
+    model.root.pop('output')
+    model.run_simulation(lazy=True)
+    assert model.result_handle is not None
+
+    np.testing.assert_array_equal(
+        model.root.output.sensitivity.param_000.unit_000.sens_bulk,
+        reference['sensitivity']['param_000']['unit_000']['sens_bulk'],
+    )
+
+    output = model.root.output.to_dict()
+    assert output.keys() == reference.keys()
+    for unit, unit_solution in reference['solution'].items():
+        if not isinstance(unit_solution, dict):
+            continue
+        assert output['solution'][unit].keys() == unit_solution.keys()
+        for key, value in unit_solution.items():
+            np.testing.assert_array_equal(output['solution'][unit][key], value)
+
+
+@pytest.mark.parametrize("test_case", [grm_sens])
+@pytest.mark.parametrize("lazy", [False, True])
+def test_stacked_sensitivities(test_case, lazy):
+    model = setup_model(cadet_root, True, **test_case.model_options)
+    setup_solution_recorder(model, **test_case.solution_recorder_options)
+
+    model.run_simulation()
+    reference = model.root.output.sensitivity.to_dict()
+    nsens = model.root.input.sensitivity.nsens
+
+    model.root.pop('output')
+    model.cadet_runner.sensitivity_layout = 'stacked'
+    try:
+        model.run_simulation(lazy=lazy)
+    finally:
+        model.cadet_runner.sensitivity_layout = 'split'
+
+    sens_bulk = model.root.output.sensitivity.unit_000.sens_bulk
+    assert sens_bulk.shape[0] == nsens
+    for sens in range(nsens):
+        np.testing.assert_array_equal(
+            sens_bulk[sens], reference[f'param_{sens:03d}']['unit_000']['sens_bulk']
+        )
+
+
+@pytest.mark.parametrize("test_case", [grm_split_all, grm_par_types])
+def test_labeled_output_layout(test_case):
+    model = setup_model(cadet_root, True, **test_case.model_options)
+    setup_solution_recorder(model, **test_case.solution_recorder_options)
+
+    model.run_simulation()
+    reference = model.root.output.solution.unit_000.to_dict()
+
+    model.root.pop('output')
+    model.cadet_runner.output_layout = 'labeled'
+    try:
+        model.run_simulation()
+    finally:
+        model.cadet_runner.output_layout = 'split'
+
+    solution = model.root.output.solution.unit_000
+    assert 'solution_outlet_port_000_comp_000' not in solution
+
+    outlet = solution.solution_outlet
+    assert outlet.dims == ('nTime', 'nPort', 'nComp')
+    if 'solution_outlet_port_000_comp_001' in reference:
+        np.testing.assert_array_equal(
+            outlet.port(0).comp(1), reference['solution_outlet_port_000_comp_001']
+        )
+
+    particle = solution.solution_particle
+    if 'solution_particle_partype_001' in reference:
+        assert particle.dims[:2] == ('nTime', 'nParType')
+        np.testing.assert_array_equal(
+            particle.partype(1), reference['solution_particle_partype_001']
+        )
+    else:
+        np.testing.assert_array_equal(particle, reference['solution_particle'])
+
+
+@pytest.mark.parametrize("use_dll", use_dll)
+def test_run_parallel(use_dll):
+    models = []
+    for i in range(4):
+        model = setup_model(cadet_root, use_dll, file_name=f'LWE_parallel_{i}.h5')
+        setup_solution_recorder(model)
+        model.root.input.model.unit_001.sec_000.const_coeff[0] *= 1.0 + 0.1 * i
+        models.append(model)
+
+    return_informations = Cadet.run_parallel(models, max_workers=4)
+    assert all(info.return_code == 0 for info in return_informations)
+
+    for model in models:
+        outlet = model.root.output.solution.unit_000.solution_outlet
+        model.run_simulation()
+        np.testing.assert_array_equal(
+            outlet, model.root.output.solution.unit_000.solution_outlet
+        )
+
 if __name__ == "__main__":
     pytest.main(["test_dll.py"])
@@ -443,6 +443,47 @@ def test_intermediate_state_access(test_case):
     model.delete_file()
 
 
+@requires_1_1_0a2_api
+@pytest.mark.parametrize("test_case", [cstr, grm])
+def test_iterate_steps(test_case):
+    """Test that the data yielded per step adds up to the data of a full run."""
+    model_full = setup_model(
+        cadet_root, use_dll=True,
+        file_name='test_iterate_full.h5', **test_case.model_options
+    )
+    setup_solution_recorder(model_full)
+    reduce_to_single_section(model_full)
+    assert model_full.run_simulation().return_code == 0
+
+    model = setup_model(
+        cadet_root, use_dll=True,
+        file_name='test_iterate_steps.h5', **test_case.model_options
+    )
+    setup_solution_recorder(model)
+    reduce_to_single_section(model)
+
+    total_time = model.root.input.solver.sections.section_times[-1]
+    times = [total_time * frac for frac in (0.25, 0.5, 0.75, 1.0)]
+
+    steps = list(model.iterate_steps(times, outputs=['unit_001/solution_outlet']))
+    assert len(steps) == len(times)
+    for step in steps:
+        assert step.return_information.return_code == 0
+        assert len(step.outputs['unit_001/solution_outlet']) == len(step.time)
+
+    np.testing.assert_allclose(
+        np.concatenate([step.time for step in steps]),
+        model_full.root.output.solution.solution_times,
+    )
+    np.testing.assert_allclose(
+        np.concatenate([step.outputs['unit_001/solution_outlet'] for step in steps]),
+        model_full.root.output.solution.unit_001.solution_outlet,
+        rtol=1e-8, atol=1e-10,
+    )
+    model_full.delete_file()
+    model.delete_file()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
 
@@ -0,0 +1,399 @@
+from concurrent.futures import ThreadPoolExecutor
+import ctypes
+import logging
+from pathlib import Path
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from addict import Dict
+from packaging.version import Version
+import numpy as np
+
+from cadet import H5
+from cadet.cadet_dll import (
+    CadetDLLRunner, DriverPool, LOG_LEVEL_OFF, LogSink, ResultHandle, SimulationResult,
+    _DriverMemory
+)
+from cadet.cadet_dll_parameterprovider import H5ParameterProvider
+
+
+class CadetFile(H5):
+    """HDF5 file with the key transformation of CADET files."""
+
+    def transform(self, x):
+        return str.upper(x)
+
+    def inverse_transform(self, x):
+        return str.lower(x)
+
+
+class FakeAPI:
+    """Stand-in for the CADET API counting created and deleted drivers."""
+
+    def __init__(self):
+        self.created = 0
+        self.deleted = []
+
+    def createDriver(self):
+        self.created += 1
+        return self.created
+
+    def deleteDriver(self, driver):
+        self.deleted.append(driver)
+
+
+def test_pool_reuses_drivers():
+    api = FakeAPI()
+    pool = DriverPool(None, api, max_idle=1)
+
+    driver = pool.acquire()
+    pool.release(driver)
+    assert pool.acquire() == driver
+    assert api.created == 1
+
+    other = pool.acquire()
+    pool.release(driver)
+    pool.release(other)
+    assert len(pool) == 1
+    assert api.deleted == [other]
+
+    pool.clear()
+    assert len(pool) == 0
+    assert api.deleted == [other, driver]
+
+
+def make_runners(mock_load, api, n_runners=1):
+    """Create runners of a mocked library that use `api` and a fresh driver pool."""
+    mock_lib = MagicMock()
+    mock_load.return_value = mock_lib
+
+    mock_lib.cdtGetLibraryVersion.return_value = b"5.0.0"
+    mock_lib.cdtGetLibraryCommitHash.return_value = b"abc123"
+    mock_lib.cdtGetLibraryBranchRefspec.return_value = b"main"
+    mock_lib.cdtGetLibraryBuildType.return_value = b"Release"
+    mock_lib.cdtGetLatestCAPIVersion.return_value = b"1.0.0"
+
+    pool = DriverPool(mock_lib, api, max_idle=4)
+
+    with patch('cadet.cadet_dll._get_driver_pool', return_value=pool):
+        runners = [CadetDLLRunner(Path("fake_path.so")) for _ in range(n_runners)]
+    for runner in runners:
+        runner._api = api
+
+    return pool, runners
+
+
+class FakeProvider(ctypes.Structure):
+    _fields_ = [('value', ctypes.c_int)]
+
+    def close(self):
+        pass
+
+
+def mock_provider():
+    return patch.object(
+        CadetDLLRunner, '_create_parameter_provider',
+        return_value=FakeProvider(),
+    )
+
+
+@patch('cadet.cadet_dll.ctypes.cdll.LoadLibrary')
+def test_runner_driver_lifecycle(mock_load):
+    api = FakeAPI()
+    api.runSimulation = MagicMock(return_value=0)
+    pool, (runner, other_runner) = make_runners(mock_load, api, n_runners=2)
+
+    # Drivers are only created when needed
+    assert api.created == 0
+
+    with mock_provider():
+        with runner:
+            runner.run(MagicMock())
+            assert api.created == 1
+        assert len(pool) == 1
+
+        # Runners sharing the library reuse the pooled driver
+        other_runner.run(MagicMock())
+        other_runner.clear()
+        assert api.created == 1
+
+        # Failed runs do not return the driver to the pool
+        api.runSimulation.return_value = -1
+        runner.run(MagicMock())
+        del runner
+        assert len(pool) == 0
+        assert api.deleted == [1]
+
+
+@patch('cadet.cadet_dll.ctypes.cdll.LoadLibrary')
+def test_runner_threads(mock_load):
+    n_threads = 4
+    barrier = threading.Barrier(n_threads)
+
+    api = FakeAPI()
+    pool, (runner, ) = make_runners(mock_load, api)
+
+    def run_simulation(driver, parameter_provider):
+        # All threads are inside the simulation at the same time
+        barrier.wait(timeout=5)
+        runner._log_router._handle(b"", b"run", 0, 2, b"Info", str(driver).encode())
+        return 0
+
+    api.runSimulation = run_simulation
+
+    def run():
+        return_information = runner.run(MagicMock())
+        return runner._driver, return_information.log
+
+    with mock_provider():
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            results = list(executor.map(lambda _: run(), range(n_threads)))
+
+    drivers = [driver for driver, _ in results]
+    assert sorted(drivers) == list(range(1, n_threads + 1))
+    for driver, log in results:
+        assert log == f"Info (run:0) {driver}\n"
+
+    # Drivers of finished threads are returned to the pool
+    assert len(pool) == n_threads
+    assert api.deleted == []
+
+
+@patch('cadet.cadet_dll.ctypes.cdll.LoadLibrary')
+def test_run_with_reuses_provider(mock_load):
+    api = FakeAPI()
+    pool, (runner, ) = make_runners(mock_load, api)
+
+    providers = []
+    porosities = []
+
+    def run_simulation(driver, parameter_provider):
+        pp = parameter_provider._obj
+        providers.append(pp)
+
+        value = ctypes.c_double()
+        pp.pushScope(pp.userData, b'model')
+        pp.pushScope(pp.userData, b'unit_001')
+        pp.getDouble(pp.userData, b'COL_POROSITY', ctypes.byref(value))
+        porosities.append(value.value)
+        return 0
+
+    api.runSimulation = run_simulation
+
+    sim = MagicMock()
+    sim.root = Dict()
+    sim.root.input.model.unit_001.col_porosity = 0.37
+    sim.root.input.model.unit_001.col_length = 0.014
+
+    with pytest.raises(RuntimeError):
+        runner.run_with([0.4])
+
+    bound = runner.bind_parameters(sim, ['model/unit_001/col_porosity'])
+    entry = bound.provider.userData.scopes[b'model/unit_001'][b'COL_POROSITY']
+
+    runner.run_with([0.4])
+    runner.run_with({'model/unit_001/col_porosity': 0.5})
+
+    assert porosities == [0.4, 0.5]
+    assert providers[0] is providers[1]
+    assert bound.provider.userData.scopes[b'model/unit_001'][b'COL_POROSITY'] is entry
+    assert sim.root.input.model.unit_001.col_porosity == 0.5
+
+    with pytest.raises(KeyError):
+        runner.run_with({'model/unit_001/col_length': 0.1})
+    with pytest.raises(ValueError):
+        runner.run_with([0.1, 0.2])
+
+    runner.close()
+    with pytest.raises(RuntimeError):
+        runner.run_with([0.4])
+
+
+@patch('cadet.cadet_dll.ctypes.cdll.LoadLibrary')
+def test_run_from_file(mock_load, tmp_path):
+    api = FakeAPI()
+    pool, (runner, ) = make_runners(mock_load, api)
+    runner.parameter_provider = 'hdf5'
+
+    lengths = []
+
+    def run_simulation(driver, parameter_provider):
+        pp = parameter_provider._obj
+        value = ctypes.c_double()
+        pp.pushScope(pp.userData, b'model')
+        pp.pushScope(pp.userData, b'unit_001')
+        pp.getDouble(pp.userData, b'COL_LENGTH', ctypes.byref(value))
+        lengths.append(value.value)
+        return 0
+
+    api.runSimulation = run_simulation
+
+    sim = CadetFile()
+    sim.filename = str(tmp_path / "input.h5")
+    sim.root.input.model.unit_001.col_length = 0.014
+    sim.root.input['return'].write_solution_times = 1
+    sim.save()
+
+    sim.root = Dict()
+    return_information = runner.run(sim)
+
+    assert return_information.return_code == 0
+    assert lengths == [0.014]
+    assert sim.root.input['return'].write_solution_times == 1
+    assert 'model' not in sim.root.input
+
+    # The file is closed if the simulation cannot be prepared
+    with patch.object(
+            H5ParameterProvider, 'close',
+            autospec=True, side_effect=H5ParameterProvider.close,
+    ) as close, patch.object(sim, 'load_from_file', side_effect=OSError):
+        with pytest.raises(OSError):
+            runner.run(sim)
+    close.assert_called_once()
+
+    runner.parameter_provider = 'unknown'
+    with pytest.raises(ValueError):
+        runner.run(sim)
+
+
+class FakeStepResult:
+    """Stand-in for the results of a stepwise simulation recording one row per step."""
+
+    def __init__(self, api, driver):
+        self.n_time = api.n_steps
+
+    def solution_times(self, own_data=None):
+        return np.arange(float(self.n_time))
+
+    def solution_outlet(self, unitOpId, own_data=None):
+        time = self.solution_times()
+        return time, np.outer(time, [1.0, 2.0]) + unitOpId, ['nTime', 'nComp']
+
+
+@patch('cadet.cadet_dll.ctypes.cdll.LoadLibrary')
+def test_iterate_steps(mock_load):
+    api = FakeAPI()
+    api.n_steps = 0
+    api.ended = 0
+    api.initializeSimulation = MagicMock(return_value=0)
+
+    def perform_simulation_step(driver, t_end, t_reached):
+        api.n_steps += 1
+        t_reached._obj.value = t_end.value
+        return 0
+
+    def end_simulation(driver):
+        api.ended += 1
+        return 0
+
+    api.performSimulationStep = perform_simulation_step
+    api.endSimulation = end_simulation
+
+    pool, (runner, ) = make_runners(mock_load, api)
+    runner._cadet_capi_version = Version("1.1.0a2")
+
+    with pytest.raises(ValueError):
+        runner.iterate_steps(MagicMock(), [1.0], outputs=['unit_001/solution_times'])
+
+    with mock_provider(), patch('cadet.cadet_dll.SimulationResult', FakeStepResult):
+        steps = runner.iterate_steps(
+            MagicMock(), [1.0, 2.0, 3.0], outputs=['unit_001/solution_outlet']
+        )
+        first = next(steps)
+        assert first.t_reached == 1.0
+        np.testing.assert_array_equal(first.time, [0.0])
+
+        rest = list(steps)
+
+    assert [step.t_reached for step in rest] == [2.0, 3.0]
+    np.testing.assert_array_equal(rest[-1].time, [2.0])
+    np.testing.assert_array_equal(
+        rest[-1].outputs['unit_001/solution_outlet'], [[3.0, 5.0]]
+    )
+    assert api.ended == 1
+
+
+def test_log_sink(caplog):
+    sink = LogSink(capacity=2, forward=True)
+    with caplog.at_level(logging.INFO, logger='cadet.cadet_dll'):
+        for i in range(3):
+            sink.emit(b"file.cpp", b"run", i, 4, b"Info", f"message {i}".encode())
+        sink.emit(b"file.cpp", b"run", 3, 5, b"Debug1", b"hidden")
+
+    assert sink.getvalue() == "Info (run:2) message 2\nDebug1 (run:3) hidden\n"
+
+    assert [record.getMessage() for record in caplog.records] == [
+        "message 0", "message 1", "message 2"
+    ]
+    record = caplog.records[0]
+    assert record.levelno == logging.INFO
+    assert (record.cadet_file, record.cadet_func, record.cadet_line, record.cadet_level) \
+        == ("file.cpp", "run", 0, 4)
+
+    sink.clear()
+    assert sink.getvalue() == ""
+
+
+@patch('cadet.cadet_dll.ctypes.cdll.LoadLibrary')
+def test_runner_log_levels(mock_load):
+    api = FakeAPI()
+    pool, (runner, ) = make_runners(mock_load, api)
+    set_log_level = runner._log_router._set_log_level = MagicMock()
+    runner._log_router._level = None
+
+    def run_simulation(driver, parameter_provider):
+        runner._log_router._handle(b"", b"run", 0, 2, b"Error", b"failed")
+        return 0
+
+    api.runSimulation = run_simulation
+
+    with mock_provider():
+        runner.run(MagicMock())
+        assert runner.run(MagicMock()).log == "Error (run:0) failed\n"
+        set_log_level.assert_called_once_with(2)
+
+        # The sink of the thread is reused
+        assert runner.setup_log_buffer() is runner.setup_log_buffer()
+
+        runner.log_level = LOG_LEVEL_OFF
+        assert runner.run(MagicMock()).log == ""
+        assert set_log_level.call_count == 2
+
+
+def test_result_handle_detaches_views():
+    api = FakeAPI()
+    pool = DriverPool(None, api)
+    memory = _DriverMemory(pool, pool.acquire())
+
+    buffer = (ctypes.c_double * 6)(*range(6))
+    pointer = ctypes.cast(buffer, ctypes.POINTER(ctypes.c_double))
+    result = SimulationResult(api, memory.driver, own_data=False, memory=memory)
+
+    tree = Dict()
+    view = result._as_array(pointer, (2, 3))
+    tree.output.solution.unit_000.solution_outlet = view
+    tree.output.solution.unit_000.solution_outlet_comp_000 = view[:, 0]
+    assert not view.flags.writeable
+    assert np.shares_memory(view, np.ctypeslib.as_array(buffer))
+    assert result._as_array(pointer, (2, 3), own_data=True).flags.owndata
+
+    handle = ResultHandle(memory, tree)
+    del memory, result
+    handle.release()
+    assert handle.released
+
+    outlet = tree.output.solution.unit_000.solution_outlet
+    assert outlet.flags.owndata
+    np.testing.assert_array_equal(outlet, np.arange(6.0).reshape(2, 3))
+    assert tree.output.solution.unit_000.solution_outlet_comp_000.flags.owndata
+
+    # The driver is only returned to the pool once the last view is gone
+    assert len(pool) == 0
+    del view
+    assert len(pool) == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,348 @@
+"""
+Test the runners end-to-end against the stand-in CADET installation.
+"""
+
+import copy
+import os
+import pickle
+import platform
+import subprocess
+import sys
+import tracemalloc
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from cadet import Cadet, cadet_worker
+from cadet.cadet_dll_parameterprovider import ParameterTrace
+from cadet.runner import _run_process, track_memory
+from tests.fake_cadet import build, find_compiler
+from tests.fake_cadet.cli import outlet_value
+
+
+@pytest.fixture(scope='module')
+def install_path(tmp_path_factory):
+    if find_compiler() is None:
+        pytest.skip("No C compiler found to build the fake CADET library.")
+    return build(tmp_path_factory.mktemp('fake_cadet'))
+
+
+def setup_model(install_path, filename, use_dll, n_units=2, n_comp=3, n_col=5):
+    model = Cadet(install_path=install_path, use_dll=use_dll)
+    model.filename = str(filename)
+    model.root.input.model.nunits = n_units
+    for unit in range(n_units):
+        unit_index = f'unit_{unit:03d}'
+        model.root.input.model[unit_index].unit_type = 'GENERAL_RATE_MODEL'
+        model.root.input.model[unit_index].ncomp = n_comp
+        model.root.input.model[unit_index].discretization.ncol = n_col
+        model.root.input['return'][unit_index].write_solution_inlet = 1
+        model.root.input['return'][unit_index].write_solution_outlet = 1
+        model.root.input['return'][unit_index].write_solution_bulk = 1
+    model.root.input.solver.user_solution_times = np.linspace(0, 100, 101)
+    model.root.input['return'].split_components_data = 0
+    model.root.input['return'].write_solution_times = 1
+    model.root.input['return'].write_solution_last = 1
+    return model
+
+
+def test_dll_matches_cli(install_path, tmp_path):
+    results = []
+    for use_dll in (True, False):
+        model = setup_model(install_path, tmp_path / f"model_{use_dll}.h5", use_dll)
+        model.save()
+        return_information = model.run_simulation()
+        assert return_information.return_code == 0
+        results.append(model.root.output)
+
+    dll_output, cli_output = results
+    times = np.linspace(0, 100, 101)
+    np.testing.assert_array_equal(dll_output.solution.solution_times, times)
+    np.testing.assert_array_equal(cli_output.solution.solution_times, times)
+    np.testing.assert_allclose(dll_output.last_state_y, cli_output.last_state_y)
+
+    for unit in range(2):
+        unit_index = f'unit_{unit:03d}'
+        dll_solution = dll_output.solution[unit_index]
+        cli_solution = cli_output.solution[unit_index]
+        np.testing.assert_allclose(dll_solution.solution_outlet, outlet_value(unit, 3, times))
+        for key in ('solution_inlet', 'solution_outlet', 'solution_bulk'):
+            assert dll_solution[key].shape == cli_solution[key].shape
+            np.testing.assert_allclose(dll_solution[key], cli_solution[key])
+
+
+def test_create_lwe(install_path, tmp_path):
+    model = Cadet(install_path=install_path, use_dll=False)
+    model.create_lwe(tmp_path / "LWE.h5")
+    assert model.root.input.model.nunits == 3
+
+    return_information = model.run_simulation()
+    assert return_information.return_code == 0
+    assert model.root.output.solution.unit_002.solution_outlet.shape == (1501, 4)
+
+
+def test_iterate_steps(install_path, tmp_path):
+    model = setup_model(install_path, tmp_path / "steps.h5", use_dll=True)
+
+    steps = list(model.iterate_steps([25.0, 50.0, 100.0], ['unit_001/solution_outlet']))
+
+    assert [step.t_reached for step in steps] == [25.0, 50.0, 100.0]
+    assert [len(step.time) for step in steps] == [26, 25, 50]
+    outlet = np.concatenate([step.outputs['unit_001/solution_outlet'] for step in steps])
+    np.testing.assert_allclose(
+        outlet.reshape(101, 3), outlet_value(1, 3, np.linspace(0, 100, 101))
+    )
+
+    # The arguments are checked when called, not when the first step is requested
+    with pytest.raises(ValueError):
+        model.iterate_steps([100.0], outputs=['bogus'])
+
+    model.root.input.solver.sections.section_times = [0.0, 50.0, 100.0]
+    with pytest.raises(ValueError):
+        model.iterate_steps([100.0])
+
+    model = setup_model(install_path, tmp_path / "steps.h5", use_dll=False)
+    with pytest.raises(RuntimeError):
+        model.iterate_steps([100.0])
+
+
+def test_worker_timeout_releases_shared_memory(install_path, tmp_path, monkeypatch):
+    model = setup_model(install_path, tmp_path / "worker.h5", use_dll=True)
+    model.use_worker = True
+    connection = model.cadet_runner._connection
+
+    shm_name = 'cadet_test_timeout'
+    monkeypatch.setattr(cadet_worker, '_new_shm_name', lambda: shm_name)
+    # Time out only after the worker has packed its results
+    poll = connection.poll
+    monkeypatch.setattr(connection, 'poll', lambda timeout: not poll(None))
+
+    with pytest.raises(TimeoutError):
+        model.run_simulation(timeout=1.0)
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=shm_name)
+
+
+def test_run_failure(install_path, tmp_path):
+    model = setup_model(install_path, tmp_path / "failure.h5", use_dll=True)
+    del model.root.input.solver.user_solution_times
+
+    return_information = model.run_simulation()
+
+    assert return_information.return_code != 0
+    assert "USER_SOLUTION_TIMES" in return_information.error_message
+
+
+@pytest.mark.parametrize("use_dll", [True, False])
+def test_timings(install_path, tmp_path, use_dll):
+    model = setup_model(install_path, tmp_path / "timings.h5", use_dll)
+    model.save()
+    assert model.run_simulation().timings is None
+
+    model.cadet_runner.collect_timings = True
+    model.save()
+    timings = model.run_simulation().timings
+
+    phases = {'save', 'run', 'solver', 'load', 'total'}
+    phases |= {'provider'} if use_dll else {'spawn'}
+    assert set(timings) == phases
+    assert all(isinstance(value, int) and value >= 0 for value in timings.values())
+    assert timings['total'] >= timings['run'] + timings['load']
+
+    # The save is only attributed to the next run
+    assert 'save' not in model.run_simulation().timings
+
+    # A time_sim left over from the previous run is not used
+    timings = model.run_simulation(load=['output/solution/*']).timings
+    assert 'solver' not in timings and 'spawn' not in timings
+
+
+@pytest.mark.parametrize("use_dll", [True, False])
+def test_memory(install_path, tmp_path, use_dll):
+    model = setup_model(install_path, tmp_path / "memory.h5", use_dll, n_col=500)
+    model.save()
+    assert model.run_simulation().memory is None
+
+    model.cadet_runner.collect_memory = True
+    memory = model.run_simulation().memory
+
+    # Bulk solutions of 2 units, loaded into Python
+    assert memory['python_peak'] >= 2 * 101 * 500 * 3 * 8
+    if platform.system() == 'Linux':
+        assert 'rss_delta' in memory
+    if not use_dll:
+        assert memory['child_peak_rss'] > 0
+
+
+def test_overlapping_memory_probes():
+    outer, inner = {}, {}
+    with track_memory(outer):
+        with track_memory(inner):
+            data = bytearray(1 << 20)
+        # The inner probe must not stop tracing for the outer one
+        assert tracemalloc.is_tracing()
+        del data
+    assert not tracemalloc.is_tracing()
+    assert outer['python_peak'] >= inner['python_peak'] >= 1 << 20
+
+
+def test_run_process_timeout(tmp_path):
+    with pytest.raises(subprocess.TimeoutExpired):
+        _run_process([sys.executable, '-c', 'import time; time.sleep(10)'], timeout=0.5)
+
+    completed, peak_rss = _run_process([sys.executable, '-c', 'print("done")'])
+    assert completed.returncode == 0
+    assert completed.stdout.strip() == b'done'
+    if hasattr(os, 'wait4'):
+        assert peak_rss > 0
+
+
+def test_parameter_trace(install_path, tmp_path):
+    model = setup_model(install_path, tmp_path / "trace.h5", use_dll=True)
+    model.root.input.model.unit_000.col_porosity = 0.37
+    trace = ParameterTrace()
+    model.cadet_runner.parameter_trace = trace
+    model.run_simulation()
+    reference = model.root.output.solution.unit_001.solution_outlet
+
+    assert trace.counts['model/unit_001/NCOMP'] == 2
+    assert 'model/unit_000/COL_POROSITY' not in trace.counts
+
+    pruned = trace.prune(model.root.input)
+    assert 'col_porosity' not in pruned.model.unit_000
+    assert 'return' not in pruned
+
+    pruned = trace.prune(model.root.input, keep=['return'])
+    assert pruned['return'] == model.root.input['return']
+
+    model.root.input = pruned
+    model.cadet_runner.parameter_trace = None
+    model.root.pop('output')
+    model.run_simulation()
+    np.testing.assert_array_equal(model.root.output.solution.unit_001.solution_outlet, reference)
+
+
+def test_pickle(install_path, tmp_path):
+    model = setup_model(install_path, tmp_path / "pickle.h5", use_dll=True, n_col=100)
+    model.run_simulation()
+    reference = model.root.output.solution.unit_001.solution_outlet
+
+    # By default, only the input is pickled
+    data = pickle.dumps(model)
+    assert reference.tobytes() not in data
+    assert 'output' not in pickle.loads(data).root
+
+    buffers = []
+    data = pickle.dumps(model, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 1
+    assert buffers[0].raw().nbytes == model.root.input.solver.user_solution_times.nbytes
+
+    restored = pickle.loads(data, buffers=buffers)
+    assert 'output' not in restored.root
+    np.testing.assert_array_equal(
+        restored.root.input.solver.user_solution_times,
+        model.root.input.solver.user_solution_times,
+    )
+
+    # The DLL is only loaded on first use
+    runner = restored.cadet_runner
+    assert not runner._dll_loaded
+    restored.close()
+    assert not runner._dll_loaded
+    restored.run_simulation()
+    assert runner._dll_loaded
+    np.testing.assert_array_equal(restored.root.output.solution.unit_001.solution_outlet, reference)
+
+    # Opting out pickles the results as well
+    model.pickle_groups = None
+    restored = pickle.loads(pickle.dumps(model))
+    np.testing.assert_array_equal(restored.root.output.solution.unit_001.solution_outlet, reference)
+
+    # Copies always include all groups
+    for clone in (copy.copy(model), copy.deepcopy(model)):
+        assert set(clone.root) == set(model.root)
+        np.testing.assert_array_equal(
+            clone.root.output.solution.unit_001.solution_outlet, reference
+        )
+
+
+@pytest.mark.parametrize("use_dll", [True, False])
+def test_run_ensemble(install_path, tmp_path, use_dll):
+    model = setup_model(install_path, tmp_path / "ensemble.h5", use_dll)
+    times = np.linspace(0, 100, 101)
+    scales = np.array([1.0, 2.0, 0.5, 3.0, 1.5])
+
+    result = Cadet.run_ensemble(
+        model,
+        {'solver/user_solution_times': scales[:, np.newaxis] * times},
+        ['solution/unit_001/solution_outlet', 'solution/unit_000/solution_inlet'],
+        max_workers=2,
+    )
+
+    assert result.success.all()
+    outlet = result.outputs['solution/unit_001/solution_outlet']
+    assert outlet.shape == (5, 101, 3)
+    for member, scale in enumerate(scales):
+        np.testing.assert_allclose(outlet[member], outlet_value(1, 3, scale * times))
+    assert result.outputs['solution/unit_000/solution_inlet'].shape == (5, 101, 3)
+    np.testing.assert_array_equal(model.root.input.solver.user_solution_times, times)
+    assert 'output' not in model.root
+
+
+def test_run_ensemble_structure(install_path, tmp_path):
+    model = setup_model(install_path, tmp_path / "ensemble.h5", use_dll=True)
+
+    result = Cadet.run_ensemble(
+        model,
+        {'model/unit_001/discretization/ncol': [5, 10, 20]},
+        ['solution/unit_001/solution_outlet'],
+    )
+    assert result.outputs['solution/unit_001/solution_outlet'].shape == (3, 101, 3)
+    assert model.root.input.model.unit_001.discretization.ncol == 5
+
+    result = Cadet.run_ensemble(
+        model, {'model/unit_001/ncomp': [3, 4]}, ['solution/unit_001/solution_outlet'],
+        max_workers=1,
+    )
+    assert result.success.tolist() == [True, False]
+    assert "shape" in result.return_information[1].error_message
+    assert np.isnan(result.outputs['solution/unit_001/solution_outlet'][1]).all()
+
+
+def test_run_ensemble_failed_member(install_path, tmp_path):
+    model = setup_model(install_path, tmp_path / "ensemble.h5", use_dll=False)
+
+    # The timed out member does not abort the members after it
+    result = Cadet.run_ensemble(
+        model,
+        {'solver/fake_sleep': [0.0, 30.0, 0.0]},
+        ['solution/unit_001/solution_outlet'],
+        max_workers=1,
+        timeout=5.0,
+    )
+
+    assert result.success.tolist() == [True, False, True]
+    assert "TimeoutExpired" in result.return_information[1].error_message
+    outlet = result.outputs['solution/unit_001/solution_outlet']
+    assert np.isnan(outlet[1]).all()
+    times = np.linspace(0, 100, 101)
+    for member in (0, 2):
+        np.testing.assert_allclose(outlet[member], outlet_value(1, 3, times))
+
+
+@pytest.mark.parametrize("variations", [
+    {},
+    {'model/unit_001/col_porosity': []},
+    {'model/unit_001/col_porosity': 0.3},
+    {'model/unit_001/col_porosity': [0.3, 0.4], 'model/unit_001/col_length': [0.1]},
+])
+def test_run_ensemble_invalid_variations(install_path, tmp_path, variations):
+    model = setup_model(install_path, tmp_path / "ensemble.h5", use_dll=True)
+
+    with pytest.raises(ValueError, match="Variation"):
+        Cadet.run_ensemble(model, variations, ['solution/unit_001/solution_outlet'])
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
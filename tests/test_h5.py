@@ -7,7 +7,10 @@ from pathlib import Path
 from addict import Dict
 import h5py
 from cadet import H5
-from cadet.h5 import recursively_save, recursively_load, convert_from_numpy, recursively_load_dict
+from cadet.h5 import (
+    recursively_save, recursively_load, convert_from_numpy, recursively_load_dict, PathFilter,
+    CopyOnWriteDict,
+)
 
 
 @pytest.fixture
@@ -116,6 +119,93 @@ def test_recursively_save_and_load(h5_instance, temp_h5_file):
     assert np.array_equal(loaded_data["group"]["dataset"], np.array([10, 20, 30]))
 
 
+def test_path_filter():
+    path_filter = PathFilter(["/output/solution/unit_00[13]/solution_outlet*", "meta/time_sim"])
+
+    assert path_filter.matches("output/solution/unit_001/solution_outlet")
+    assert path_filter.matches("output/solution/unit_003/solution_outlet_comp_000")
+    assert not path_filter.matches("output/solution/unit_002/solution_outlet")
+    assert not path_filter.matches("output/solution/unit_001/solution_inlet")
+    assert path_filter.matches("meta/time_sim")
+    assert not path_filter.matches("meta/cadet_version")
+
+    assert path_filter.may_contain("output/solution")
+    assert not path_filter.may_contain("output/sensitivity")
+
+    assert path_filter.may_match_stem("output/solution/unit_001/solution_outlet")
+    assert not path_filter.may_match_stem("output/solution/unit_001/solution_bulk")
+
+    group_filter = PathFilter(["output/solution/unit_001"])
+    assert group_filter.matches("output/solution/unit_001/solution_bulk")
+    assert group_filter.may_match_stem("output/solution/unit_001/solution_bulk")
+    assert not group_filter.may_match_stem("output/solution/unit_002/solution_bulk")
+
+    exact_filter = PathFilter(["output/solution/unit_001/solution_outlet_comp_001"])
+    assert exact_filter.may_match_stem("output/solution/unit_001/solution_outlet")
+    assert not exact_filter.matches("output/solution/unit_001/solution_outlet_comp_000")
+
+
+def test_load_from_file_patterns(temp_h5_file):
+    instance = H5({
+        "output": {
+            "solution": {
+                "unit_000": {"solution_outlet": np.ones(3), "solution_bulk": np.ones(4)},
+                "unit_001": {"solution_outlet": np.zeros(3)},
+            },
+        },
+        "meta": {"time_sim": 1.0, "cadet_version": "5.0.0"},
+    })
+    instance.filename = temp_h5_file
+    instance.save()
+
+    new_instance = H5()
+    new_instance.filename = temp_h5_file
+    new_instance.load_from_file(
+        patterns=["output/solution/unit_*/solution_outlet", "/meta/time_sim"]
+    )
+
+    assert new_instance.root.meta.keys() == {"time_sim"}
+    assert new_instance.root.output.solution.keys() == {"unit_000", "unit_001"}
+    assert new_instance.root.output.solution.unit_000.keys() == {"solution_outlet"}
+    assert np.array_equal(new_instance.root.output.solution.unit_001.solution_outlet, np.zeros(3))
+
+    with pytest.raises(ValueError):
+        new_instance.load_from_file(paths=["/meta"], patterns=["meta"])
+
+
+def test_clone(h5_instance, temp_h5_file):
+    clone = h5_instance.clone()
+    original = h5_instance.root
+
+    assert isinstance(clone.root, CopyOnWriteDict)
+    assert clone.root.keys() == original.keys()
+    assert np.shares_memory(clone.root.keyArray, original.keyArray)
+    with pytest.raises(ValueError):
+        clone.root.keyArray[0] = 0
+
+    clone.root.keyArray = np.zeros(3)
+    clone.root.keyDict.nestedKeyFloat = 1.0
+    clone.root.keyDict.nestedKeyList.append(5)
+    clone.root.keyDict.newKey = "new"
+    clone.root.newDict.nestedKey = 1
+    del clone.root.keyString
+
+    np.testing.assert_array_equal(original.keyArray, [1, 2, 3])
+    assert original['keyDict']['nestedKeyFloat'] == 12.345
+    assert original['keyDict']['nestedKeyList'] == [1, 2, 3, 4]
+    assert 'newKey' not in original['keyDict']
+    assert 'newDict' not in original
+    assert original['keyString'] == "value1"
+
+    assert clone.root.pop('keyDict')['nestedKeyFloat'] == 1.0
+    assert 'keyDict' in original
+
+    clone.filename = temp_h5_file
+    clone.save()
+    clone.load_from_file()
+    assert clone.root.newDict.nestedKey == 1
+
+
 def test_transform_methods():
     instance = H5()
     data = np.array([1, 2, 3])
@@ -0,0 +1,72 @@
+import pickle
+
+import h5py
+import numpy as np
+import pytest
+
+from cadet import H5
+from cadet.labeled_array import LabeledArray
+
+
+@pytest.fixture
+def outlet():
+    return LabeledArray(np.arange(24.0).reshape(4, 2, 3), ['nTime', 'nPort', 'nComp'])
+
+
+def test_selection_views(outlet):
+    comp = outlet.comp(1)
+    assert comp.dims == ('nTime', 'nPort')
+    assert np.shares_memory(comp, outlet)
+    np.testing.assert_array_equal(comp, np.asarray(outlet)[..., 1])
+
+    port = outlet.port(0).comp(2)
+    assert port.dims == ('nTime', )
+    np.testing.assert_array_equal(port, np.asarray(outlet)[:, 0, 2])
+
+    window = outlet.sel(nTime=slice(1, 3), nComp=0)
+    assert window.dims == ('nTime', 'nPort')
+    assert window.shape == (2, 2)
+
+    with pytest.raises(KeyError):
+        outlet.partype(0)
+    with pytest.raises(ValueError):
+        LabeledArray(np.zeros(3), ['nTime', 'nComp'])
+
+
+def test_operations_keep_or_drop_dims(outlet):
+    assert (outlet * 2).dims == outlet.dims
+    assert outlet.copy().dims == outlet.dims
+    assert outlet.sum(axis=0).dims is None
+
+    restored = pickle.loads(pickle.dumps(outlet))
+    assert restored.dims == outlet.dims
+    np.testing.assert_array_equal(restored, outlet)
+
+
+def test_save_and_load(outlet, tmp_path):
+    file = H5()
+    file.filename = str(tmp_path / "labeled.h5")
+    file.root.output.solution_outlet = outlet
+    file.root.output.solution_inlet = np.zeros(3)
+    file.save()
+
+    file.root = None
+    file.load_from_file()
+
+    loaded = file.root.output.solution_outlet
+    assert isinstance(loaded, LabeledArray)
+    assert loaded.dims == outlet.dims
+    np.testing.assert_array_equal(loaded, outlet)
+    assert not isinstance(file.root.output.solution_inlet, LabeledArray)
+
+    file.load_from_file(patterns=['output/solution_outlet'])
+    assert file.root.output.solution_outlet.dims == outlet.dims
+
+    # Only groups containing labeled arrays are marked
+    with h5py.File(file.filename, 'r') as h5file:
+        assert 'labeled' in h5file['output'].attrs
+        assert 'labeled' not in h5file.attrs
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
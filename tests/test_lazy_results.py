@@ -0,0 +1,71 @@
+import copy
+import pickle
+
+import pytest
+
+from cadet.cadet_dll import LazyResultGroup
+
+
+@pytest.fixture
+def lazy_group():
+    calls = []
+
+    def load_outlet():
+        calls.append('solution_outlet')
+        return {'solution_outlet_comp_000': 1.0, 'solution_outlet_comp_001': 2.0}
+
+    def load_state():
+        calls.append('last_state')
+        return {'last_state_y': 3.0, 'last_state_ydot': 4.0}
+
+    group = LazyResultGroup()
+    group.add_loader('solution_outlet', load_outlet)
+    group.add_loader(('last_state_y', 'last_state_ydot'), load_state)
+    return group, calls
+
+
+def test_loads_on_first_access(lazy_group):
+    group, calls = lazy_group
+
+    assert group.solution_outlet_comp_001 == 2.0
+    assert group['solution_outlet_comp_000'] == 1.0
+    assert calls == ['solution_outlet']
+    assert group.pending
+
+    assert 'last_state_ydot' in group
+    assert calls == ['solution_outlet', 'last_state']
+    assert not group.pending
+
+
+def test_unknown_keys(lazy_group):
+    group, calls = lazy_group
+
+    assert 'solution_inlet' not in group
+    assert group.get('solution_bulk') is None
+    assert calls == []
+
+
+def test_iteration_loads_all(lazy_group):
+    group, calls = lazy_group
+
+    assert len(group) == 4
+    assert set(group.keys()) == {
+        'solution_outlet_comp_000', 'solution_outlet_comp_001',
+        'last_state_y', 'last_state_ydot',
+    }
+    assert sorted(calls) == ['last_state', 'solution_outlet']
+
+
+@pytest.mark.parametrize(
+    "clone", [copy.copy, copy.deepcopy, lambda group: pickle.loads(pickle.dumps(group))]
+)
+def test_copy_loads_all(lazy_group, clone):
+    group, _ = lazy_group
+
+    clone = clone(group)
+    assert clone.to_dict() == group.to_dict()
+    assert clone.last_state_y == 3.0
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
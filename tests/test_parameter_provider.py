@@ -0,0 +1,277 @@
+import ctypes
+
+import numpy as np
+import pytest
+from addict import Dict
+
+from cadet import H5
+from cadet.cadet_dll_parameterprovider import (
+    CompiledInput, CompiledParameterProvider, H5ParameterProvider, PARAMETERPROVIDER,
+    ParameterTrace,
+)
+
+
+class CadetFile(H5):
+    """HDF5 file with the key transformation of CADET files."""
+
+    def transform(self, x):
+        return str.upper(x)
+
+    def inverse_transform(self, x):
+        return str.lower(x)
+
+
+class FakeSimulation:
+    def __init__(self, input):
+        self.root = Dict()
+        self.root.input = input
+
+
+@pytest.fixture
+def simulation():
+    input = Dict()
+    input.model.nunits = 2
+    input.model.unit_000.unit_type = "INLET"
+    input.model.unit_000.sec_000.const_coeff = [1.0, 2.0]
+    input.model.unit_001.col_length = 0.014
+    input.model.unit_001.init_c = np.array([[0.5, 1.5], [2.5, 3.5]])
+    input.model.connections.switch_000.connections = np.arange(7.0)
+    input.solver.sections.section_continuity = [0]
+    input.solver.sections.section_times = [0.0, 10.0, 20.0]
+    input.solver.user_solution_times = np.linspace(0, 20, 5)
+    input['return'].split_components_data = False
+    input['return'].unit_001.write_solution_outlet = True
+    input.solver.names = ["A", "B"]
+    return FakeSimulation(input)
+
+
+def get_double(pp, name):
+    value = ctypes.c_double()
+    assert pp.getDouble(pp.userData, name, ctypes.byref(value)) == 0
+    return value.value
+
+
+def get_double_array(pp, name):
+    n_elem = ctypes.c_int()
+    pointer = ctypes.POINTER(ctypes.c_double)()
+    assert pp.getDoubleArray(pp.userData, name, ctypes.byref(n_elem), ctypes.byref(pointer)) == 0
+    return np.ctypeslib.as_array(pointer, (n_elem.value, )).copy()
+
+
+def test_compiled_input_scopes(simulation):
+    compiled = CompiledInput(simulation.root.input)
+
+    assert b'model/unit_000/sec_000' in compiled.scopes
+    assert b'model' in compiled.current()
+    assert compiled.get(b'model') is None
+
+    assert compiled.push_scope(b'model')
+    assert b'NUNITS' in compiled.current()
+    assert not compiled.push_scope(b'NUNITS')
+    assert compiled.push_scope(b'unit_000')
+    assert compiled.get(b'UNIT_TYPE').strings == [b'INLET']
+    compiled.pop_scope()
+    compiled.pop_scope()
+    compiled.pop_scope()
+    assert b'model' in compiled.current()
+
+
+def test_compiled_matches_dict_provider(simulation):
+    compiled = CompiledParameterProvider(simulation)
+    reference = PARAMETERPROVIDER(simulation)
+
+    for pp in (compiled, reference):
+        assert pp.pushScope(pp.userData, b'model') == 0
+    assert get_double(compiled, b'NUNITS') == get_double(reference, b'NUNITS')
+
+    for pp in (compiled, reference):
+        assert pp.pushScope(pp.userData, b'unit_001') == 0
+    np.testing.assert_array_equal(
+        get_double_array(compiled, b'INIT_C'), get_double_array(reference, b'INIT_C')
+    )
+    for name in (b'COL_LENGTH', b'INIT_C'):
+        assert compiled.numElements(compiled.userData, name) \
+            == reference.numElements(reference.userData, name)
+
+        compiled_is_array = ctypes.c_uint8()
+        reference_is_array = ctypes.c_uint8()
+        compiled.isArray(compiled.userData, name, ctypes.byref(compiled_is_array))
+        reference.isArray(reference.userData, name, ctypes.byref(reference_is_array))
+        assert compiled_is_array.value == reference_is_array.value
+
+    for name in (b'COL_LENGTH', b'MISSING', b'unit_000'):
+        assert compiled.exists(compiled.userData, name) \
+            == reference.exists(reference.userData, name)
+
+    value = ctypes.c_double()
+    assert compiled.getDoubleArrayItem(compiled.userData, b'INIT_C', 3, ctypes.byref(value)) == 0
+    assert value.value == 3.5
+    assert compiled.getDoubleArrayItem(compiled.userData, b'COL_LENGTH', 2, ctypes.byref(value)) == 0
+    assert value.value == 0.014
+    assert compiled.getDoubleArrayItem(compiled.userData, b'INIT_C', 4, ctypes.byref(value)) == -1
+    assert compiled.getDouble(compiled.userData, b'MISSING', ctypes.byref(value)) == -1
+
+
+def test_compiled_strings_and_ints(simulation):
+    pp = CompiledParameterProvider(simulation)
+
+    assert pp.pushScope(pp.userData, b'model') == 0
+    assert pp.pushScope(pp.userData, b'unit_000') == 0
+    string = ctypes.c_char_p()
+    assert pp.getString(pp.userData, b'UNIT_TYPE', ctypes.byref(string)) == 0
+    assert string.value == b'INLET'
+    assert pp.getDouble(pp.userData, b'UNIT_TYPE', ctypes.byref(ctypes.c_double())) == -1
+    pp.popScope(pp.userData)
+    pp.popScope(pp.userData)
+
+    assert pp.pushScope(pp.userData, b'solver') == 0
+    assert pp.getStringArrayItem(pp.userData, b'NAMES', 1, ctypes.byref(string)) == 0
+    assert string.value == b'B'
+
+    assert pp.pushScope(pp.userData, b'sections') == 0
+    n_elem = ctypes.c_int()
+    pointer = ctypes.POINTER(ctypes.c_int)()
+    assert pp.getIntArray(pp.userData, b'SECTION_TIMES', ctypes.byref(n_elem), ctypes.byref(pointer)) == 0
+    np.testing.assert_array_equal(np.ctypeslib.as_array(pointer, (n_elem.value, )), [0, 10, 20])
+
+    value = ctypes.c_int()
+    assert pp.getInt(pp.userData, b'SECTION_CONTINUITY', ctypes.byref(value)) == 0
+    assert value.value == 0
+    pp.popScope(pp.userData)
+    pp.popScope(pp.userData)
+
+    assert pp.pushScope(pp.userData, b'return') == 0
+    flag = ctypes.c_uint8()
+    assert pp.getBool(pp.userData, b'SPLIT_COMPONENTS_DATA', ctypes.byref(flag)) == 0
+    assert flag.value == 0
+    assert pp.pushScope(pp.userData, b'unit_001') == 0
+    assert pp.getBool(pp.userData, b'WRITE_SOLUTION_OUTLET', ctypes.byref(flag)) == 0
+    assert flag.value == 1
+
+
+@pytest.mark.parametrize("provider", [CompiledParameterProvider, PARAMETERPROVIDER])
+def test_bulk_arrays(simulation, provider):
+    simulation.root.input.solver.flags = [True, False, True]
+    pp = provider(simulation)
+    assert pp.pushScope(pp.userData, b'solver') == 0
+
+    n_elem = ctypes.c_int()
+    bools = ctypes.POINTER(ctypes.c_uint8)()
+    assert pp.getBoolArray(pp.userData, b'FLAGS', ctypes.byref(n_elem), ctypes.byref(bools)) == 0
+    assert bools[:n_elem.value] == [1, 0, 1]
+
+    strings = ctypes.POINTER(ctypes.c_char_p)()
+    assert pp.getStringArray(pp.userData, b'NAMES', ctypes.byref(n_elem), ctypes.byref(strings)) == 0
+    assert strings[:n_elem.value] == [b'A', b'B']
+    assert pp.getStringArray(pp.userData, b'MISSING', ctypes.byref(n_elem), ctypes.byref(strings)) == -1
+
+    assert pp.pushScope(pp.userData, b'sections') == 0
+    ints = ctypes.POINTER(ctypes.c_int)()
+    assert pp.getIntArray(pp.userData, b'SECTION_CONTINUITY', ctypes.byref(n_elem), ctypes.byref(ints)) == 0
+    assert ints[:n_elem.value] == [0]
+    assert pp.getIntArray(pp.userData, b'SECTION_TIMES', ctypes.byref(n_elem), ctypes.byref(ints)) == 0
+    assert ints[:n_elem.value] == [0, 10, 20]
+
+
+def test_h5_matches_compiled_provider(simulation, tmp_path):
+    file = CadetFile()
+    file.filename = str(tmp_path / "input.h5")
+    file.root.input = simulation.root.input
+    file.save()
+
+    h5_provider = H5ParameterProvider(file)
+    compiled = CompiledParameterProvider(simulation)
+
+    for pp in (h5_provider, compiled):
+        assert pp.pushScope(pp.userData, b'model') == 0
+        assert pp.pushScope(pp.userData, b'MISSING') == -1
+    assert get_double(h5_provider, b'NUNITS') == get_double(compiled, b'NUNITS')
+    for name in (b'NUNITS', b'unit_000', b'MISSING'):
+        assert h5_provider.exists(h5_provider.userData, name) \
+            == compiled.exists(compiled.userData, name)
+
+    for pp in (h5_provider, compiled):
+        assert pp.pushScope(pp.userData, b'unit_001') == 0
+    np.testing.assert_array_equal(
+        get_double_array(h5_provider, b'INIT_C'), get_double_array(compiled, b'INIT_C')
+    )
+    h5_provider.popScope(h5_provider.userData)
+
+    assert h5_provider.pushScope(h5_provider.userData, b'unit_000') == 0
+    string = ctypes.c_char_p()
+    assert h5_provider.getString(h5_provider.userData, b'UNIT_TYPE', ctypes.byref(string)) == 0
+    assert string.value == b'INLET'
+
+    h5_provider.close()
+    assert not h5_provider._h5file
+
+
+def test_compiled_input_patch(simulation):
+    compiled = CompiledInput(simulation.root.input)
+    init_c = compiled.scopes[b'model/unit_001'][b'INIT_C']
+    pointer = init_c.double_pointer
+    assert init_c.int_pointer is not None
+
+    compiled.patch('model/unit_001/init_c', np.array([[1.0, 2.0], [3.0, 4.0]]))
+    assert compiled.scopes[b'model/unit_001'][b'INIT_C'] is init_c
+    assert pointer[3] == 4.0
+    assert init_c.ints[2] == 3
+
+    compiled.patch('model/unit_001/init_c', [1.0, 2.0])
+    assert compiled.scopes[b'model/unit_001'][b'INIT_C'] is not init_c
+    assert compiled.scopes[b'model/unit_001'][b'INIT_C'].n_elements == 2
+
+    compiled.patch('model/unit_000/unit_type', "OUTLET")
+    assert compiled.scopes[b'model/unit_000'][b'UNIT_TYPE'].strings == [b'OUTLET']
+
+
+def test_compiled_input_detach(simulation):
+    init_c = simulation.root.input.model.unit_001.init_c
+    compiled = CompiledInput(simulation.root.input)
+    compiled.detach('model/unit_001/init_c')
+    compiled.detach('model/unit_001/col_length')
+
+    compiled.patch('model/unit_001/init_c', np.zeros((2, 2)))
+    np.testing.assert_array_equal(init_c, [[0.5, 1.5], [2.5, 3.5]])
+    assert compiled.scopes[b'model/unit_001'][b'INIT_C'].doubles.sum() == 0
+
+
+@pytest.mark.parametrize("provider", [CompiledParameterProvider, PARAMETERPROVIDER])
+def test_parameter_trace(simulation, provider):
+    trace = ParameterTrace()
+    pp = provider(simulation, trace)
+
+    assert pp.pushScope(pp.userData, b'model') == 0
+    assert get_double(pp, b'NUNITS') == 2
+    assert pp.exists(pp.userData, b'MISSING') == 0
+    assert pp.pushScope(pp.userData, b'unit_001') == 0
+    get_double_array(pp, b'INIT_C')
+    get_double_array(pp, b'INIT_C')
+    pp.popScope(pp.userData)
+    assert pp.pushScope(pp.userData, b'unit_009') == -1
+    pp.popScope(pp.userData)
+
+    assert trace.counts == {
+        'model': 2,
+        'model/NUNITS': 1,
+        'model/MISSING': 1,
+        'model/unit_001': 2,
+        'model/unit_001/INIT_C': 2,
+        'model/unit_009': 1,
+    }
+    assert trace.total_time == sum(time for _, _, time in trace.summary())
+
+    pruned = trace.prune(simulation.root.input)
+    assert pruned.to_dict() == {
+        'model': {
+            'nunits': 2,
+            'unit_001': {'init_c': simulation.root.input.model.unit_001.init_c},
+        }
+    }
+
+    trace.reset()
+    assert trace.counts == {}
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,107 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import h5py
+import numpy as np
+import pytest
+
+from cadet import H5
+from cadet.cadet_dll import LazyResultGroup
+from cadet.result_store import ResultStore
+
+INDEX = ['input/model/unit_001/col_porosity', 'meta/time_sim']
+
+
+def peak(root):
+    return root.output.solution.unit_001.solution_outlet.max()
+
+
+def make_run(porosity):
+    simulation = H5()
+    simulation.root.input.model.unit_001.col_porosity = porosity
+    simulation.root.input.model.unit_001.init_c = [0.0, 1.0]
+    simulation.root.output.solution.unit_001.solution_outlet = np.full((11, 2), porosity)
+    simulation.root.meta.time_sim = 0.5
+    return simulation
+
+
+def add_runs(filename, porosities):
+    store = ResultStore(filename, INDEX, {'peak': peak})
+    return [store.add(make_run(porosity)) for porosity in porosities]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ResultStore(tmp_path / "store.h5", INDEX, {'peak': peak})
+    for porosity in [0.25, 0.3, 0.35, 0.4, 0.45]:
+        store.add(make_run(porosity))
+    return store
+
+
+def test_query(store):
+    assert len(store) == 5
+    assert store.columns == INDEX + ['peak']
+
+    np.testing.assert_array_equal(
+        store.query({'input/model/unit_001/col_porosity': (0.3, 0.35)}), [1, 2]
+    )
+    np.testing.assert_array_equal(store.query({'peak': (0.42, None)}), [4])
+    np.testing.assert_array_equal(
+        store.query({'peak': (None, 0.4), 'meta/time_sim': (0.5, 0.5)}), [0, 1, 2, 3]
+    )
+    np.testing.assert_allclose(
+        store.read_index(['peak'])['peak'], [0.25, 0.3, 0.35, 0.4, 0.45]
+    )
+
+    with pytest.raises(KeyError):
+        store.query({'input/model/unit_001/col_length': (0, 1)})
+
+
+def test_load(store):
+    run = store.load(2)
+    assert run.input.model.unit_001.col_porosity == 0.35
+    np.testing.assert_array_equal(run.output.solution.unit_001.solution_outlet, 0.35)
+
+    run = store.load(2, patterns=['output/solution/unit_001/solution_outlet'])
+    assert 'input' not in run
+    assert run.output.solution.unit_001.solution_outlet.shape == (11, 2)
+
+    run = store.load(3, lazy=True)
+    solution = run.output.solution.unit_001
+    assert isinstance(solution, LazyResultGroup) and solution.pending
+    np.testing.assert_array_equal(solution.solution_outlet, 0.4)
+    assert not solution.pending
+
+    with pytest.raises(KeyError):
+        store.load(5)
+
+
+def test_reopen(store):
+    assert ResultStore(store.filename).columns == store.columns
+    with pytest.raises(ValueError):
+        ResultStore(store.filename, ['input/model/unit_001/col_length'])
+
+
+def test_interrupted_writer(store):
+    with h5py.File(store.filename, 'a') as h5file:
+        h5file['runs/5/input/LEFTOVER'] = 1
+
+    assert store.add(make_run(0.5)) == 5
+    assert 'leftover' not in store.load(5).input
+    assert store.query({'peak': (0.5, 0.5)}).tolist() == [5]
+
+
+def test_concurrent_writers(tmp_path):
+    filename = tmp_path / "store.h5"
+    porosities = np.linspace(0.2, 0.4, 20).reshape(4, 5)
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        run_ids = list(executor.map(add_runs, [filename] * 4, porosities))
+
+    store = ResultStore(filename)
+    assert len(store) == 20
+    assert sorted(np.concatenate(run_ids).tolist()) == list(range(20))
+    for run_id in (0, 7, 19):
+        run = store.load(run_id)
+        assert peak(run) == run.input.model.unit_001.col_porosity
+    np.testing.assert_allclose(
+        np.sort(store.read_index()['peak']), porosities.ravel()
+    )
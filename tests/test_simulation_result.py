@@ -0,0 +1,153 @@
+import ctypes
+
+import numpy as np
+import pytest
+
+from cadet.cadet_dll import CADETAPI_V1_0_0, SimulationResult, _get_call_plan
+from cadet.labeled_array import LabeledArray
+
+
+N_TIME = 5
+N_COMP = 2
+N_CELLS = 3
+
+time = (ctypes.c_double * N_TIME)(*range(N_TIME))
+outlet = (ctypes.c_double * (N_TIME * N_COMP))(*range(N_TIME * N_COMP))
+bulk = (ctypes.c_double * (N_TIME * N_CELLS * N_COMP))(*range(N_TIME * N_CELLS * N_COMP))
+
+
+def _set(pointer, value):
+    pointer[0] = value
+
+
+def _set_array(pointer, array):
+    pointer[0] = ctypes.cast(array, ctypes.POINTER(ctypes.c_double))
+
+
+def get_solution_outlet(drv, unitOpId, time_ptr, data, nTime, nPort, nComp):
+    if unitOpId != 0:
+        return -3
+    _set_array(time_ptr, time)
+    _set_array(data, outlet)
+    _set(nTime, N_TIME)
+    _set(nPort, 1)
+    _set(nComp, N_COMP)
+    return 0
+
+
+def get_solution_bulk(drv, unitOpId, time_ptr, data, nTime, nAxialCells, nRadialCells, nComp, keepAxial):
+    _set_array(time_ptr, time)
+    _set_array(data, bulk)
+    _set(nTime, N_TIME)
+    # Unit 1 has a single cell, whose axis is squeezed out
+    _set(nAxialCells, N_CELLS if unitOpId == 0 else 1)
+    _set(nComp, N_COMP)
+    _set(keepAxial, False)
+    return 0
+
+
+def get_num_unit_op(drv, nUnits):
+    _set(nUnits, 2)
+    return 0
+
+
+N_SENS = 3
+sensitivities = [
+    (ctypes.c_double * (N_TIME * N_COMP))(*(sens + i for i in range(N_TIME * N_COMP)))
+    for sens in range(N_SENS)
+]
+
+
+def get_sensitivity_outlet(drv, unitOpId, sensIdx, time_ptr, data, nTime, nPort, nComp):
+    _set_array(time_ptr, time)
+    _set_array(data, sensitivities[sensIdx])
+    _set(nTime, N_TIME)
+    _set(nPort, 1)
+    _set(nComp, N_COMP)
+    return 0
+
+
+def get_num_sensitivities(drv, nSens):
+    _set(nSens, N_SENS)
+    return 0
+
+
+@pytest.fixture
+def result():
+    api = CADETAPI_V1_0_0()
+    for name, function in [
+            ('getSolutionOutlet', get_solution_outlet),
+            ('getSolutionBulk', get_solution_bulk),
+            ('getNumUnitOp', get_num_unit_op),
+            ('getSensitivityOutlet', get_sensitivity_outlet),
+            ('getNumSensitivities', get_num_sensitivities),
+    ]:
+        field_type = dict(CADETAPI_V1_0_0._fields_)[name]
+        setattr(api, name, field_type(function))
+    return SimulationResult(api, None)
+
+
+def test_call_plan_is_shared(result):
+    plan = _get_call_plan(result._api, 'getSolutionOutlet')
+
+    assert plan is _get_call_plan(CADETAPI_V1_0_0(), 'getSolutionOutlet')
+    assert [key for _, key in plan.inputs] == ['drv', 'unitOpId']
+    assert plan.dims == ('nTime', 'nPort', 'nComp')
+    assert not plan.squeeze_axial
+
+
+def test_getters(result):
+    assert result.nunits() == 2
+
+    t, data, dims = result.solution_outlet(0)
+    np.testing.assert_array_equal(t, np.arange(N_TIME))
+    np.testing.assert_array_equal(
+        data, np.arange(N_TIME * N_COMP).reshape(N_TIME, 1, N_COMP)
+    )
+    assert dims == ['nTime', 'nPort', 'nComp']
+
+    _, data, dims = result.solution_bulk(0)
+    assert data.shape == (N_TIME, N_CELLS, N_COMP)
+    assert dims == ['nTime', 'nAxialCells', 'nComp']
+
+
+def test_squeezed_axis(result):
+    _, data, dims = result.solution_bulk(1)
+
+    assert data.shape == (N_TIME, N_COMP)
+    assert dims == ['nTime', 'nComp']
+    assert LabeledArray(data, dims).dims == ('nTime', 'nComp')
+
+
+def test_slots_are_reused(result):
+    _, first, _ = result.solution_outlet(0)
+    slots = result._slots['getSolutionOutlet']
+    args = list(slots.args)
+
+    assert result.solution_outlet(1) is None
+    _, second, _ = result.solution_outlet(0)
+
+    assert result._slots['getSolutionOutlet'] is slots
+    assert all(a is b for a, b in zip(args[2:], slots.args[2:]))
+    np.testing.assert_array_equal(first, second)
+    assert not np.shares_memory(first, second)
+
+
+def test_stacked_sensitivity(result):
+    t, tensor, dims = result.stacked_sensitivity('sens_outlet', 0)
+
+    np.testing.assert_array_equal(t, np.arange(N_TIME))
+    assert tensor.shape == (N_SENS, N_TIME, 1, N_COMP)
+    assert tensor.flags.c_contiguous and tensor.flags.owndata
+    assert dims == ['nSens', 'nTime', 'nPort', 'nComp']
+    for sens in range(N_SENS):
+        np.testing.assert_array_equal(tensor[sens], result.sens_outlet(0, sens)[1])
+
+
+def test_missing_input(result):
+    with pytest.raises(ValueError):
+        result._load_data('getSolutionOutlet')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+from addict import Dict
+
+from cadet import Cadet
+from cadet.cadet_worker import _pack_results, _unpack_results
+from cadet.h5 import PathFilter
+from tests.test_dll import setup_model, setup_solution_recorder
+
+
+def test_pack_unpack_results():
+    results = Dict()
+    results.output.solution.unit_000.solution_outlet = np.arange(12.0).reshape(4, 3)
+    results.output.solution.unit_000.solution_volume = np.zeros((0,))
+    results.output.last_state_y = np.arange(5, dtype=np.int32)
+    results.meta.cadet_version = "5.0.0"
+    results.meta.time_sim = 1.5
+
+    manifest, shm_name = _pack_results(results)
+    assert shm_name is not None
+
+    unpacked = _unpack_results(manifest, shm_name)
+
+    outlet = unpacked.output.solution.unit_000.solution_outlet
+    np.testing.assert_array_equal(outlet, results.output.solution.unit_000.solution_outlet)
+    assert outlet.flags.owndata
+    assert unpacked.output.solution.unit_000.solution_volume.shape == (0,)
+    assert unpacked.output.last_state_y.dtype == np.int32
+    assert unpacked.meta.cadet_version == "5.0.0"
+    assert unpacked.meta.time_sim == 1.5
+
+
+def test_unpack_selected_results():
+    results = Dict()
+    results.output.solution.unit_000.solution_outlet = np.ones(3)
+    results.output.solution.unit_000.solution_inlet = np.zeros(3)
+    results.meta.time_sim = 1.5
+
+    manifest, shm_name = _pack_results(results)
+    unpacked = _unpack_results(
+        manifest, shm_name, PathFilter(["output/solution/*/solution_outlet"])
+    )
+
+    assert unpacked.keys() == {"output"}
+    assert unpacked.output.solution.unit_000.keys() == {"solution_outlet"}
+
+
+def test_pack_unpack_without_arrays():
+    results = Dict()
+    results.meta.time_sim = 1.5
+
+    manifest, shm_name = _pack_results(results)
+    assert shm_name is None
+
+    unpacked = _unpack_results(manifest, shm_name)
+    assert unpacked.meta.time_sim == 1.5
+
+
+def test_worker_matches_dll():
+    model = setup_model(Cadet.autodetect_cadet(), use_dll=True, file_name="LWE_worker.h5")
+    setup_solution_recorder(model)
+
+    model.run_simulation()
+    reference = model.root.output
+
+    model.root.output = Dict()
+    model.use_worker = True
+    return_information = model.run_simulation()
+
+    assert return_information.return_code == 0
+    np.testing.assert_array_equal(
+        model.root.output.solution.unit_000.solution_outlet,
+        reference.solution.unit_000.solution_outlet,
+    )
+    model.delete_file()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])